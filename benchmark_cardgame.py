@@ -0,0 +1,319 @@
+"""
+benchmark_cardgame
+
+Times the deck, player and Draw3 hot paths and writes the
+results as JSON
+
+for instructions on how to run:
+python benchmark_cardgame.py -h
+"""
+
+
+import json
+import platform
+import statistics
+import sys
+import time
+from argparse import ArgumentParser
+
+from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.cardgame_draw3_large import LargeDraw3Game
+from cardgame.classes.deckmanager import DeckManager
+from cardgame.classes.extendeddeckmanager import ExtendedDeckManager
+from cardgame.classes.player import Player
+
+
+# values of every suit in benchmark decks (13 cards per suit)
+VALUES = [
+    '2', '3', '4', '5', '6', '7', '8', '9', '10',
+    'Jack', 'Queen', 'King', 'Ace',
+]
+
+
+def parse_args(argv=None):
+    """
+    parse_args(argv=None):  returns parsed command line arguments
+    """
+    parser = ArgumentParser(
+        description="Benchmarks deck managers, players and Draw3 games"
+    )
+    parser.add_argument(
+        '--suits',
+        help='comma-delimited suit counts, 13 cards per suit '
+             '(default 4,40,400)',
+        default='4,40,400'
+    )
+    parser.add_argument(
+        '--players',
+        help='comma-delimited player counts for Draw3 games, counts '
+             'over 8 use LargeDraw3Game (default 2,4,8)',
+        default='2,4,8'
+    )
+    parser.add_argument(
+        '--number',
+        help='Calls per timing for repeated operations (default 100)',
+        type=int,
+        default=100
+    )
+    parser.add_argument(
+        '--repeat',
+        help='Timings per benchmark, best and median are kept (default 5)',
+        type=int,
+        default=5
+    )
+    parser.add_argument(
+        '--seed',
+        help='Seed for shuffles and games (default 0)',
+        type=int,
+        default=0
+    )
+    parser.add_argument(
+        '--output',
+        help='JSON file to write results to (default stdout)'
+    )
+    return parser.parse_args(argv)
+
+
+def parse_counts(counts):
+    """
+    parse_counts(counts):  returns list of ints from comma-delimited string
+    """
+    return [int(count) for count in counts.split(',') if count.strip()]
+
+
+def make_suits(count):
+    """
+    make_suits(count):  returns list of count suit names
+    """
+    return [f"Suit{idx}" for idx in range(1, count + 1)]
+
+
+def time_case(setup, run, repeat):
+    """
+    time_case(setup, run, repeat):
+        calls run(setup()) repeat times, only run() is timed,
+        returns list of elapsed seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def result(name, params, ops, timings):
+    """
+    result(name, params, ops, timings):
+        returns JSON-ready result of one benchmark,
+        ops is number of operations in one timing
+    """
+    best = min(timings)
+    return {
+        'name': name,
+        'params': params,
+        'ops': ops,
+        'best_s': best,
+        'median_s': statistics.median(timings),
+        'best_per_op_ns': best / ops * 1e9 if ops else None,
+    }
+
+
+def deck_cases(num_suits, number, seed):
+    """
+    deck_cases(num_suits, number, seed):
+        yields (name, ops, setup, run) for deck manager and
+        player benchmarks on a deck of num_suits * 13 cards
+    """
+    suits = make_suits(num_suits)
+    size = num_suits * len(VALUES)
+
+    def new_deck():
+        return ExtendedDeckManager.from_suits_and_values(
+            suits, VALUES, rng=seed
+        )
+
+    def repeat_call(func):
+        def run(state):
+            for _ in range(number):
+                func(state)
+        return run
+
+    def shuffled():
+        deck_mgr = new_deck()
+        deck_mgr.shuffle()
+        return deck_mgr
+
+    def draw_all(deck_mgr):
+        for _ in range(size):
+            deck_mgr.draw_card()
+
+    def peek_all(deck_mgr):
+        for index in range(1, size + 1):
+            deck_mgr.peek_card(index)
+
+    def player_draw_all(state):
+        player, deck_mgr = state
+        for _ in range(size):
+            player.draw_card(deck_mgr)
+
+    def player_with_hand():
+        player = Player('Player')
+        player.hand = new_deck().deck()
+        return player
+
+    yield (
+        'DeckManager.make_deck', number, lambda: None,
+        repeat_call(lambda _: DeckManager.make_deck(suits, VALUES))
+    )
+    yield (
+        'DeckManager.shuffle', number, new_deck,
+        repeat_call(DeckManager.shuffle)
+    )
+    yield ('DeckManager.sort', 1, shuffled, DeckManager.sort)
+    yield ('DeckManager.draw_card', size, shuffled, draw_all)
+    yield (
+        'DeckManager.deck', number, new_deck,
+        repeat_call(DeckManager.deck)
+    )
+    yield (
+        'ExtendedDeckManager.from_suits_and_values', number, lambda: None,
+        repeat_call(lambda _: new_deck())
+    )
+    yield ('ExtendedDeckManager.peek_card', size, shuffled, peek_all)
+    yield (
+        'Player.draw_card', size,
+        lambda: (Player('Player'), shuffled()), player_draw_all
+    )
+    yield (
+        'Player.hand', number, player_with_hand,
+        repeat_call(lambda player: player.hand)
+    )
+
+
+def game_cases(num_players, number, seed):
+    """
+    game_cases(num_players, number, seed):
+        yields (name, ops, setup, run) for Draw3 benchmarks
+        with num_players players, tables bigger than
+        Draw3Game() allows are played with LargeDraw3Game()
+    """
+    names = [f"Player{idx}" for idx in range(1, num_players + 1)]
+    game_cls = Draw3Game
+    if num_players > Draw3Game().max_players:
+        game_cls = LargeDraw3Game
+    prefix = game_cls.__name__
+
+    def play(game):
+        game.start_game()
+        while game.next_turn() is not None:
+            pass
+        return game
+
+    def new_game():
+        game = game_cls(rng=seed)
+        game.setup_game(player_names=names)
+        return game
+
+    def play_games(_):
+        for _ in range(number):
+            play(new_game())
+
+    def play_headless(_):
+        for _ in range(number):
+            game = new_game()
+            game.start_game()
+            game.play_to_completion()
+
+    def rankings(game):
+        for _ in range(number):
+            game.player_rankings()
+
+    yield (f'{prefix}.game', number, lambda: None, play_games)
+    yield (
+        f'{prefix}.play_to_completion', number,
+        lambda: None, play_headless
+    )
+    yield (
+        f'{prefix}.player_rankings', number,
+        lambda: play(new_game()), rankings
+    )
+
+
+def run_benchmarks(suit_counts, player_counts, number=100, repeat=5,
+                   seed=0):
+    """
+    run_benchmarks(suit_counts, player_counts, number=100, repeat=5,
+                   seed=0):
+        runs every benchmark and returns JSON-ready dict
+    """
+    results = []
+    for num_suits in suit_counts:
+        params = {'deck_size': num_suits * len(VALUES)}
+        for name, ops, setup, run in deck_cases(num_suits, number, seed):
+            timings = time_case(setup, run, repeat)
+            results.append(result(name, params, ops, timings))
+
+    for num_players in player_counts:
+        params = {'players': num_players}
+        for name, ops, setup, run in game_cases(num_players, number, seed):
+            timings = time_case(setup, run, repeat)
+            results.append(result(name, params, ops, timings))
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'created': time.time(),
+        'number': number,
+        'repeat': repeat,
+        'seed': seed,
+        'results': results,
+    }
+
+
+def main(argv=None):
+    """
+    main(argv=None):  runs benchmarks from the command line
+    """
+    args = parse_args(argv)
+
+    if args.number < 1 or args.repeat < 1:
+        print("Please use a number and repeat of at least 1.")
+        sys.exit(1)
+
+    try:
+        suit_counts = parse_counts(args.suits)
+        player_counts = parse_counts(args.players)
+    except ValueError:
+        print("Please use comma-delimited numbers for suits and players.")
+        sys.exit(1)
+
+    min_players = Draw3Game().min_players
+    if any(count < min_players for count in player_counts):
+        print(f"Please use at least {min_players} players.")
+        sys.exit(1)
+    if any(count < 1 for count in suit_counts):
+        print("Please use at least 1 suit.")
+        sys.exit(1)
+
+    report = run_benchmarks(
+        suit_counts,
+        player_counts,
+        args.number,
+        args.repeat,
+        args.seed
+    )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
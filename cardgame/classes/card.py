@@ -1,31 +1,100 @@
 """
 card.py
 
-uses total_ordering and implements __eq__() and __lt__()
-    so that one Card() class can be compared against another
+Card() instances are interned flyweights:  creating a Card() with the
+    same suit, value, suit_value and card_value returns the same object
+    while that object is still in use, cards nothing refers to any
+    more are dropped from the intern table
+
+each Card() carries a precomputed integer ordinal so comparisons,
+    sorting and hashing are native int operations
 """
-from functools import total_ordering
+from weakref import WeakValueDictionary
+
+
+def _integral(value):
+    """
+    _integral(value):  returns True if value is an int or a float
+        with no fractional part
+    """
+    if isinstance(value, int):
+        return True
+
+    return isinstance(value, float) and value.is_integer()
 
 
-@total_ordering
 class Card:
     """
-    Card class:  simple class to access cards by properties
+    Card class:  simple immutable class to access cards by properties
 
     Notes:
     suit_rank:  int value of suit ranking (higher numbers rank higher),
         setting suit_rank equal to a different suit allows for
         different suits with same value to be equal in comparison
+    ordinal:  int that orders cards by suit_value then card_value,
+        equal cards have equal ordinals (and hashes), cards with
+        non-integral values get a (suit_value, card_value) tuple
     """
-    def __init__(self, suit, value, suit_value, card_value):
-        self._suit = suit
-        self._value = value
-        self._suit_value = suit_value
-        self._card_value = card_value
+    __slots__ = (
+        '_suit',
+        '_value',
+        '_suit_value',
+        '_card_value',
+        '_ordinal',
+        '__weakref__',
+    )
+
+    # one live instance per (class, suit, value, suit_value, card_value),
+    # weak so the table does not outgrow the cards in use
+    _interned = WeakValueDictionary()
+
+    def __new__(cls, suit, value, suit_value, card_value):
+        key = (cls, suit, value, suit_value, card_value)
+        card = Card._interned.get(key)
+        if card is None:
+            card = super().__new__(cls)
+            card._suit = suit
+            card._value = value
+            card._suit_value = suit_value
+            card._card_value = card_value
+            card._ordinal = Card.make_ordinal(suit_value, card_value)
+            Card._interned[key] = card
+
+        return card
+
+    @staticmethod
+    def make_ordinal(suit_value, card_value):
+        """
+        make_ordinal(suit_value, card_value):
+            returns int that orders by suit_value then card_value
+
+        NOTE:
+        card_value is expected to fit in 32 bits
+        non-integral values (1.5) get a (suit_value, card_value)
+            tuple, Card() comparisons fall back to the values when
+            an int and a tuple ordinal meet
+        """
+        if _integral(suit_value) and _integral(card_value):
+            return (int(suit_value) << 32) + int(card_value)
+
+        return (suit_value, card_value)
+
+    def _values(self):
+        return (self._suit_value, self._card_value)
 
     def __copy__(self):
-        # implement copy method to create copy
-        return Card(self.suit, self.value, self.suit_value, self.card_value)
+        # cards are immutable flyweights, a copy is the card itself
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        # unpickling goes through __new__() so cards stay interned
+        return (
+            self.__class__,
+            (self._suit, self._value, self._suit_value, self._card_value)
+        )
 
     def __str__(self):
         # implement for debugging or printing
@@ -41,18 +110,50 @@ class Card:
     def __repr__(self):
         return str(self)
 
+    def __hash__(self):
+        return hash(self._ordinal)
+
     def __eq__(self, cmp):
-        return (
-            self.suit_value == cmp.suit_value
-        ) and (
-            self.card_value == cmp.card_value
-        )
+        if not isinstance(cmp, Card):
+            return NotImplemented
+        return self._ordinal == cmp._ordinal
+
+    def __ne__(self, cmp):
+        if not isinstance(cmp, Card):
+            return NotImplemented
+        return self._ordinal != cmp._ordinal
 
     def __lt__(self, cmp):
-        if self.suit_value == cmp.suit_value:
-            return self.card_value < cmp.card_value
+        if not isinstance(cmp, Card):
+            return NotImplemented
+        try:
+            return self._ordinal < cmp._ordinal
+        except TypeError:
+            return self._values() < cmp._values()
+
+    def __le__(self, cmp):
+        if not isinstance(cmp, Card):
+            return NotImplemented
+        try:
+            return self._ordinal <= cmp._ordinal
+        except TypeError:
+            return self._values() <= cmp._values()
 
-        return self.suit_value < cmp.suit_value
+    def __gt__(self, cmp):
+        if not isinstance(cmp, Card):
+            return NotImplemented
+        try:
+            return self._ordinal > cmp._ordinal
+        except TypeError:
+            return self._values() > cmp._values()
+
+    def __ge__(self, cmp):
+        if not isinstance(cmp, Card):
+            return NotImplemented
+        try:
+            return self._ordinal >= cmp._ordinal
+        except TypeError:
+            return self._values() >= cmp._values()
 
     @property
     def suit(self):
@@ -81,3 +182,11 @@ class Card:
         card_value:  return numeric value of card
         """
         return self._card_value
+
+    @property
+    def ordinal(self):
+        """
+        ordinal:  returns int (see make_ordinal()) used for comparing
+            and sorting cards
+        """
+        return self._ordinal
@@ -1,9 +1,9 @@
 """
 cardgame.py:  base class for card games
 """
-import random
-
+from .events import GameEvents
 from .player import Player
+from .rng import make_rng
 
 
 class NeedMorePlayers(Exception):
@@ -27,6 +27,13 @@ class InvalidPlayerName(Exception):
     """
 
 
+class DuplicatePlayerName(Exception):
+    """
+    DuplicatePlayerName:  exception thrown when adding a player
+        with a name already in the game (case-insensitive)
+    """
+
+
 class DeckNotInitialized(Exception):
     """
     DeckNotInitialized:  exception thrown when starting a game
@@ -45,8 +52,18 @@ class CardGame:
         * rules about setting up initial hands
         * rules about turn order
         * rules about winning a round/hand/game
+
+    Constructors:
+        CardGame(rng=None):  rng can be a random.Random(),
+            numpy Generator, NumpyRNG() or a seed
+            (see rng.make_rng())
+
+    Events:
+        subscribe(event, callback) with an event name from
+            events.EVENTS, callback(game, *args) is called when
+            the game emits the event
     """
-    def __init__(self):
+    def __init__(self, rng=None):
         self._deck_mgr = None
         self._min_players = 0
         self._max_players = 0
@@ -54,7 +71,12 @@ class CardGame:
         self._turn_order = []
         self._random_turn_order = True
 
-        random.seed()
+        # each game shuffles turn order with its own rng
+        self._rng = make_rng(rng)
+
+        # GameEvents() once something subscribes, None keeps
+        # emitting free for games nobody listens to
+        self._events = None
 
     def deck(self):
         """
@@ -66,6 +88,52 @@ class CardGame:
         # returns in natural order
         return self._deck_mgr.deck()
 
+    def deck_view(self):
+        """
+        deck_view():  returns read-only view of deck in natural order
+        """
+        if self._deck_mgr is None:
+            raise DeckNotInitialized
+
+        return self._deck_mgr.deck_view()
+
+    @property
+    def rng(self):
+        """
+        rng:  returns rng used by this game
+        """
+        return self._rng
+
+    def subscribe(self, event, callback):
+        """
+        subscribe(event, callback):  calls callback(game, *args)
+            every time the game emits event
+        """
+        if self._events is None:
+            self._events = GameEvents()
+
+        self._events.subscribe(event, callback)
+
+    def unsubscribe(self, event, callback):
+        """
+        unsubscribe(event, callback):  stops calling callback on event
+        """
+        if self._events is None:
+            return
+
+        self._events.unsubscribe(event, callback)
+        if not self._events:
+            self._events = None
+
+    def subscribers(self, event):
+        """
+        subscribers(event):  returns tuple of callbacks for event
+        """
+        if self._events is None:
+            return ()
+
+        return self._events.subscribers(event)
+
     @property
     def min_players(self):
         """
@@ -155,6 +223,32 @@ class CardGame:
         # start the game
         raise NotImplementedError
 
+    def reset(self):
+        """
+        reset():  gets the game ready to be played again by the same
+            players, cards go back into the deck (deck manager
+            reset()), hands are emptied and turn order goes back
+            to the order players were added
+
+        NOTE:
+        player and deck manager objects are kept,
+            override to reset game specific state
+        """
+        if self._deck_mgr is None:
+            raise DeckNotInitialized
+
+        self._deck_mgr.reset()
+        for player in self._players:
+            player.reset()
+        self._turn_order[:] = range(len(self._players))
+
+    def rematch(self):
+        """
+        rematch():  reset() and start_game()
+        """
+        self.reset()
+        self.start_game()
+
     def new_round(self, round_num):
         """
         new_round(round_num):  called when new round starts
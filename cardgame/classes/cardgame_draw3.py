@@ -3,13 +3,23 @@ cardgame_draw3.py:
 
 base class used to play Draw3Game()
 """
-import random
-
+from heapq import nlargest
 from .cardgame import (
     CardGame,
+    MaxPlayersHit,
     NeedMorePlayers
 )
-from .deckmanager import DeckManager
+from .deckmanager import DeckManager, EmptyDeckError
+from .events import (
+    DRAW,
+    GAME_OVER,
+    GAME_START,
+    RANKINGS,
+    ROUND_START,
+    SHUFFLE,
+    TURN
+)
+from . import draw3_batch
 
 
 class Draw3Game(CardGame):
@@ -18,13 +28,19 @@ class Draw3Game(CardGame):
         initial hand each player takes turns drawing a card up to 3
         points per card are suit_value * card_value
         winner has highest number of points
+
+    Events (see CardGame.subscribe()):
+        game_start, shuffle, round_start, draw, turn and
+        game_over from start_game() and next_turn(),
+        rankings from player_rankings()
     """
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng=None):
+        super().__init__(rng)
 
         self._min_players = 2
         self._max_players = 8
         self._auto_shuffle = True
+        self._lazy_shuffle = False
 
         # this game only has 3 rounds
         self._num_rounds = 3
@@ -63,6 +79,18 @@ class Draw3Game(CardGame):
     def auto_shuffle(self, auto_shuffle):
         self._auto_shuffle = auto_shuffle
 
+    @property
+    def lazy_shuffle(self):
+        """
+        lazy_shuffle:  whether start game shuffles the deck on demand
+            (deck manager lazy_shuffle()) instead of up front
+        """
+        return self._lazy_shuffle
+
+    @lazy_shuffle.setter
+    def lazy_shuffle(self, lazy_shuffle):
+        self._lazy_shuffle = lazy_shuffle
+
     # pylint:  disable-msg=W0221
     def setup_game(self, deck_mgr=None, player_names=None):
         """
@@ -73,12 +101,14 @@ class Draw3Game(CardGame):
                 players can be added via add_player()
         )
 
+        Note:  the default DeckManager() shares this game's rng
+
         Note:  self.add_player(player_name) will raise MaxPlayersHit
             exception if you try to add more than max players
         """
         if deck_mgr is None:
             # default to standard 52-card deck
-            deck_mgr = DeckManager()
+            deck_mgr = DeckManager(self._rng)
 
         self._deck_mgr = deck_mgr
 
@@ -101,14 +131,37 @@ class Draw3Game(CardGame):
         # reset turns and rounds and players
         self._turn_num = 0
         self._round_num = 0
-        for player in self._players:
-            player.score = 0
+        self.update_scores()
+
+        if self._events is not None:
+            self._events.emit(GAME_START, self)
 
         if self.random_turn_order:
-            random.shuffle(self._turn_order)
+            self._rng.shuffle(self._turn_order)
 
         if self.auto_shuffle:
-            self._deck_mgr.shuffle()
+            if self.lazy_shuffle:
+                # only the cards that are drawn get shuffled
+                self._deck_mgr.lazy_shuffle()
+            else:
+                self._deck_mgr.shuffle()
+
+            if self._events is not None:
+                self._events.emit(SHUFFLE, self, self._deck_mgr)
+
+    def reset(self):
+        """
+        reset()
+            puts cards back into the deck, empties hands and
+                sets turn and round back to the start
+
+        NOTE:
+        a reset game plays the same as a new Draw3Game() with
+            the same rng state and players
+        """
+        super().reset()
+        self._turn_num = 0
+        self._round_num = 0
 
     def is_game_over(self):
         """
@@ -133,24 +186,128 @@ class Draw3Game(CardGame):
         next_turn()
             processes a turn for the current player
             in the case of Draw3, it is just drawing a card
-                from the deck
+                from the deck and adding its points to the
+                player's score
 
-            returns None on game over
+            returns the player who drew, None on game over
+            afterwards get_current_player() is the next player
         """
-        self._turn_num = (self._turn_num + 1) % len(self._players)
-        # current player draws a card
-        if self._turn_num == 1:
-            self._round_num += 1
-            if self.is_game_over():
-                # just in case someone calls
-                # next_turn() after the game is over
-                return None
+        if self.is_game_over():
+            # just in case someone calls
+            # next_turn() after the game is over
+            return None
+
+        events = self._events
+        if self._turn_num == 0:
             self.new_round(self.round_num)
+            if events is not None:
+                events.emit(ROUND_START, self, self.round_num)
+
+        # current player draws a card
         player = self.get_current_player()
-        player.draw_card(self._deck_mgr)
+        card = player.draw_card(self._deck_mgr)
+        player.score += self.card_points(card)
+        if events is not None:
+            events.emit(DRAW, self, player, card)
+
+        self._pass_turn()
+
+        if events is not None:
+            events.emit(TURN, self, player)
+            if self.is_game_over():
+                events.emit(GAME_OVER, self)
 
         return player
 
+    def _pass_turn(self):
+        """
+        _pass_turn():  passes the turn to the next player in turn
+            order after the current player drew
+
+        NOTE:
+        override to choose the next player differently
+        """
+        self._turn_num = (self._turn_num + 1) % len(self._players)
+        if self._turn_num == 0:
+            self._round_num += 1
+
+    def _play_turns(self):
+        """
+        _play_turns():  calls next_turn() until the game is over,
+            returns number of turns played
+        """
+        turns = 0
+        while self.next_turn() is not None:
+            turns += 1
+        return turns
+
+    def deal_all(self):
+        """
+        deal_all()
+            plays every remaining turn at once, cards are drawn
+                with one deck manager draw_cards() call and handed
+                out in turn order, hands and scores end up the same
+                as calling next_turn() until the game is over
+
+            returns number of cards dealt
+
+        NOTE:
+        with event subscribers every turn is played by next_turn()
+            so every event is emitted
+        new_round() is called for every round before any card
+            is dealt
+        raises EmptyDeckError, without dealing, if the deck is short
+        """
+        if self._events is not None:
+            return self._play_turns()
+
+        if self.is_game_over():
+            return 0
+
+        players = self._players
+        order = [players[idx] for idx in self._turn_order]
+        num_players = len(order)
+        first = self._turn_num
+        dealt = (self._num_rounds - self._round_num) * num_players - first
+        cards = self._deck_mgr.draw_cards(dealt)
+
+        # always called, new_round() can be overridden or assigned
+        # on the instance, a round in progress already had its call
+        start = self.round_num if first == 0 else self.round_num + 1
+        for round_num in range(start, self._num_rounds + 1):
+            self.new_round(round_num)
+
+        card_points = self.card_points
+        for seat, player in enumerate(order):
+            hand = cards[(seat - first) % num_players::num_players]
+            player.add_cards(hand)
+            player.score += sum(map(card_points, hand))
+
+        self._turn_num = 0
+        self._round_num = self._num_rounds
+        return dealt
+
+    def play_to_completion(self):
+        """
+        play_to_completion()
+            plays every remaining turn and returns player_rankings()
+
+        NOTE:
+        without event subscribers the turns are dealt at once by
+            deal_all(), with subscribers every turn is played
+            by next_turn() and every event is emitted
+        """
+        self.deal_all()
+        return self.player_rankings()
+
+    @staticmethod
+    def card_points(card):
+        """
+        card_points(card)
+            returns the points for a single card
+        """
+        return card.suit_value * card.card_value
+
     @staticmethod
     def calc_points(hand):
         """
@@ -164,6 +321,25 @@ class Draw3Game(CardGame):
 
         return points
 
+    def update_scores(self):
+        """
+        update_scores()
+            recalculates every player's score from their hand
+
+        NOTE:
+        scores are kept up to date by next_turn(), only needed
+            after changing a player's hand directly
+        """
+        for player in self._players:
+            player.score = self.calc_points(player.iter_hand())
+
+    def _ranked_players(self):
+        """
+        _ranked_players():  returns players that take part in
+            rankings and winners, in player order
+        """
+        return self._players
+
     def player_rankings(self):
         """
         player_rankings()
@@ -171,10 +347,139 @@ class Draw3Game(CardGame):
                 at [0] followed by other players
                 in descending order
         """
-        for player in self._players:
-            player.score = self.calc_points(player.hand)
-
-        players = self._players.copy()
+        players = list(self._ranked_players())
         players.sort(key=lambda p: p.score, reverse=True)
 
+        if self._events is not None:
+            self._events.emit(RANKINGS, self, players)
+
         return players
+
+    def winners(self):
+        """
+        winners()
+            returns list of players tied for the top score
+                (one player if there is no tie), in player order
+        """
+        winners = []
+        top_score = None
+        for player in self._ranked_players():
+            if top_score is None or player.score > top_score:
+                top_score = player.score
+                winners = [player]
+            elif player.score == top_score:
+                winners.append(player)
+
+        return winners
+
+    def top_k(self, k):
+        """
+        top_k(k)
+            returns the k highest scoring players in
+                descending order, ties keep player order
+        """
+        return nlargest(k, self._ranked_players(), key=lambda p: p.score)
+
+    @classmethod
+    def score_games(cls, card_ids, player_count, deck_mgr=None):
+        """
+        score_games(
+            card_ids,           # (games x cards) array of card ids
+            player_count,       # number of players in each game
+            deck_mgr=None       # DeckManager() the ids index into
+        )
+            scores many dealt games in one numpy call, card ids
+            index deck_mgr.template() and cards are handed out
+            round-robin in turn order (seat 0 draws first)
+            returns (scores, ranks, winners) arrays:
+                scores:   (games x player_count) points per seat
+                ranks:    dense rank per seat, 1 is the top score
+                winners:  True for every seat with the top score
+
+        NOTE:
+        requires numpy (raises draw3_batch.NumpyNotAvailable)
+        card points use the same rule as calc_points()
+        raises ValueError for ids that are not in deck_mgr.template()
+        card ids mean the same cards however deck_mgr is shuffled
+            or drawn from, template() is the deck it was created
+            with in natural order
+        """
+        if deck_mgr is None:
+            # default to standard 52-card deck
+            deck_mgr = DeckManager()
+
+        points = draw3_batch.points_table(deck_mgr.template())
+        return draw3_batch.rank_batch(points, card_ids, player_count)
+
+    # pylint:  disable=too-many-arguments
+    @classmethod
+    def simulate(
+        cls,
+        n_games,
+        player_count,
+        seed=None,
+        deck_mgr=None,
+        batch_size=65536
+    ):
+        """
+        simulate(
+            n_games,            # number of games to play
+            player_count,       # number of players in each game
+            seed=None,          # seed for numpy.random.default_rng()
+            deck_mgr=None,      # DeckManager() compatible object
+            batch_size=65536    # games shuffled per numpy batch
+        )
+            plays n_games shuffled Draw3 games at once using numpy
+            and returns (scores, winners, ties) arrays:
+                scores:   (n_games x player_count) points per seat
+                winners:  seat index of the (first) highest score
+                ties:     True where more than one seat has top score
+
+            seats are in turn order, seat 0 draws first
+
+        NOTE:
+        requires numpy (raises draw3_batch.NumpyNotAvailable)
+        card points use the same rule as calc_points()
+        """
+        numpy = draw3_batch.require_numpy()
+
+        game = cls()
+        if player_count < game.min_players:
+            raise NeedMorePlayers
+        if player_count > game.max_players:
+            raise MaxPlayersHit
+
+        if deck_mgr is None:
+            # default to standard 52-card deck
+            deck_mgr = DeckManager()
+
+        deck = deck_mgr.deck()
+        cards_per_game = player_count * game.num_rounds
+        if cards_per_game > len(deck):
+            raise EmptyDeckError
+
+        points = draw3_batch.points_table(deck)
+        rng = numpy.random.default_rng(seed)
+
+        results = []
+        for start in range(0, n_games, batch_size):
+            dealt = draw3_batch.deal_batch(
+                rng,
+                min(batch_size, n_games - start),
+                len(deck),
+                cards_per_game
+            )
+            results.append(
+                draw3_batch.score_batch(points, dealt, player_count)
+            )
+
+        if not results:
+            return (
+                numpy.zeros((0, player_count), dtype=numpy.int64),
+                numpy.zeros(0, dtype=numpy.int64),
+                numpy.zeros(0, dtype=bool),
+            )
+
+        return tuple(
+            numpy.concatenate(arrays) for arrays in zip(*results)
+        )
@@ -0,0 +1,306 @@
+"""
+cardgame_draw3_large.py:
+
+LargeDraw3Game() plays Draw3 at tables with thousands of players
+"""
+from .cardgame import (
+    DuplicatePlayerName,
+    InvalidPlayerName,
+    MaxPlayersHit,
+    NeedMorePlayers
+)
+from .cardgame_draw3 import Draw3Game
+from .events import GAME_OVER
+from .player import Player
+from .shoedeckmanager import ShoeDeckManager
+from .turn_scheduler import TurnScheduler
+
+
+class PlayerNotFound(Exception):
+    """
+    PlayerNotFound:  exception thrown when removing or skipping
+        a player that is not in the game
+    """
+
+
+class LargeDraw3Game(Draw3Game):
+    """
+    LargeDraw3Game:  Draw3Game() for large tables, default is
+        min 2 players, max 100000 players
+
+    Constructors:
+        LargeDraw3Game(rng=None, max_players=100000)
+
+    Methods:
+        add_players(player_names):  adds many players at once
+        remove_player(player_name):  eliminates player from the game
+        skip_player(player_name):  player loses their next turn
+        has_player(player_name):  whether player is in the game
+
+    Notes:
+        player names are unique, compared case-insensitively
+            (str.casefold()), and looked up in a dict
+
+        turn order is a TurnScheduler(), removing and skipping
+            players is O(1) at any table size
+
+        with the default deck, start_game() switches to a
+            ShoeDeckManager() with enough decks for every player
+            to draw every round
+
+        removed players are out of turn order, rankings and
+            winners, their seat stays empty until reset()
+            and remove_all_players()
+    """
+    def __init__(self, rng=None, max_players=100000):
+        super().__init__(rng)
+
+        self._max_players = max_players
+        # casefolded name -> index into self._players
+        self._names = {}
+        self._scheduler = TurnScheduler()
+        self._auto_deck = False
+        self._deck_size = 0
+        self._num_decks = 1
+
+    # pylint:  disable-msg=W0221
+    def setup_game(self, deck_mgr=None, player_names=None):
+        """
+        setup_game(
+            deck_mgr=None,   # can supply a DeckManager() compatible
+                object, None sizes the deck to the players
+            player_names=None, players can be added here or
+                players can be added via add_players()
+        )
+        """
+        super().setup_game(deck_mgr)
+
+        self._auto_deck = deck_mgr is None
+        self._deck_size = len(self._deck_mgr.deck())
+        self._num_decks = 1
+        if player_names is not None:
+            self.add_players(player_names)
+
+    def remove_all_players(self):
+        """
+        remove_all_players():  removes all players
+        """
+        super().remove_all_players()
+        self._names = {}
+        self._scheduler.reset(())
+
+    def _check_name(self, player_name):
+        """
+        _check_name(player_name):  returns casefolded player_name,
+            raises InvalidPlayerName or DuplicatePlayerName
+        """
+        if not isinstance(player_name, str):
+            raise InvalidPlayerName
+
+        key = player_name.casefold()
+        if key in self._names:
+            raise DuplicatePlayerName
+
+        return key
+
+    def add_player(self, player_name):
+        """
+        add_player(player_name):
+            adds Player(player_name) to end of turn order
+            raises DuplicatePlayerName if the name is taken
+        """
+        key = self._check_name(player_name)
+        if len(self._players) >= self._max_players:
+            raise MaxPlayersHit
+
+        seat = len(self._players)
+        self._players.append(Player(player_name))
+        self._turn_order.append(seat)
+        self._names[key] = seat
+        self._scheduler.append(seat)
+        return len(self._names)
+
+    def add_players(self, player_names):
+        """
+        add_players(player_names):
+            adds a Player() for every name, in order
+            no player is added if a name is invalid or taken
+            (InvalidPlayerName, DuplicatePlayerName) or there
+            would be more than max players (MaxPlayersHit)
+        """
+        player_names = list(player_names)
+        new_names = {}
+        for player_name in player_names:
+            key = self._check_name(player_name)
+            if key in new_names:
+                raise DuplicatePlayerName
+            new_names[key] = len(self._players) + len(new_names)
+
+        if len(self._players) + len(new_names) > self._max_players:
+            raise MaxPlayersHit
+
+        seats = range(len(self._players), len(self._players) + len(new_names))
+        self._players.extend(Player(name) for name in player_names)
+        self._turn_order.extend(seats)
+        self._names.update(new_names)
+        for seat in seats:
+            self._scheduler.append(seat)
+
+        return len(self._names)
+
+    def _seat(self, player_name):
+        """
+        _seat(player_name):  returns index of player_name in
+            self._players, raises PlayerNotFound
+        """
+        if isinstance(player_name, str):
+            seat = self._names.get(player_name.casefold())
+            if seat is not None:
+                return seat
+
+        raise PlayerNotFound
+
+    def has_player(self, player_name):
+        """
+        has_player(player_name):  returns True if player_name is in
+            the game (case-insensitive)
+        """
+        return (
+            isinstance(player_name, str)
+            and player_name.casefold() in self._names
+        )
+
+    def _turn_passed(self, rounds):
+        """
+        _turn_passed(rounds):  moves the game on by the rounds the
+            scheduler completed while passing a turn
+        """
+        if rounds == 0:
+            return
+
+        self._turn_num = 0
+        self._round_num += rounds
+        if self._events is not None and self.is_game_over():
+            self._events.emit(GAME_OVER, self)
+
+    def remove_player(self, player_name):
+        """
+        remove_player(player_name):
+            eliminates player, if it is their turn the turn passes
+            to the next player
+            returns the removed Player(), raises PlayerNotFound
+        """
+        seat = self._seat(player_name)
+        del self._names[player_name.casefold()]
+        self._turn_passed(self._scheduler.remove(seat))
+        return self._players[seat]
+
+    def skip_player(self, player_name):
+        """
+        skip_player(player_name):
+            player loses their next turn, if it is their turn
+            the turn passes to the next player
+            raises PlayerNotFound
+        """
+        seat = self._seat(player_name)
+        if not self.is_game_over():
+            self._turn_passed(self._scheduler.skip(seat))
+
+    def get_turn_order(self):
+        """
+        get_turn_order():  returns names of players in turn order
+        """
+        players = self._players
+        return [players[seat].name for seat in self._scheduler]
+
+    def get_current_players(self):
+        """
+        get_current_players():  returns players still in the game,
+            in order added
+        """
+        players = self._players
+        return [players[seat] for seat in self._names.values()]
+
+    def _ranked_players(self):
+        """
+        _ranked_players():  removed players are not ranked
+        """
+        return self.get_current_players()
+
+    def _size_deck(self):
+        """
+        _size_deck():  switches the default deck to a shoe with
+            enough decks for every player to draw every round
+        """
+        needed = len(self._names) * self._num_rounds
+        if not self._auto_deck or needed <= self._deck_size * self._num_decks:
+            return
+
+        self._num_decks = -(-needed // self._deck_size)
+        self._deck_mgr = ShoeDeckManager(self._num_decks, self._rng)
+
+    def start_game(self):
+        """
+        start_game()
+            checks to see if we have at least min required players
+                raises NeedMorePlayers exception if below min
+            sizes the default deck, shuffles turn order when
+                random_turn_order is set
+        """
+        if len(self._names) < self.min_players:
+            raise NeedMorePlayers
+
+        self._size_deck()
+        self._turn_order = list(self._scheduler)
+        super().start_game()
+        self._scheduler.reset(self._turn_order)
+
+    def reset(self):
+        """
+        reset()
+            puts cards back into the deck, empties hands and sets
+                turn, round and turn order back to the start,
+                removed players stay out of the game
+        """
+        super().reset()
+        self._turn_order = list(self._names.values())
+        self._scheduler.reset(self._turn_order)
+
+    def is_game_over(self):
+        """
+        is_game_over()
+            game is over after 3 rounds (default) or when every
+                player has been removed
+        """
+        return self.round_num > self.num_rounds or not self._scheduler
+
+    def get_current_player(self):
+        """
+        get_current_player()
+            returns current player, None if there are no players
+        """
+        seat = self._scheduler.current
+        if seat is None:
+            return None
+
+        return self._players[seat]
+
+    def _pass_turn(self):
+        """
+        _pass_turn():  passes the turn to the next player in the
+            scheduler, skipped players are passed over
+        """
+        self._turn_num += 1
+        rounds = self._scheduler.advance()
+        if rounds:
+            self._turn_num = 0
+            self._round_num += rounds
+
+    def deal_all(self):
+        """
+        deal_all()
+            plays every remaining turn with next_turn(), skipped
+                and removed players make the turn order irregular
+            returns number of cards dealt
+        """
+        return self._play_turns()
@@ -0,0 +1,191 @@
+"""
+compactdeckmanager.py:
+    contains CompactDeckManager() class that stores the deck as
+    a compact array of card ids instead of a list of Card() objects
+"""
+from array import array
+from collections import Counter
+from itertools import repeat
+
+from .deckmanager import EmptyDeckError, InvalidDeckError
+from .deckview import DeckView
+from .extendeddeckmanager import ExtendedDeckManager
+
+
+# array('H') holds unsigned 16-bit card ids
+MAX_CARD_IDS = 65536
+
+
+class CompactDeckManager(ExtendedDeckManager):
+    """
+    CompactDeckManager class:  ExtendedDeckManager() that keeps the
+        deck as array('H') of card ids
+
+    Constructors:
+        same as ExtendedDeckManager()
+
+    Notes:
+        each distinct Card() in the deck gets an id (index into
+        card_table()), cards are only looked up from their id when
+        they are drawn, peeked at or the deck is returned
+
+        shuffles and copies work on the id array, so multi-deck
+        shoes take 2 bytes per card
+    """
+    def __init__(self, *args, **kwargs):
+        self._cards = ()
+        self._card_ids = {}
+        super().__init__(*args, **kwargs)
+        # encoded template, reset() copies the id array only
+        self._template_state = (self._cards, self._card_ids, self._deck[:])
+
+    @staticmethod
+    def _card_key(card):
+        # equal cards can have different suit/value names,
+        # so key on the full definition
+        return (card.suit, card.value, card.suit_value, card.card_value)
+
+    def _set_deck(self, cards):
+        """
+        _set_deck(cards):  encodes list of Card() objects
+            (top of deck at the end) into array of card ids
+        """
+        table = []
+        card_ids = {}
+        for card in cards:
+            key = CompactDeckManager._card_key(card)
+            if key not in card_ids:
+                card_ids[key] = len(table)
+                table.append(card)
+
+        if len(table) > MAX_CARD_IDS:
+            raise InvalidDeckError
+
+        self._cards = tuple(table)
+        self._card_ids = card_ids
+        self._deck = array(
+            'H',
+            [card_ids[CompactDeckManager._card_key(card)] for card in cards]
+        )
+        self._shuffle_pending = False
+        self._version += 1
+
+    def reset(self):
+        """
+        reset():  puts back every card of the deck this manager was
+            created with, without encoding the cards again
+        """
+        self._cards, self._card_ids, card_ids = self._template_state
+        self._deck = card_ids[:]
+        self._shuffle_pending = False
+        self._version += 1
+
+    def card_table(self):
+        """
+        card_table():  returns tuple of Card() objects indexed by card id
+        """
+        return self._cards
+
+    def card_ids(self):
+        """
+        card_ids():  returns copy of card id array in natural order
+        """
+        self._finish_shuffle()
+        return self._deck[::-1]
+
+    def deck(self):
+        """
+        deck():  returns copy of deck in natural order
+        """
+        self._finish_shuffle()
+        cards = self._cards
+        return [cards[card_id] for card_id in reversed(self._deck)]
+
+    def deck_view(self):
+        """
+        deck_view():  returns read-only DeckView() of deck in natural
+            order, card ids are looked up as they are read
+        """
+        self._finish_shuffle()
+        return DeckView(self, self._deck, self._cards)
+
+    def shuffle(self):
+        """
+        shuffle():  shuffles deck and returns copy in natural order
+        """
+        self._shuffle_pending = False
+        self._rng.shuffle(self._deck)
+        self._version += 1
+        return self.deck()
+
+    def sort(self):
+        """
+        sort():  sorts deck according to algorithm at self.sort_algo
+        """
+        # sort_algo() is called once per distinct card, not per card
+        self._shuffle_pending = False
+        table = self._sort_keys(self._cards)
+        keys = [table[id(card)][0] for card in self._cards]
+
+        if len(set(keys)) == len(keys):
+            # counting sort of the ids
+            counts = Counter(self._deck)
+            card_ids = array('H')
+            for card_id in sorted(range(len(keys)), key=keys.__getitem__):
+                card_ids.extend(repeat(card_id, counts[card_id]))
+        else:
+            # different cards share a key, bucket by key so cards
+            # with the same key keep their order
+            buckets = {}
+            for card_id in self._deck:
+                buckets.setdefault(keys[card_id], []).append(card_id)
+            card_ids = array('H')
+            for key in sorted(buckets):
+                card_ids.extend(buckets[key])
+
+        self._deck = card_ids
+        self._version += 1
+        cards = self._cards
+        return [cards[card_id] for card_id in self._deck]
+
+    def draw_card(self):
+        """
+        draw_card():
+            pops card off the "top" of deck (end of array) and returns it
+            returns EmptyDeckError exception on empty/invalid deck
+        """
+        if self._shuffle_pending:
+            self._lazy_draw_swap()
+
+        try:
+            card_id = self._deck.pop()
+        except IndexError as idx_err:
+            raise EmptyDeckError from idx_err
+
+        self._version += 1
+        return self._cards[card_id]
+
+    def draw_cards(self, num_cards):
+        """
+        draw_cards(num_cards):
+            removes num_cards off the "top" of deck and returns
+            them as a list of Card() objects, first card drawn first
+            raises EmptyDeckError if the deck has fewer than num_cards
+        """
+        cards = self._cards
+        return [cards[card_id] for card_id in self._pop_top(num_cards)]
+
+    def peek_card(self, index):
+        """
+        peek_card(index):  helper function if game needs
+            to peek at a card
+
+        NOTE:
+        return Card() reference, not copy
+        """
+        self._finish_shuffle()
+        try:
+            # natural, 1-based index to reversed 0-based
+            return self._cards[self._deck[len(self._deck) - index]]
+        except IndexError:
+            return None
@@ -6,9 +6,13 @@ NOTE:
 creates standard 52-card deck with suits ranked
     (low to high):  Spades, Diamonds, Hearts, Clubs
 """
-import random
+from collections import Counter
+from functools import lru_cache
+from itertools import repeat
 
 from .card import Card
+from .deckview import DeckView
+from .rng import make_rng
 
 
 class EmptyDeckError(Exception):
@@ -46,6 +50,26 @@ DEFAULT_VALUES_RANKING = [
     'Ace',
 ]
 
+# number of (suits, values, start values) deck templates kept
+DECK_TEMPLATE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=DECK_TEMPLATE_CACHE_SIZE)
+def _deck_template(suits, values, suits_value_start, cards_value_start):
+    # Card() objects are immutable flyweights,
+    # so one tuple of them can be shared by every deck
+    deck = []
+    # reverse suits and values to put top card at end of list
+    suit_value = len(suits) - 1 + suits_value_start
+    for suit in suits[::-1]:
+        card_value = len(values) - 1 + cards_value_start
+        for value in values[::-1]:
+            deck.append(Card(suit, value, suit_value, card_value))
+            card_value -= 1
+        suit_value -= 1
+
+    return tuple(deck)
+
 
 class DeckManager:
     """
@@ -56,33 +80,91 @@ class DeckManager:
         defaults to 52-card Spades, Diamonds, Hearts, Clubs
 
     Constructors:
-        DeckManager():  returns normal 52-card deck with suit ranking
-        (low to high) as ['Spades', 'Diamonds', 'Hearts', 'Clubs']
+        DeckManager(
+            rng=None,
+            suits_ranking=None,
+            values_ranking=None,
+            initial_deck=None
+        ):
+        returns normal 52-card deck with suit ranking (low to high) as
+        ['Spades', 'Diamonds', 'Hearts', 'Clubs'] by default
+        rng can be a random.Random(), numpy Generator, NumpyRNG()
+        or a seed (see rng.make_rng())
+        suits_ranking and values_ranking (low to high) replace the
+        default rankings, initial_deck (natural order) replaces the
+        deck made from the rankings
+
+        (ExtendedDeckManager() adds validation of custom decks)
 
     Methods:
         deck():  returns copy of current deck
+        deck_view():  returns read-only DeckView() of current deck
+        template():  returns copy of the deck it was created with
+        draw_cards(num_cards):  draws num_cards in one call
 
     Notes:
         deck is internally stored with "top of deck" at the
         end for list efficiency;
         returned copy of deck will be reversed to preserve natural order
 
+        version is incremented every time the deck changes,
+        DeckView() uses it to detect stale views
+
+        decks made from suits and values are copied from a cached
+        template (least recently used templates are dropped after
+        DECK_TEMPLATE_CACHE_SIZE)
+
+        reset() puts every card back from the deck the manager was
+        created with (its template), no Card() objects are made
+
+        lazy_shuffle() defers the shuffle to draw_card(), each draw
+        picks a card uniformly from the rest of the deck (one
+        Fisher-Yates step), reading the whole deck finishes the shuffle
+
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        rng=None,
+        suits_ranking=None,
+        values_ranking=None,
+        initial_deck=None
+    ):
         # suit ranking from low to high
-        self._suits_ranking = DEFAULT_SUITS_RANKING
+        if suits_ranking is None:
+            suits_ranking = DEFAULT_SUITS_RANKING
+        self._suits_ranking = suits_ranking
 
         # card values from low to high
-        self._values_ranking = DEFAULT_VALUES_RANKING
-
-        # seed random once
-        random.seed()
-
-        self._deck = DeckManager.make_deck(
-            self._suits_ranking,
-            self._values_ranking
-        )
+        if values_ranking is None:
+            values_ranking = DEFAULT_VALUES_RANKING
+        self._values_ranking = values_ranking
+
+        # each deck manager shuffles with its own rng
+        self._rng = make_rng(rng)
+
+        self._deck = None
+        self._version = 0
+        # True while a lazy_shuffle() is finished by draw_card()
+        self._shuffle_pending = False
+        # id(card) -> (sort_algo(card), card) for the sort_algo
+        # function in _sort_key_func, see _sort_keys()
+        self._sort_key_table = {}
+        self._sort_key_func = None
+        if initial_deck is None:
+            # cached template shared by every deck with these rankings
+            self._template = _deck_template(
+                tuple(self._suits_ranking),
+                tuple(self._values_ranking),
+                1,
+                2
+            )
+        else:
+            # reverse copy to put top card at end of list
+            self._template = tuple(initial_deck[::-1])
+
+        # reset() goes back to the template
+        self._set_deck(list(self._template))
 
     @staticmethod
     def make_deck(suits, values, suits_value_start=1, cards_value_start=2):
@@ -94,27 +176,111 @@ class DeckManager:
         NOTES:
         staticmethod so it can be called without having to create an
             instance of DeckManager()
+        returns a new list copied from a cached template
         """
         # suits_value_start=1 and cards_value_start=2 are default
         # for normal 52-card deck
-        deck = []
-        # reverse suits and values to put top card at end of list
-        suit_value = len(suits) - 1 + suits_value_start
-        for suit in suits[::-1]:
-            card_value = len(values) - 1 + cards_value_start
-            for value in values[::-1]:
-                deck.append(Card(suit, value, suit_value, card_value))
-                card_value -= 1
-            suit_value -= 1
-
-        return deck
+        return list(
+            _deck_template(
+                tuple(suits),
+                tuple(values),
+                suits_value_start,
+                cards_value_start
+            )
+        )
+
+    @staticmethod
+    def template_cache_info():
+        """
+        template_cache_info():  returns functools cache info of
+            the deck template cache
+        """
+        return _deck_template.cache_info()
+
+    @staticmethod
+    def clear_template_cache():
+        """
+        clear_template_cache():  empties the deck template cache
+        """
+        _deck_template.cache_clear()
+
+    def _set_deck(self, cards):
+        """
+        _set_deck(cards):  replaces internal deck with list of
+            Card() objects (top of deck at the end)
+
+        NOTE:
+        override to change how the deck is stored
+        """
+        self._deck = cards
+        self._shuffle_pending = False
+        self._version += 1
+
+    def _finish_shuffle(self):
+        """
+        _finish_shuffle():  shuffles rest of deck if a lazy_shuffle()
+            is pending, called before the whole deck is read
+        """
+        if self._shuffle_pending:
+            self._shuffle_pending = False
+            self._rng.shuffle(self._deck)
+
+    def _lazy_draw_swap(self):
+        """
+        _lazy_draw_swap():  one Fisher-Yates step, swaps a random card
+            from the rest of the deck onto the top
+        """
+        deck = self._deck
+        top = len(deck) - 1
+        if top > 0:
+            idx = self._rng.randrange(top + 1)
+            deck[idx], deck[top] = deck[top], deck[idx]
+
+    @property
+    def rng(self):
+        """
+        rng:  returns rng used to shuffle this deck
+        """
+        return self._rng
+
+    @property
+    def shuffle_pending(self):
+        """
+        shuffle_pending:  returns True if a lazy_shuffle() has not
+            been finished yet
+        """
+        return self._shuffle_pending
+
+    @property
+    def version(self):
+        """
+        version:  returns number of changes made to the deck
+        """
+        return self._version
 
     def deck(self):
         """
         deck():  returns copy of deck in natural order
         """
+        self._finish_shuffle()
         # reverse deck before returning to display in natural order
-        return self._deck.copy()[::-1]
+        return self._deck[::-1]
+
+    def deck_view(self):
+        """
+        deck_view():  returns read-only DeckView() of deck in natural
+            order without copying it
+        """
+        self._finish_shuffle()
+        return DeckView(self, self._deck)
+
+    def template(self):
+        """
+        template():  returns copy of the deck this manager was created
+            with in natural order, shuffling and drawing do not
+            change it
+        """
+        return list(self._template[::-1])
 
     def suits_ranking(self):
         """
@@ -128,25 +294,104 @@ class DeckManager:
         """
         return self._values_ranking.copy()
 
+    def reset(self):
+        """
+        reset():  puts back every card of the deck this manager was
+            created with, in its original order
+        """
+        self._set_deck(list(self._template))
+
     def shuffle(self):
         """
         shuffle():  shuffles deck and returns copy in natural order
         """
-        random.shuffle(self._deck)
+        self._shuffle_pending = False
+        self._rng.shuffle(self._deck)
+        self._version += 1
         # return in natural order
-        return self._deck.copy()[::-1]
+        return self._deck[::-1]
+
+    def lazy_shuffle(self):
+        """
+        lazy_shuffle():  shuffles deck on demand, each draw_card()
+            picks a random card from the rest of the deck
+
+        NOTE:
+        costs O(cards drawn) instead of O(deck size), cards come out
+            in the same distribution as after shuffle()
+        """
+        self._shuffle_pending = True
+        self._version += 1
 
     def sort_algo(self, card):
         """
         sort_algo(card):  base sort algorithm
 
         NOTE:
-        override to change sorting
+        override to change sorting, keys must be hashable
+            (sort() buckets cards by key)
         """
         # make this be the default sorting algorithm, but part of the class
         # so it can be overridden per-object
         return card.suit_value * len(self._values_ranking) + card.card_value
 
+    def _sort_keys(self, cards):
+        """
+        _sort_keys(cards):  returns {id(card): (sort_algo(card), card)}
+            with an entry for every distinct card in cards
+
+        NOTE:
+        sort_algo() is called once per distinct card, the table is
+            kept until sort_algo is replaced (Card() objects are
+            interned, so their ids are stable)
+        """
+        sort_algo = self.sort_algo
+        func = getattr(sort_algo, '__func__', sort_algo)
+        if func is not self._sort_key_func:
+            self._sort_key_func = func
+            self._sort_key_table = {}
+
+        table = self._sort_key_table
+        distinct = dict(zip(map(id, cards), cards))
+        for card_id, card in distinct.items():
+            if card_id not in table:
+                table[card_id] = (sort_algo(card), card)
+
+        return table
+
+    def _sorted_cards(self, cards):
+        """
+        _sorted_cards(cards):  returns new list of cards sorted by
+            sort_algo (smallest first), equal keys keep their order
+
+        NOTE:
+        counting sort, O(number of cards) plus sorting the keys of
+            the distinct cards
+        """
+        table = self._sort_keys(cards)
+        counts = Counter(map(id, cards))
+        entries = sorted(
+            (table[card_id] for card_id in counts),
+            key=lambda entry: entry[0]
+        )
+
+        if len({key for key, _ in entries}) < len(entries):
+            # different cards share a key, bucket by key so cards
+            # with the same key keep their order
+            buckets = {}
+            for card in cards:
+                buckets.setdefault(table[id(card)][0], []).append(card)
+            return [
+                card
+                for key in sorted(buckets)
+                for card in buckets[key]
+            ]
+
+        result = []
+        for _, card in entries:
+            result.extend(repeat(card, counts[id(card)]))
+        return result
+
     def sort(self):
         """
         sort():  sorts deck according to algorithm at self.sort_algo
@@ -156,7 +401,9 @@ class DeckManager:
         """
         # sort biggest at [0] and smallest at [-1]
         # so you can just pop() off cards
-        self._deck.sort(key=self.sort_algo)
+        self._shuffle_pending = False
+        self._deck[:] = self._sorted_cards(self._deck)
+        self._version += 1
         return self._deck.copy()
 
     def draw_card(self):
@@ -165,7 +412,52 @@ class DeckManager:
             pops card off the "top" of deck (end of list) and returns it
             returns EmptyDeckError exception on empty/invalid deck
         """
+        if self._shuffle_pending:
+            self._lazy_draw_swap()
+
         try:
-            return self._deck.pop()
+            card = self._deck.pop()
         except IndexError as idx_err:
             raise EmptyDeckError from idx_err
+
+        self._version += 1
+        return card
+
+    def _pop_top(self, num_cards):
+        """
+        _pop_top(num_cards):  removes num_cards from the top of the
+            internal deck and returns them in draw order,
+            same rng use as num_cards draw_card() calls
+        """
+        deck = self._deck
+        if num_cards < 0:
+            raise ValueError("num_cards must not be negative")
+        if num_cards > len(deck):
+            raise EmptyDeckError
+        if num_cards == 0:
+            return deck[:0]
+
+        if self._shuffle_pending:
+            randrange = self._rng.randrange
+            # the Fisher-Yates steps draw_card() would take
+            for top in range(len(deck) - 1, len(deck) - 1 - num_cards, -1):
+                if top > 0:
+                    idx = randrange(top + 1)
+                    deck[idx], deck[top] = deck[top], deck[idx]
+
+        cards = deck[-num_cards:]
+        del deck[-num_cards:]
+        cards.reverse()
+        self._version += 1
+        return cards
+
+    def draw_cards(self, num_cards):
+        """
+        draw_cards(num_cards):
+            removes num_cards off the "top" of deck and returns
+            them as a list, first card drawn first
+            same cards as calling draw_card() num_cards times
+            raises EmptyDeckError, without drawing, if the deck
+            has fewer than num_cards
+        """
+        return self._pop_top(num_cards)
@@ -0,0 +1,109 @@
+"""
+deckview.py:
+    contains DeckView() class, a read-only view of a deck manager's
+    deck in natural order that does not copy the deck
+"""
+from collections.abc import Sequence
+
+
+class StaleDeckViewError(Exception):
+    """
+    StaleDeckViewError:  exception thrown when reading a DeckView()
+        after its deck has been changed
+    """
+
+
+class DeckView(Sequence):
+    """
+    DeckView class:  read-only Sequence over a deck manager's
+        internal deck, presented in natural order
+
+    Constructors:
+    DeckView(deck_mgr, cards, card_table=None):
+        deck_mgr is the owning deck manager (for its version)
+        cards is the internal deck (top of deck at the end)
+        card_table maps card ids to Card() when cards holds ids
+
+    Notes:
+        natural order is produced by reversing indexes, not data
+
+        the view remembers deck_mgr.version when it is created,
+        once the deck changes (draw, shuffle, sort...) the view is
+        stale and reading it raises StaleDeckViewError
+    """
+    def __init__(self, deck_mgr, cards, card_table=None):
+        self._deck_mgr = deck_mgr
+        self._version = deck_mgr.version
+        self._cards = cards
+        self._card_table = card_table
+
+    @property
+    def version(self):
+        """
+        version:  returns deck version this view was created at
+        """
+        return self._version
+
+    @property
+    def stale(self):
+        """
+        stale:  returns True if the deck changed since the view
+            was created
+        """
+        return self._version != self._deck_mgr.version
+
+    def _check(self):
+        if self._version != self._deck_mgr.version:
+            raise StaleDeckViewError
+
+    def __len__(self):
+        self._check()
+        return len(self._cards)
+
+    def __getitem__(self, index):
+        self._check()
+        if isinstance(index, slice):
+            return [
+                self[idx] for idx in range(*index.indices(len(self._cards)))
+            ]
+
+        size = len(self._cards)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(index)
+
+        card = self._cards[size - 1 - index]
+        if self._card_table is not None:
+            card = self._card_table[card]
+
+        return card
+
+    def __iter__(self):
+        self._check()
+        if self._card_table is None:
+            return reversed(self._cards)
+
+        table = self._card_table
+        return (table[card_id] for card_id in reversed(self._cards))
+
+    def __reversed__(self):
+        self._check()
+        if self._card_table is None:
+            return iter(self._cards)
+
+        table = self._card_table
+        return (table[card_id] for card_id in self._cards)
+
+    def __eq__(self, cmp):
+        if not isinstance(cmp, Sequence):
+            return NotImplemented
+        return list(self) == list(cmp)
+
+    __hash__ = None
+
+    def __str__(self):
+        return f"DeckView({list(self)})"
+
+    def __repr__(self):
+        return str(self)
@@ -0,0 +1,141 @@
+"""
+draw3_batch.py:  NumPy helpers used to shuffle, deal and score
+    whole batches of Draw3 games at once
+
+NOTE:
+numpy is an optional dependency, it is only imported here and
+    NumpyNotAvailable is raised if a batch helper is used without it
+"""
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class NumpyNotAvailable(Exception):
+    """
+    NumpyNotAvailable:  exception thrown when a batch helper is
+        used and numpy is not installed
+    """
+
+
+def require_numpy():
+    """
+    require_numpy():  returns the numpy module or raises
+        NumpyNotAvailable if it is not installed
+    """
+    if numpy is None:  # pragma: no cover
+        raise NumpyNotAvailable
+
+    return numpy
+
+
+def points_table(deck):
+    """
+    points_table(deck):
+        returns numpy array with the Draw3 points
+        (suit_value * card_value) for each Card() in deck,
+        indexed the same as deck
+    """
+    require_numpy()
+
+    return numpy.array(
+        [card.suit_value * card.card_value for card in deck],
+        dtype=numpy.int64
+    )
+
+
+def deal_batch(rng, n_games, n_cards, cards_per_game):
+    """
+    deal_batch(rng, n_games, n_cards, cards_per_game):
+        shuffles n_games decks of n_cards with numpy Generator rng
+        and returns (n_games, cards_per_game) array of card indexes
+        in the order they are drawn
+    """
+    require_numpy()
+
+    # smallest dtype that holds a card index keeps the batch compact
+    dtype = numpy.uint8 if n_cards <= 256 else numpy.int32
+    decks = numpy.tile(numpy.arange(n_cards, dtype=dtype), (n_games, 1))
+
+    return rng.permuted(decks, axis=1)[:, :cards_per_game]
+
+
+def score_batch(points, dealt, player_count):
+    """
+    score_batch(points, dealt, player_count):
+        scores an array of dealt card indexes (games x cards),
+        cards are handed out round-robin in turn order so
+        card[round * player_count + seat] belongs to seat
+
+        returns (scores, winners, ties) where
+            scores:   (games x player_count) points per seat
+            winners:  seat index of the (first) highest score
+            ties:     True where more than one seat has the top score
+    """
+    require_numpy()
+
+    n_games = dealt.shape[0]
+    scores = points[dealt].reshape(n_games, -1, player_count).sum(axis=1)
+    top = scores.max(axis=1)
+    winners = scores.argmax(axis=1)
+    ties = (scores == top[:, None]).sum(axis=1) > 1
+
+    return (scores, winners, ties)
+
+
+def dense_ranks(scores):
+    """
+    dense_ranks(scores):
+        returns (ranks, winners) for a (games x players) array of
+        scores, computed for every game at once
+            ranks:    dense rank of each seat, 1 is the top score and
+                      equal scores share a rank with no gaps after it
+            winners:  True for every seat with the top score
+    """
+    require_numpy()
+
+    scores = numpy.asarray(scores)
+    # seats ordered by descending score, then rank within each row
+    order = numpy.argsort(-scores, axis=1, kind='stable')
+    ordered = numpy.take_along_axis(scores, order, axis=1)
+    steps = numpy.ones(ordered.shape, dtype=numpy.int64)
+    steps[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+
+    ranks = numpy.empty(ordered.shape, dtype=numpy.int64)
+    numpy.put_along_axis(ranks, order, steps.cumsum(axis=1), axis=1)
+
+    return (ranks, ranks == 1)
+
+
+def rank_batch(points, card_ids, player_count):
+    """
+    rank_batch(points, card_ids, player_count):
+        scores and ranks a (games x cards) array of card ids, each id
+        indexes points (see points_table()), cards are handed out
+        round-robin like score_batch()
+        raises ValueError for ids outside range(len(points))
+
+        returns (scores, ranks, winners) where
+            scores:   (games x player_count) points per seat
+            ranks:    dense rank per seat, 1 is the top score
+            winners:  True for every seat with the top score
+    """
+    require_numpy()
+
+    card_ids = numpy.asarray(card_ids)
+    if card_ids.ndim != 2 or card_ids.shape[1] % player_count:
+        raise ValueError(
+            "card_ids must be games x (rounds * player_count)"
+        )
+
+    # numpy indexing would wrap negative ids around
+    if card_ids.size and (
+        card_ids.min() < 0 or card_ids.max() >= len(points)
+    ):
+        raise ValueError("card_ids must be in range(len(points))")
+
+    n_games = card_ids.shape[0]
+    scores = points[card_ids].reshape(n_games, -1, player_count).sum(axis=1)
+
+    return (scores,) + dense_ranks(scores)
@@ -0,0 +1,256 @@
+"""
+draw3_odds.py:
+    contains Draw3Odds() class that computes exact Draw3 odds for
+    a deck with dynamic programming instead of sampling
+"""
+from collections import defaultdict
+from fractions import Fraction
+from math import comb
+
+from .cardgame import NeedMorePlayers
+from .deckmanager import DeckManager, EmptyDeckError, InvalidDeckError
+
+
+class Draw3Odds:
+    """
+    Draw3Odds class:  exact score distribution and win/tie odds
+        for a shuffled Draw3 game
+
+    Constructors:
+    Draw3Odds(deck_mgr=None, hand_size=3):
+        deck_mgr defaults to standard 52-card DeckManager()
+        hand_size is number of cards each player draws
+
+    Methods:
+    score_distribution():  {score: probability} for one hand
+    seat_odds(num_players):  win/tie/lose odds and score distribution
+        for each seat
+
+    Notes:
+        points per card are suit_value * card_value, same as
+        Draw3Game.calc_points(), and must not be negative
+
+        probabilities are exact fractions.Fraction() values
+
+        the deal is a uniform shuffle, so every seat has the same odds,
+        seat_odds() computes them once from seat 0's point of view
+    """
+    def __init__(self, deck_mgr=None, hand_size=3):
+        if deck_mgr is None:
+            # default to standard 52-card deck
+            deck_mgr = DeckManager()
+
+        self._points = sorted(
+            (card.suit_value * card.card_value for card in deck_mgr.deck()),
+            reverse=True
+        )
+        if self._points and self._points[-1] < 0:
+            raise InvalidDeckError
+
+        self._hand_size = hand_size
+
+    @property
+    def hand_size(self):
+        """
+        hand_size:  returns number of cards in each hand
+        """
+        return self._hand_size
+
+    def score_distribution(self):
+        """
+        score_distribution():
+            returns {score: probability} for a hand of hand_size cards
+            drawn without replacement from the deck
+        """
+        if len(self._points) < self._hand_size:
+            raise EmptyDeckError
+
+        # sums[count] = {points: number of count-card subsets}
+        sums = [defaultdict(int) for _ in range(self._hand_size + 1)]
+        sums[0][0] = 1
+        for points in self._points:
+            for count in range(self._hand_size - 1, -1, -1):
+                for total, ways in sums[count].items():
+                    sums[count + 1][total + points] += ways
+
+        hands = comb(len(self._points), self._hand_size)
+        return {
+            score: Fraction(ways, hands)
+            for score, ways in sorted(sums[self._hand_size].items())
+        }
+
+    def seat_odds(self, num_players):
+        """
+        seat_odds(num_players):
+            returns list with one dict per seat:
+                {
+                    'win':  probability of the only top score,
+                    'tie':  probability of sharing the top score,
+                    'lose': probability of not having the top score,
+                    'scores':  score_distribution() of the seat,
+                }
+        """
+        if num_players < 1:
+            raise NeedMorePlayers
+
+        if len(self._points) < num_players * self._hand_size:
+            raise EmptyDeckError
+
+        win, tie = self._count_top(num_players)
+
+        deals = 1
+        for seat in range(num_players):
+            deals *= comb(
+                len(self._points) - seat * self._hand_size,
+                self._hand_size
+            )
+
+        odds = {
+            'win': Fraction(win, deals),
+            'tie': Fraction(tie, deals),
+            'lose': Fraction(deals - win - tie, deals),
+            'scores': self.score_distribution(),
+        }
+
+        return [dict(odds) for _ in range(num_players)]
+
+    def _count_top(self, num_players):
+        """
+        _count_top(num_players):
+            returns (win, tie) number of deals where seat 0 has the
+            only top score or shares it
+
+        NOTE:
+        cards are dealt high to low to every seat at once, state is
+            the sorted seat codes (points - lowest points) *
+            (hand_size + 1) + card count, seats are interchangeable
+            so one state stands for every seat order
+
+        a seat that can no longer reach the top score leaves the
+            state, its hand is any of the cards the others leave
+            over, once one seat is left or every hand is full the
+            top score is settled and the deal is counted
+
+        counts are for any seat, seat 0 has 1 / num_players of them
+
+        the number of states still grows exponentially with
+            num_players, keeping every hand under a score when the
+            whole deck is dealt is 3-partition, so no exact count
+            avoids that
+        """
+        prefix = [0]
+        for points in self._points:
+            prefix.append(prefix[-1] + points)
+
+        win = 0
+        tie = 0
+        pending = {(0,) * num_players: 1}
+        for idx in range(len(self._points) + 1):
+            limits = self._limits(prefix, idx)
+            states = defaultdict(int)
+            for seats, ways in pending.items():
+                settled = self._settle(seats, ways, limits)
+                if settled is None:
+                    continue
+
+                seats, ways, tied = settled
+                if not tied:
+                    states[seats] += ways
+                elif tied == 1:
+                    win += ways
+                else:
+                    tie += ways * tied
+
+            if idx == len(self._points):
+                break
+
+            pending = self._deal(states, self._points[idx])
+
+        return (win // num_players, tie // num_players)
+
+    def _limits(self, prefix, idx):
+        """
+        _limits(prefix, idx):
+            returns (remaining, most, fewest) before dealing card idx,
+                most and fewest are the points the rest of a hand can
+                add, by card count
+        """
+        size = self._hand_size
+        deck_size = len(self._points)
+        most = [
+            prefix[min(idx + size - count, deck_size)] - prefix[idx]
+            for count in range(size + 1)
+        ]
+        fewest = [
+            prefix[-1] - prefix[deck_size - size + count]
+            for count in range(size + 1)
+        ]
+        return (deck_size - idx, most, fewest)
+
+    def _settle(self, seats, ways, limits):
+        """
+        _settle(seats, ways, limits):
+            returns None when the cards left cannot fill every hand,
+                (None, ways, tied) when the top score is settled with
+                tied seats sharing it, else (seats, ways, 0) with the
+                seats that can still reach the top score
+        """
+        size = self._hand_size
+        stride = size + 1
+        remaining, most, fewest = limits
+
+        needed = 0
+        top = 0
+        for code in seats:
+            count = code % stride
+            needed += size - count
+            top = max(top, code // stride + fewest[count])
+        if needed > remaining:
+            return None
+
+        alive = []
+        for code in seats:
+            count = code % stride
+            if code // stride + most[count] < top:
+                # deal the hand from what the others leave over
+                needed -= size - count
+                ways *= comb(remaining - needed, size - count)
+            else:
+                alive.append(code)
+
+        if len(alive) == 1:
+            return (None, ways * comb(remaining, size - alive[0] % stride), 1)
+
+        if all(code % stride == size for code in alive):
+            # alive is sorted, the last code is the top score
+            return (None, ways, alive.count(alive[-1]))
+
+        low = alive[0] // stride * stride
+        return (tuple(code - low for code in alive), ways, 0)
+
+    def _deal(self, states, points):
+        """
+        _deal(states, points):
+            returns the states after dealing a card worth points,
+                either nobody takes it or one of the seats that still
+                needs cards
+        """
+        size = self._hand_size
+        stride = size + 1
+        step = points * stride + 1
+        pending = defaultdict(int)
+        for seats, ways in states.items():
+            # nobody takes this card
+            pending[seats] += ways
+            previous = None
+            for pos, code in enumerate(seats):
+                if code % stride == size or code == previous:
+                    continue
+                previous = code
+                taken = list(seats)
+                taken[pos] = code + step
+                taken.sort()
+                # any of the seats with the same code can take it
+                pending[tuple(taken)] += ways * seats.count(code)
+
+        return pending
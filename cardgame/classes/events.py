@@ -0,0 +1,181 @@
+"""
+events.py:
+    contains game event names, GameEvents() subscriber lists and
+    PhaseTimer() subscriber that times game phases
+"""
+import time
+
+
+# event names, callbacks are called as callback(game, *args)
+GAME_START = 'game_start'           # (game)
+ROUND_START = 'round_start'         # (game, round_num)
+TURN = 'turn'                       # (game, player)
+DRAW = 'draw'                       # (game, player, card)
+SHUFFLE = 'shuffle'                 # (game, deck_mgr)
+RANKINGS = 'rankings'               # (game, rankings)
+GAME_OVER = 'game_over'             # (game)
+
+EVENTS = (
+    GAME_START,
+    ROUND_START,
+    TURN,
+    DRAW,
+    SHUFFLE,
+    RANKINGS,
+    GAME_OVER,
+)
+
+
+class UnknownEventError(Exception):
+    """
+    UnknownEventError:  exception thrown when subscribing to an
+        event that is not in EVENTS
+    """
+
+
+class GameEvents:
+    """
+    GameEvents class:  subscriber lists for game events
+
+    Constructors:
+    GameEvents()
+
+    Methods:
+    subscribe(event, callback):  calls callback on every event
+    unsubscribe(event, callback):  stops calling callback
+    subscribers(event):  returns tuple of callbacks for event
+    emit(event, *args):  calls every callback of event with args
+
+    Notes:
+        subscriber lists are tuples replaced on (un)subscribe,
+        so a callback can unsubscribe while the event is emitted
+
+        CardGame() only creates GameEvents() once something
+        subscribes, until then emitting an event is one
+        attribute check
+    """
+    def __init__(self):
+        self._subscribers = {}
+
+    def __bool__(self):
+        return bool(self._subscribers)
+
+    def subscribe(self, event, callback):
+        """
+        subscribe(event, callback):  calls callback(*args) on
+            every emit(event, *args)
+        """
+        if event not in EVENTS:
+            raise UnknownEventError(event)
+
+        self._subscribers[event] = (
+            self._subscribers.get(event, ()) + (callback,)
+        )
+
+    def unsubscribe(self, event, callback):
+        """
+        unsubscribe(event, callback):  removes callback from event,
+            does nothing if it is not subscribed
+        """
+        callbacks = list(self._subscribers.get(event, ()))
+        if callback not in callbacks:
+            return
+
+        callbacks.remove(callback)
+        if callbacks:
+            self._subscribers[event] = tuple(callbacks)
+        else:
+            del self._subscribers[event]
+
+    def subscribers(self, event):
+        """
+        subscribers(event):  returns tuple of callbacks for event
+        """
+        return self._subscribers.get(event, ())
+
+    def emit(self, event, *args):
+        """
+        emit(event, *args):  calls every callback of event with args
+        """
+        for callback in self._subscribers.get(event, ()):
+            callback(*args)
+
+
+class PhaseTimer:
+    """
+    PhaseTimer class:  subscriber that counts game events and times
+        the phases between them
+
+    Constructors:
+    PhaseTimer(clock=time.perf_counter)
+
+    Methods:
+    attach(game):  subscribes to every event of game
+    detach(game):  unsubscribes from game
+    stats():  {event: {'count', 'total_s', 'mean_s'}}
+    reset():  clears counts and timings
+
+    Notes:
+        time since the previous event is charged to the event that
+        ends it, e.g. 'draw' is the time spent before a card was
+        drawn since the last event, GAME_START only starts the clock
+    """
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._last = None
+        self._counts = {}
+        self._totals = {}
+        self._callbacks = {event: self._recorder(event) for event in EVENTS}
+
+    def _recorder(self, event):
+        def record(*_):
+            now = self._clock()
+            self._counts[event] = self._counts.get(event, 0) + 1
+            if self._last is not None and event != GAME_START:
+                self._totals[event] = (
+                    self._totals.get(event, 0.0) + now - self._last
+                )
+            self._last = now
+
+        return record
+
+    def attach(self, game):
+        """
+        attach(game):  subscribes to every event of game
+        """
+        for event, callback in self._callbacks.items():
+            game.subscribe(event, callback)
+
+    def detach(self, game):
+        """
+        detach(game):  unsubscribes from every event of game
+        """
+        for event, callback in self._callbacks.items():
+            game.unsubscribe(event, callback)
+
+    def stats(self):
+        """
+        stats():  returns {event: {'count', 'total_s', 'mean_s'}}
+            for events seen so far
+        """
+        stats = {}
+        for event in EVENTS:
+            count = self._counts.get(event, 0)
+            if count == 0:
+                continue
+            total = self._totals.get(event, 0.0)
+            stats[event] = {
+                'count': count,
+                'total_s': total,
+                'mean_s': total / count,
+            }
+
+        return stats
+
+    def reset(self):
+        """
+        reset():  clears counts and timings
+        """
+        self._last = None
+        self._counts = {}
+        self._totals = {}
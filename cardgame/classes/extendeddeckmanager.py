@@ -18,11 +18,13 @@ class ExtendedDeckManager(DeckManager):
         ExtendedDeckManager.from_suits_and_values(
             suits_ranking,      # suits list (low to high)
             values_ranking,     # values list (low to high)
+            rng=None,           # optional rng or seed
         )
         ExtendedDeckManager.from_deck(
-            initial_deck,       # list of Card() expected
-            suits_ranking=None, # optional ranking of suits (low to high)
-            values_ranking=None # optional values ranking (low to high)
+            initial_deck,           # list of Card() expected
+            suits_ranking=None,     # optional ranking of suits (low to high)
+            values_ranking=None,    # optional values ranking (low to high)
+            rng=None                # optional rng or seed
         ):
             classmethod where you can supply your own deck, suits ranking and
             values ranking
@@ -35,19 +37,17 @@ class ExtendedDeckManager(DeckManager):
             was created
     """
     @classmethod
-    def from_suits_and_values(cls, suits_ranking, values_ranking):
+    def from_suits_and_values(cls, suits_ranking, values_ranking, rng=None):
         """
-        from_suits_and_values(suits_ranking, values_ranking):
+        from_suits_and_values(suits_ranking, values_ranking, rng=None):
             instantiate ExtendedDeckManager() using supplied
             suits_ranking and values_ranking
 
         NOTE:
         deck is created using ExtendedDeckManager.make_deck()
-            with supplied suits_ranking and values_ranking
+            with supplied suits_ranking and values_ranking,
+            the default 52-card deck is never built
         """
-        # instantiate normal class
-        ret_class = cls()
-
         if suits_ranking is None or not isinstance(suits_ranking, list):
             raise InvalidDeckError
 
@@ -56,9 +56,6 @@ class ExtendedDeckManager(DeckManager):
             # we need at least 1 item
             raise InvalidDeckError
 
-        # make copy to prevent outside modification
-        ret_class._suits_ranking = suits_ranking.copy()
-
         if values_ranking is None or not isinstance(values_ranking, list):
             # we expect a list
             raise InvalidDeckError
@@ -68,21 +65,28 @@ class ExtendedDeckManager(DeckManager):
             # we need at least 1 item
             raise InvalidDeckError
 
-        # make copy to prevent outside modification
-        ret_class._values_ranking = values_ranking.copy()
-
-        # make a copy to prevent outside modifications
-        ret_class._deck = ExtendedDeckManager.make_deck(
-            ret_class._suits_ranking,
-            ret_class._values_ranking
+        # make copies to prevent outside modification
+        return cls(
+            rng,
+            suits_ranking=suits_ranking.copy(),
+            values_ranking=values_ranking.copy()
         )
 
-        return ret_class
-
     @classmethod
-    def from_deck(cls, initial_deck, suits_ranking=None, values_ranking=None):
+    def from_deck(
+        cls,
+        initial_deck,
+        suits_ranking=None,
+        values_ranking=None,
+        rng=None
+    ):
         """
-        from_deck(initial_deck, suits_ranking=None, values_ranking=None):
+        from_deck(
+            initial_deck,
+            suits_ranking=None,
+            values_ranking=None,
+            rng=None
+        ):
             classmethod for creating ExtendedDeckManager() from existing deck
 
         initial_deck is expected to be in natural order
@@ -96,9 +100,6 @@ class ExtendedDeckManager(DeckManager):
 
         # do we care if the supplied deck is empty?
 
-        # instantiate normal class
-        ret_class = cls()
-
         if suits_ranking is not None:
             if (
                 not isinstance(suits_ranking, list) or
@@ -108,7 +109,7 @@ class ExtendedDeckManager(DeckManager):
                 raise InvalidDeckError
 
             # make copy to prevent outside modification
-            ret_class._suits_ranking = suits_ranking.copy()
+            suits_ranking = suits_ranking.copy()
 
         if values_ranking is not None:
             if (
@@ -119,19 +120,21 @@ class ExtendedDeckManager(DeckManager):
                 raise InvalidDeckError
 
             # make copy to prevent outside modification
-            ret_class._values_ranking = values_ranking.copy()
-
-        # make a copy to prevent outside modifications
-        # reverse copy to put top card at end of list
-        ret_class._deck = initial_deck.copy()[::-1]
-
-        return ret_class
+            values_ranking = values_ranking.copy()
+
+        # initial_deck is copied, so the default deck is never built
+        return cls(
+            rng,
+            suits_ranking=suits_ranking,
+            values_ranking=values_ranking,
+            initial_deck=initial_deck
+        )
 
     def empty_deck(self):
         """
         empty_deck():  helper function to empty deck
         """
-        self._deck = []
+        self._set_deck([])
 
     def peek_card(self, index):
         """
@@ -141,6 +144,7 @@ class ExtendedDeckManager(DeckManager):
         NOTE:
         return Card() reference, not copy
         """
+        self._finish_shuffle()
         try:
             # assume index is in natural order and 1-based
             # our internal deck is reversed, so convert
@@ -20,10 +20,14 @@ class Player:
     Attributes:
     name:   Initial name given to Player class
     hand:   returns list of Card() objects currently in this player's hand
+    last_card:  returns last Card() added to hand (None if empty)
     score:  (get/set) player score
 
     Methods:
     draw_card(deck):  Draws a card from supplied deck (DeckManager object)
+    hand_snapshot():  returns tuple of Card() objects in hand
+    iter_hand():  iterates over Card() objects in hand without copying
+    reset():  empties hand and sets score to 0 for a new game
     """
 
     def __init__(self, name):
@@ -32,17 +36,19 @@ class Player:
 
         self._name = name
         self._hand = []
+        # tuple of hand, built on first hand_snapshot() after a change
+        self._hand_snapshot = None
         self._score = 0
 
     def __copy__(self):
         # implement copy method to create copy
         player = Player(self.name)
-        player.hand = self.hand
+        player.hand = self._hand
         player.score = self.score
         return player
 
     def __str__(self):
-        return f"Player('{self.name}', hand={self.hand}, score={self.score})"
+        return f"Player('{self.name}', hand={self._hand}, score={self.score})"
 
     def __repr__(self):
         return str(self)
@@ -65,7 +71,34 @@ class Player:
     def hand(self, new_hand):
         # having a setter for player hand allows for more complicated
         # games rules, like players swapping hands on some condition
-        self._hand = new_hand.copy()
+        self._hand = list(new_hand)
+        self._hand_snapshot = None
+
+    def hand_snapshot(self):
+        """
+        hand_snapshot():  returns tuple of Card() objects in hand
+
+        NOTE:
+        the same tuple is returned until the hand changes
+        """
+        if self._hand_snapshot is None:
+            self._hand_snapshot = tuple(self._hand)
+
+        return self._hand_snapshot
+
+    def iter_hand(self):
+        """
+        iter_hand():  returns iterator over Card() objects in hand
+            without copying the hand
+        """
+        return iter(self._hand)
+
+    @property
+    def last_card(self):
+        """
+        last_card():  returns last Card() added to hand, None if empty
+        """
+        return self._hand[-1] if self._hand else None
 
     @property
     def score(self):
@@ -78,14 +111,33 @@ class Player:
     def score(self, new_score):
         self._score = new_score
 
+    def reset(self):
+        """
+        reset():  empties hand in place and sets score to 0
+        """
+        self._hand.clear()
+        self._hand_snapshot = None
+        self._score = 0
+
     def draw_card(self, deck_mgr):
         """
         draw_card(deck_mgr):
 
-        Draws a card from the deck manager object and adds
-        it to this player's hand
+        Draws a card from the deck manager object, adds
+        it to this player's hand and returns it
 
         if deck is empty will raise error
         do not catch here
         """
-        self._hand.append(deck_mgr.draw_card())
+        card = deck_mgr.draw_card()
+        self._hand.append(card)
+        self._hand_snapshot = None
+        return card
+
+    def add_cards(self, cards):
+        """
+        add_cards(cards):  adds Card() objects to the end of hand,
+            in order
+        """
+        self._hand.extend(cards)
+        self._hand_snapshot = None
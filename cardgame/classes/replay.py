@@ -0,0 +1,446 @@
+"""
+replay.py:
+    contains ReplayWriter() that streams game events to an
+    append-only log and ReplayReader() that replays it lazily
+
+Log format:
+    a stream of frames, each frame is a record type (1 byte),
+    payload size (4 bytes, little-endian) and payload
+
+    game start  game number, format version and player names
+    card        defines a card id (sent the first time a card is seen)
+    shuffle     deck was shuffled
+    round       round number
+    draw        seat (index into player names) and card id
+    snapshot    turn number and snapshot.dump_game() of the game
+    rankings    (seat, score) of players, highest score first
+    game over   end of game
+
+NOTE:
+snapshots are written before the first turn and every
+    snapshot_every turns, ReplayReader.seek() restores the latest
+    snapshot before a turn and plays the remaining turns
+"""
+import os
+import struct
+from bisect import bisect_right
+
+from .card import Card
+from .events import (
+    DRAW,
+    GAME_OVER,
+    GAME_START,
+    RANKINGS,
+    ROUND_START,
+    SHUFFLE,
+    TURN
+)
+from .snapshot import _Reader, _Writer, dump_game, load_game
+
+
+class ReplayError(Exception):
+    """
+    ReplayError:  exception thrown on invalid replay logs or
+        seeking to a game or turn that is not in the log
+    """
+
+
+REPLAY_VERSION = 2
+
+# record types
+GAME_START_RECORD = 1
+CARD_RECORD = 2
+SHUFFLE_RECORD = 3
+ROUND_RECORD = 4
+DRAW_RECORD = 5
+SNAPSHOT_RECORD = 6
+RANKINGS_RECORD = 7
+GAME_OVER_RECORD = 8
+
+_FRAME = struct.Struct('<BI')
+_DRAW = struct.Struct('<IH')
+
+
+def iter_frames(stream):
+    """
+    iter_frames(stream):  generator of (record type, payload)
+        read one frame at a time from binary stream
+    """
+    while True:
+        header = stream.read(_FRAME.size)
+        if not header:
+            return
+        if len(header) < _FRAME.size:
+            raise ReplayError("truncated frame")
+
+        record, size = _FRAME.unpack(header)
+        payload = stream.read(size)
+        if len(payload) < size:
+            raise ReplayError("truncated frame")
+
+        yield (record, payload)
+
+
+class ReplayWriter:
+    """
+    ReplayWriter class:  event subscriber that appends game events
+        to a binary stream
+
+    Constructors:
+    ReplayWriter(stream, snapshot_every=8, buffer_size=65536):
+        stream is a binary file object or a path (opened for append,
+            game numbers and card ids go on from the existing log)
+        snapshot_every is number of turns between snapshots
+        buffer_size is number of bytes buffered before writing
+
+    Methods:
+    attach(game):  logs every event of game
+    detach(game):  stops logging game
+    flush():  writes buffered frames to the stream
+    close():  flushes, closes stream if it was opened from a path
+
+    Notes:
+        frames are buffered and only written when buffer_size is
+        reached, on flush() and on close()
+
+        one writer can log many games one after another
+
+        a file object stream is a new log, game numbers and card ids
+        start at 0
+    """
+    def __init__(self, stream, snapshot_every=8, buffer_size=65536):
+        self._card_ids = {}
+        self._games = 0
+        self._owns_stream = isinstance(stream, str)
+        if self._owns_stream:
+            if os.path.exists(stream):
+                self._resume(stream)
+            stream = open(stream, 'ab')  # pylint: disable=consider-using-with
+        self._stream = stream
+        self._snapshot_every = snapshot_every
+        self._buffer_size = buffer_size
+        self._buffer = bytearray()
+        self._seats = {}
+        self._turns = 0
+        self._callbacks = {
+            GAME_START: self._on_game_start,
+            SHUFFLE: self._on_shuffle,
+            ROUND_START: self._on_round_start,
+            DRAW: self._on_draw,
+            TURN: self._on_turn,
+            RANKINGS: self._on_rankings,
+            GAME_OVER: self._on_game_over,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def games(self):
+        """
+        games:  returns number of games logged
+        """
+        return self._games
+
+    def _resume(self, path):
+        """
+        _resume(path):  reads game numbers and card ids of the log
+            at path, raises ReplayError if it is truncated
+        """
+        with open(path, 'rb') as log:
+            for record, payload in iter_frames(log):
+                if record == GAME_START_RECORD:
+                    game_num = _read_game_start(payload)[0]
+                    self._games = max(self._games, game_num + 1)
+                elif record == CARD_RECORD:
+                    card_id, card = _read_card(payload)
+                    key = (
+                        card.suit,
+                        card.value,
+                        card.suit_value,
+                        card.card_value
+                    )
+                    self._card_ids[key] = card_id
+
+    def attach(self, game):
+        """
+        attach(game):  logs every event of game
+        """
+        for event, callback in self._callbacks.items():
+            game.subscribe(event, callback)
+
+    def detach(self, game):
+        """
+        detach(game):  stops logging game
+        """
+        for event, callback in self._callbacks.items():
+            game.unsubscribe(event, callback)
+
+    def _frame(self, record, payload=b''):
+        self._buffer += _FRAME.pack(record, len(payload))
+        self._buffer += payload
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def _card_id(self, card):
+        key = (card.suit, card.value, card.suit_value, card.card_value)
+        card_id = self._card_ids.get(key)
+        if card_id is None:
+            card_id = len(self._card_ids)
+            self._card_ids[key] = card_id
+            writer = _Writer()
+            writer.pack('H', card_id)
+            writer.text(card.suit)
+            writer.text(card.value)
+            writer.pack('qq', card.suit_value, card.card_value)
+            self._frame(CARD_RECORD, bytes(writer.data))
+
+        return card_id
+
+    def _snapshot(self, game):
+        writer = _Writer()
+        writer.pack('I', self._turns)
+        writer.data += dump_game(game)
+        self._frame(SNAPSHOT_RECORD, bytes(writer.data))
+
+    def _on_game_start(self, game):
+        players = game.get_current_players()
+        self._seats = {id(player): idx for idx, player in enumerate(players)}
+        self._turns = 0
+
+        writer = _Writer()
+        writer.pack('IBI', self._games, REPLAY_VERSION, len(players))
+        for player in players:
+            writer.text(player.name)
+        self._games += 1
+        self._frame(GAME_START_RECORD, bytes(writer.data))
+
+    def _on_shuffle(self, _game, _deck_mgr):
+        self._frame(SHUFFLE_RECORD)
+
+    def _on_round_start(self, game, round_num):
+        self._frame(ROUND_RECORD, struct.pack('<H', round_num))
+        if self._turns == 0:
+            # state after start_game(), before the first draw
+            self._snapshot(game)
+
+    def _on_draw(self, _game, player, card):
+        card_id = self._card_id(card)
+        self._frame(
+            DRAW_RECORD,
+            _DRAW.pack(self._seats[id(player)], card_id)
+        )
+
+    def _on_turn(self, game, _player):
+        self._turns += 1
+        if self._turns % self._snapshot_every == 0:
+            self._snapshot(game)
+
+    def _on_rankings(self, _game, rankings):
+        writer = _Writer()
+        writer.pack('I', len(rankings))
+        for player in rankings:
+            writer.pack('Iq', self._seats[id(player)], player.score)
+        self._frame(RANKINGS_RECORD, bytes(writer.data))
+
+    def _on_game_over(self, _game):
+        self._frame(GAME_OVER_RECORD)
+
+    def flush(self):
+        """
+        flush():  writes buffered frames to the stream
+        """
+        if self._buffer:
+            self._stream.write(self._buffer)
+            self._buffer = bytearray()
+        self._stream.flush()
+
+    def close(self):
+        """
+        close():  flushes, closes stream if it was opened from a path
+        """
+        if self._stream is None:
+            return
+
+        self.flush()
+        if self._owns_stream:
+            self._stream.close()
+        self._stream = None
+
+
+class ReplayReader:
+    """
+    ReplayReader class:  lazily replays a log written by ReplayWriter()
+
+    Constructors:
+    ReplayReader(stream):  binary file object (seekable for seek())
+
+    Methods:
+    events():  generator of (event, data) in log order
+    seek(game_num, turn):  returns game restored after turn turns
+        of game game_num
+
+    Notes:
+        seek() keeps the offset of every snapshot frame, frames
+        are only read once, the payloads it skips are not read
+
+        events() yields events.py names with data:
+            game_start  (game number, [player names])
+            shuffle     None
+            round_start round number
+            draw        (player name, Card())
+            rankings    [(player name, score)]
+            game_over   None
+        snapshots are skipped by events(), only frames are kept
+        in memory, never the whole log
+    """
+    def __init__(self, stream):
+        self._stream = stream
+        self._cards = {}
+        # game number -> ([snapshot turns], [snapshot frame offsets])
+        self._snapshots = {}
+        # stream offset of the first frame not in self._snapshots
+        self._indexed = 0
+        self._indexed_game = None
+
+    def _read_card(self, payload):
+        card_id, card = _read_card(payload)
+        self._cards[card_id] = card
+
+    def events(self):
+        """
+        events():  generator of (event, data) read lazily from
+            the start of the stream
+
+        NOTE:
+        a seekable stream is read from offset 0 and each frame from
+            the generator's own offset, so seek() and events() can be
+            mixed, other streams are read from where they are
+        """
+        names = []
+        for record, payload in self._frames():
+            if record == CARD_RECORD:
+                self._read_card(payload)
+            elif record == GAME_START_RECORD:
+                game_num, names = _read_game_start(payload)
+                yield (GAME_START, (game_num, names))
+            elif record == SHUFFLE_RECORD:
+                yield (SHUFFLE, None)
+            elif record == ROUND_RECORD:
+                yield (ROUND_START, struct.unpack('<H', payload)[0])
+            elif record == DRAW_RECORD:
+                seat, card_id = _DRAW.unpack(payload)
+                yield (DRAW, (names[seat], self._cards[card_id]))
+            elif record == RANKINGS_RECORD:
+                reader = _Reader(payload)
+                (count,) = reader.unpack('I')
+                rankings = []
+                for _ in range(count):
+                    seat, score = reader.unpack('Iq')
+                    rankings.append((names[seat], score))
+                yield (RANKINGS, rankings)
+            elif record == GAME_OVER_RECORD:
+                yield (GAME_OVER, None)
+            elif record != SNAPSHOT_RECORD:
+                raise ReplayError(f"unknown record type {record}")
+
+    def _frames(self):
+        """
+        _frames():  generator of (record type, payload) from the
+            start of the stream, seeks to its own offset before
+            every frame
+        """
+        stream = self._stream
+        if not stream.seekable():
+            yield from iter_frames(stream)
+            return
+
+        offset = 0
+        while True:
+            stream.seek(offset)
+            frame = next(iter_frames(stream), None)
+            if frame is None:
+                return
+
+            offset = stream.tell()
+            yield frame
+
+    def _index(self):
+        """
+        _index():  adds snapshot offsets of frames written since
+            the last call, reads frame headers and skips payloads
+        """
+        stream = self._stream
+        end = stream.seek(0, os.SEEK_END)
+        offset = self._indexed
+        game = self._indexed_game
+        while offset + _FRAME.size <= end:
+            stream.seek(offset)
+            record, size = _FRAME.unpack(stream.read(_FRAME.size))
+            if offset + _FRAME.size + size > end:
+                # frame is still being written
+                break
+
+            if record == GAME_START_RECORD:
+                game_num = _read_game_start(stream.read(size))[0]
+                # logs can repeat a game number, keep the first game
+                game = None
+                if game_num not in self._snapshots:
+                    game = self._snapshots[game_num] = ([], [])
+            elif record == SNAPSHOT_RECORD and game is not None:
+                game[0].append(struct.unpack('<I', stream.read(4))[0])
+                game[1].append(offset)
+
+            offset += _FRAME.size + size
+
+        self._indexed = offset
+        self._indexed_game = game
+
+    def seek(self, game_num, turn):
+        """
+        seek(game_num, turn):
+            returns game (Draw3Game() or LargeDraw3Game(), as
+            logged) of game game_num (0-based) after turn turns,
+            restored from the latest snapshot at or before turn
+        """
+        self._index()
+        turns, offsets = self._snapshots.get(game_num, ((), ()))
+        idx = bisect_right(turns, turn)
+        if idx == 0:
+            raise ReplayError(f"game {game_num} turn {turn} not in log")
+
+        self._stream.seek(offsets[idx - 1])
+        _, payload = next(iter_frames(self._stream))
+        game = load_game(memoryview(payload)[4:])
+        for _ in range(turn - turns[idx - 1]):
+            if game.next_turn() is None:
+                raise ReplayError(f"game {game_num} ended before {turn}")
+
+        return game
+
+
+def _read_card(payload):
+    """
+    _read_card(payload):  returns (card id, Card())
+    """
+    reader = _Reader(payload)
+    (card_id,) = reader.unpack('H')
+    suit = reader.text()
+    value = reader.text()
+    suit_value, card_value = reader.unpack('qq')
+    return (card_id, Card(suit, value, suit_value, card_value))
+
+
+def _read_game_start(payload):
+    """
+    _read_game_start(payload):  returns (game number, [player names])
+    """
+    reader = _Reader(payload)
+    game_num, version, count = reader.unpack('IBI')
+    if version != REPLAY_VERSION:
+        raise ReplayError(f"unsupported replay version {version}")
+
+    return (game_num, [reader.text() for _ in range(count)])
@@ -0,0 +1,198 @@
+"""
+rng.py:  per-instance random number generators for deck managers
+    and card games
+
+any object with shuffle(seq) and randrange(stop) can be used as an
+    rng, make_rng() turns the supported inputs into one:
+        None                    new random.Random() seeded from the OS
+        random.Random()         used as is
+        numpy Generator         wrapped in NumpyRNG()
+        NumpyRNG()              used as is (BatchedPermutationRNG too)
+        shuffle() and randrange()
+                                any other object with both is used
+                                as is
+        anything else           used as seed for random.Random()
+"""
+import random
+from array import array
+
+from .draw3_batch import numpy, require_numpy
+
+# number of sequence lengths BatchedPermutationRNG() keeps batches for
+PERMUTATION_CACHE_SIZE = 8
+# most bytes one BatchedPermutationRNG() batch may take, long
+# sequences get fewer than batch_size permutations per batch
+PERMUTATION_BATCH_BYTES = 4 * 1024 * 1024
+
+
+def make_rng(rng=None):
+    """
+    make_rng(rng=None):  returns rng object for supplied
+        rng, numpy Generator or seed
+    """
+    if rng is None:
+        return random.Random()
+
+    if numpy is not None and isinstance(rng, numpy.random.Generator):
+        return NumpyRNG(rng)
+
+    if hasattr(rng, 'shuffle') and hasattr(rng, 'randrange'):
+        return rng
+
+    return random.Random(rng)
+
+
+def reorder(seq, permutation):
+    """
+    reorder(seq, permutation):  reorders mutable sequence in place
+        so that seq[i] becomes seq[permutation[i]]
+    """
+    items = [seq[idx] for idx in permutation]
+    if isinstance(seq, array):
+        seq[:] = array(seq.typecode, items)
+    else:
+        seq[:] = items
+
+
+class NumpyRNG:
+    """
+    NumpyRNG class:  wraps numpy Generator so it can be
+        used as a deck manager or card game rng
+
+    Constructors:
+    NumpyRNG(generator):  numpy.random.Generator to draw from
+
+    NOTE:
+    requires numpy (raises draw3_batch.NumpyNotAvailable)
+    """
+    def __init__(self, generator):
+        require_numpy()
+        self._generator = generator
+
+    @property
+    def generator(self):
+        """
+        generator:  returns wrapped numpy Generator
+        """
+        return self._generator
+
+    def shuffle(self, seq):
+        """
+        shuffle(seq):  shuffles mutable sequence in place
+        """
+        reorder(seq, self._generator.permutation(len(seq)).tolist())
+
+    def randrange(self, stop):
+        """
+        randrange(stop):  returns random int in [0, stop)
+        """
+        return int(self._generator.integers(stop))
+
+    def getstate(self):
+        """
+        getstate():  returns state of wrapped bit generator
+        """
+        return self._generator.bit_generator.state
+
+    def setstate(self, state):
+        """
+        setstate(state):  restores state from getstate()
+        """
+        self._generator.bit_generator.state = state
+
+
+class BatchedPermutationRNG(NumpyRNG):
+    """
+    BatchedPermutationRNG class:  NumpyRNG() that generates
+        permutations batch_size at a time, so shuffle() only has
+        to reorder the sequence
+
+    Constructors:
+    BatchedPermutationRNG(seed=None, batch_size=1024)
+
+    NOTE:
+    requires numpy (raises draw3_batch.NumpyNotAvailable)
+    one batch (a numpy array) is kept per sequence length that has
+        been shuffled, only the PERMUTATION_CACHE_SIZE most recently
+        used lengths are kept
+    a batch holds at most PERMUTATION_BATCH_BYTES, so long sequences
+        get fewer than batch_size permutations at once
+    """
+    def __init__(self, seed=None, batch_size=1024):
+        super().__init__(require_numpy().random.default_rng(seed))
+        self._batch_size = batch_size
+        # length -> [array of permutations, index of next permutation]
+        # in least recently used order
+        self._batches = {}
+
+    @property
+    def batch_size(self):
+        """
+        batch_size:  returns number of permutations generated at once
+        """
+        return self._batch_size
+
+    def _cache_batch(self, length, batch):
+        """
+        _cache_batch(length, batch):  stores batch as most recently
+            used, drops least recently used lengths
+        """
+        self._batches[length] = batch
+        while len(self._batches) > PERMUTATION_CACHE_SIZE:
+            del self._batches[next(iter(self._batches))]
+
+    def permutation(self, length):
+        """
+        permutation(length):  returns next precomputed permutation
+            of range(length) as a list
+        """
+        batch = self._batches.pop(length, None)
+        if batch is None or batch[1] >= len(batch[0]):
+            # smallest dtype that holds an index keeps the batch compact
+            dtype = numpy.uint16 if length <= 65536 else numpy.int64
+            count = min(
+                self._batch_size,
+                PERMUTATION_BATCH_BYTES // (
+                    max(length, 1) * numpy.dtype(dtype).itemsize
+                )
+            )
+            perms = numpy.tile(
+                numpy.arange(length, dtype=dtype),
+                (max(count, 1), 1)
+            )
+            batch = [self._generator.permuted(perms, axis=1), 0]
+        self._cache_batch(length, batch)
+
+        perm = batch[0][batch[1]].tolist()
+        batch[1] += 1
+        return perm
+
+    def shuffle(self, seq):
+        """
+        shuffle(seq):  shuffles mutable sequence in place using
+            next precomputed permutation
+        """
+        reorder(seq, self.permutation(len(seq)))
+
+    def getstate(self):
+        """
+        getstate():  returns bit generator state and unused
+            precomputed permutations (as lists)
+        """
+        return (
+            super().getstate(),
+            {
+                length: (perms[pos:].tolist(), 0)
+                for length, (perms, pos) in self._batches.items()
+            }
+        )
+
+    def setstate(self, state):
+        """
+        setstate(state):  restores state from getstate()
+        """
+        generator_state, batches = state
+        super().setstate(generator_state)
+        self._batches = {}
+        for length, (perms, pos) in batches.items():
+            self._cache_batch(length, [numpy.array(perms), pos])
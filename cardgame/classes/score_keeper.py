@@ -1 +1,305 @@
-# keeps scores for players
+"""
+score_keeper.py:  keeps scores for players
+
+ScoreKeeper() records game results in an append-only SQLite store
+    (WAL mode) and answers leaderboard queries from indexed tables
+"""
+import sqlite3
+import time
+
+from .cardgame import DuplicatePlayerName
+
+
+# outcome of a game for one player
+LOSS = 0
+TIE = 1
+WIN = 2
+
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS results (
+        game_id INTEGER NOT NULL,
+        player TEXT NOT NULL,
+        score INTEGER NOT NULL,
+        place INTEGER NOT NULL,
+        outcome INTEGER NOT NULL,
+        played_at REAL NOT NULL,
+        PRIMARY KEY (game_id, player)
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS results_by_player
+        ON results (player, game_id)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS player_totals (
+        player TEXT PRIMARY KEY,
+        games INTEGER NOT NULL,
+        wins INTEGER NOT NULL,
+        ties INTEGER NOT NULL,
+        points INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS player_totals_by_wins
+        ON player_totals (wins)
+    """,
+)
+
+
+class ScoreKeeper:
+    """
+    ScoreKeeper class:  persistent, batched store of game results
+
+    Constructors:
+    ScoreKeeper(path=':memory:', batch_size=1000):
+        path is the SQLite database file
+        batch_size is how many games are queued before they
+            are written in one transaction
+
+    Methods:
+    record_game(player_rankings):  queues results of one game
+    flush():  writes queued games in one transaction
+    player_totals(name):  games, wins, ties and points for a player
+    win_counts(limit=None):  [(name, wins)] most wins first
+    recent_history(name, limit=10):  latest results for a player
+    close():  flushes and closes the database
+
+    Notes:
+        results are append-only, player_totals is updated in the
+        same transaction so totals are a single indexed lookup
+
+        queries flush first, so they always include queued games
+
+        one ScoreKeeper() should write to a database at a time,
+        game ids are handed out in memory
+    """
+    def __init__(self, path=':memory:', batch_size=1000):
+        self._batch_size = batch_size
+        self._pending = []
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL keeps the database consistent, only the last commits
+        # can be lost on power failure
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+        row = self._conn.execute(
+            "SELECT COALESCE(MAX(game_id), 0) FROM results"
+        ).fetchone()
+        self._last_game_id = row[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def batch_size(self):
+        """
+        batch_size:  returns number of games written per transaction
+        """
+        return self._batch_size
+
+    @property
+    def pending(self):
+        """
+        pending:  returns number of games waiting to be written
+        """
+        return len(self._pending)
+
+    def record_game(self, player_rankings):
+        """
+        record_game(player_rankings):
+            queues the result of one game from
+            Draw3Game.player_rankings() (highest score first)
+            and returns its game id
+
+        raises DuplicatePlayerName if a player is in the game twice,
+            nothing is queued
+
+        NOTE:
+        writes the queue when it reaches batch_size
+        """
+        names = {player.name for player in player_rankings}
+        if len(names) < len(player_rankings):
+            # would break the (game_id, player) key of the batch
+            raise DuplicatePlayerName
+
+        self._last_game_id += 1
+        played_at = time.time()
+        top_score = player_rankings[0].score if player_rankings else None
+        top_count = sum(1 for p in player_rankings if p.score == top_score)
+
+        rows = []
+        place = 0
+        previous_score = None
+        for idx, player in enumerate(player_rankings):
+            if player.score != previous_score:
+                # tied players share a place
+                place = idx + 1
+                previous_score = player.score
+
+            if player.score != top_score:
+                outcome = LOSS
+            elif top_count == 1:
+                outcome = WIN
+            else:
+                outcome = TIE
+
+            rows.append(
+                (
+                    self._last_game_id,
+                    player.name,
+                    player.score,
+                    place,
+                    outcome,
+                    played_at,
+                )
+            )
+
+        self._pending.append(rows)
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+
+        return self._last_game_id
+
+    def flush(self):
+        """
+        flush():  writes queued games in one transaction
+
+        NOTE:
+        a failed write is rolled back and the games stay queued, so
+            a locked database is written by the next flush()
+        a game that breaks a constraint (sqlite3.IntegrityError)
+            can never be written, the games are then written one by
+            one, only the failing games are dropped and the error
+            is raised
+        """
+        if not self._pending:
+            return
+
+        games = self._pending
+        try:
+            self._write(games)
+        except sqlite3.IntegrityError as err:
+            error = err
+        else:
+            self._pending = []
+            return
+
+        for idx, game in enumerate(games):
+            try:
+                self._write([game])
+            except sqlite3.IntegrityError as err:
+                error = err
+            except sqlite3.Error:
+                # keep the games not written yet
+                self._pending = games[idx:]
+                raise
+
+        self._pending = []
+        raise error
+
+    def _write(self, games):
+        """
+        _write(games):  writes result rows of games and updates
+            player_totals in one transaction
+        """
+        rows = [row for game in games for row in game]
+
+        # combine totals per player so each player is one upsert
+        totals = {}
+        for _, name, score, _, outcome, _ in rows:
+            total = totals.setdefault(name, [0, 0, 0, 0])
+            total[0] += 1
+            total[1] += outcome == WIN
+            total[2] += outcome == TIE
+            total[3] += score
+
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.executemany(
+                """
+                INSERT INTO player_totals VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (player) DO UPDATE SET
+                    games = games + excluded.games,
+                    wins = wins + excluded.wins,
+                    ties = ties + excluded.ties,
+                    points = points + excluded.points
+                """,
+                [(name, *total) for name, total in totals.items()]
+            )
+
+    def player_totals(self, name):
+        """
+        player_totals(name):
+            returns {'games', 'wins', 'ties', 'points'} for player
+        """
+        self.flush()
+        row = self._conn.execute(
+            """
+            SELECT games, wins, ties, points FROM player_totals
+                WHERE player = ?
+            """,
+            (name,)
+        ).fetchone()
+
+        if row is None:
+            row = (0, 0, 0, 0)
+
+        return dict(zip(('games', 'wins', 'ties', 'points'), row))
+
+    def win_counts(self, limit=None):
+        """
+        win_counts(limit=None):
+            returns [(name, wins)] with most wins first
+        """
+        self.flush()
+        return self._conn.execute(
+            """
+            SELECT player, wins FROM player_totals
+                ORDER BY wins DESC, player LIMIT ?
+            """,
+            (-1 if limit is None else limit,)
+        ).fetchall()
+
+    def recent_history(self, name, limit=10):
+        """
+        recent_history(name, limit=10):
+            returns latest results for player, newest first as
+            [{'game_id', 'score', 'place', 'outcome', 'played_at'}]
+        """
+        self.flush()
+        rows = self._conn.execute(
+            """
+            SELECT game_id, score, place, outcome, played_at FROM results
+                WHERE player = ? ORDER BY game_id DESC LIMIT ?
+            """,
+            (name, limit)
+        ).fetchall()
+
+        return [
+            dict(
+                zip(('game_id', 'score', 'place', 'outcome', 'played_at'), row)
+            )
+            for row in rows
+        ]
+
+    def close(self):
+        """
+        close():  writes queued games and closes the database
+        """
+        if self._conn is None:
+            return
+
+        self.flush()
+        self._conn.close()
+        self._conn = None
@@ -0,0 +1,242 @@
+"""
+shoedeckmanager.py:
+    contains ShoeDeckManager() class that keeps a multi-deck shoe
+    as remaining counts per distinct card instead of Card() objects
+"""
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import accumulate, repeat
+
+from .deckmanager import DeckManager, EmptyDeckError, InvalidDeckError
+from .deckview import DeckView
+
+
+class _ShoeCards(Sequence):
+    """
+    _ShoeCards class:  read-only Sequence of a shoe's remaining
+        cards for DeckView(), top of deck at the end
+
+    Notes:
+        keeps a copy of the counts, not one entry per card, cards
+        are found by bisecting the running totals
+    """
+    def __init__(self, cards, counts):
+        self._cards = cards
+        self._counts = tuple(counts)
+        self._ends = list(accumulate(self._counts))
+
+    def __len__(self):
+        return self._ends[-1] if self._ends else 0
+
+    def __getitem__(self, index):
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(index)
+
+        # index 0 is the last card in natural deck order
+        return self._cards[bisect_right(self._ends, size - 1 - index)]
+
+    def __iter__(self):
+        for card, count in zip(reversed(self._cards), reversed(self._counts)):
+            yield from repeat(card, count)
+
+    def __reversed__(self):
+        for card, count in zip(self._cards, self._counts):
+            yield from repeat(card, count)
+
+
+class ShoeDeckManager(DeckManager):
+    """
+    ShoeDeckManager class:  DeckManager() for a shoe of num_decks
+        copies of a deck, stored as a count per distinct card
+
+    Constructors:
+        ShoeDeckManager(
+            num_decks=6,
+            rng=None,
+            suits_ranking=None,
+            values_ranking=None,
+            initial_deck=None
+        ):
+        the shoe holds num_decks copies of the deck DeckManager()
+        would make from the same arguments
+
+    Methods:
+        card_table():  returns tuple of distinct Card() objects
+        composition():  returns {card id: count} of remaining cards
+        remaining:  number of cards left in the shoe
+
+    Notes:
+        memory and construction time depend on the number of
+        distinct cards, not on num_decks
+
+        draw_card() picks a card weighted by the remaining counts,
+        so the shoe is always shuffled, shuffle() and lazy_shuffle()
+        only mark the deck as changed and return nothing
+
+        the shoe has no card order, deck() lists remaining cards
+        in natural deck order and builds one Card() reference per card
+    """
+    def __init__(
+        self,
+        num_decks=6,
+        rng=None,
+        suits_ranking=None,
+        values_ranking=None,
+        initial_deck=None
+    ):
+        if num_decks < 1:
+            raise InvalidDeckError
+
+        self._num_decks = num_decks
+        self._cards = ()
+        self._counts = []
+        self._remaining = 0
+        super().__init__(
+            rng,
+            suits_ranking=suits_ranking,
+            values_ranking=values_ranking,
+            initial_deck=initial_deck
+        )
+
+    def _set_deck(self, cards):
+        """
+        _set_deck(cards):  counts list of Card() objects
+            (top of deck at the end), num_decks times each
+        """
+        table = []
+        counts = []
+        card_ids = {}
+        for card in reversed(cards):
+            # equal cards can have different suit/value names,
+            # so key on the full definition
+            key = (card.suit, card.value, card.suit_value, card.card_value)
+            if key not in card_ids:
+                card_ids[key] = len(table)
+                table.append(card)
+                counts.append(0)
+            counts[card_ids[key]] += self._num_decks
+
+        self._cards = tuple(table)
+        self._counts = counts
+        self._remaining = len(cards) * self._num_decks
+        self._shuffle_pending = False
+        self._version += 1
+
+    @property
+    def num_decks(self):
+        """
+        num_decks:  returns number of decks the shoe was filled with
+        """
+        return self._num_decks
+
+    @property
+    def remaining(self):
+        """
+        remaining:  returns number of cards left in the shoe
+        """
+        return self._remaining
+
+    def card_table(self):
+        """
+        card_table():  returns tuple of distinct Card() objects
+            indexed by card id, in natural deck order
+        """
+        return self._cards
+
+    def composition(self):
+        """
+        composition():  returns {card id: count} of cards left,
+            in natural deck order
+
+        NOTE:
+        keyed by card id (index into card_table()), equal Card()
+            objects with different suit/value names count apart
+        """
+        return {
+            card_id: count
+            for card_id, count in enumerate(self._counts)
+            if count
+        }
+
+    def deck(self):
+        """
+        deck():  returns list of remaining cards in natural deck order
+        """
+        return [
+            card
+            for card, count in zip(self._cards, self._counts)
+            for _ in range(count)
+        ]
+
+    def deck_view(self):
+        """
+        deck_view():  returns read-only DeckView() of deck(),
+            built from the counts without listing every card
+        """
+        return DeckView(self, _ShoeCards(self._cards, self._counts))
+
+    def shuffle(self):
+        """
+        shuffle():  draws are always random, only marks the shoe
+            as changed
+
+        NOTE:
+        unlike DeckManager.shuffle() nothing is returned, listing a
+            large shoe costs more than the shuffle, use deck()
+        """
+        self._version += 1
+
+    def lazy_shuffle(self):
+        """
+        lazy_shuffle():  draws are always random, only marks the shoe
+            as changed
+        """
+        self._version += 1
+
+    def sort(self):
+        """
+        sort():  returns remaining cards sorted by self.sort_algo
+            (smallest first), draws stay random
+        """
+        return self._sorted_cards(self.deck())
+
+    def draw_card(self):
+        """
+        draw_card():
+            removes a random card, weighted by the remaining counts,
+            and returns it
+            returns EmptyDeckError exception on empty shoe
+        """
+        if self._remaining == 0:
+            raise EmptyDeckError
+
+        # scan is over distinct cards, not over cards in the shoe
+        pick = self._rng.randrange(self._remaining)
+        counts = self._counts
+        for idx, count in enumerate(counts):
+            if pick < count:
+                counts[idx] -= 1
+                self._remaining -= 1
+                self._version += 1
+                return self._cards[idx]
+            pick -= count
+
+        # counts always add up to self._remaining
+        raise EmptyDeckError  # pragma: no cover
+
+    def draw_cards(self, num_cards):
+        """
+        draw_cards(num_cards):
+            draws num_cards with draw_card() and returns them as a
+            list, first card drawn first
+            raises EmptyDeckError if the shoe has fewer than num_cards
+        """
+        if num_cards < 0:
+            raise ValueError("num_cards must not be negative")
+        if num_cards > self._remaining:
+            raise EmptyDeckError
+
+        return [self.draw_card() for _ in range(num_cards)]
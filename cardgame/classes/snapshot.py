@@ -0,0 +1,584 @@
+# pylint:  disable=protected-access
+"""
+snapshot.py:
+    dump_game() and load_game() save and restore a whole Draw3Game()
+    as a compact binary blob
+
+Blob layout (little-endian):
+    header      b'D3G' and format version
+    game        rules, flags, turn and round numbers
+    rng         game rng state, unused BatchedPermutationRNG()
+                permutations as packed one, two or four byte
+                indexes
+    card table  distinct cards, every card below is an id into it
+    deck        deck manager type, rankings, template (the deck reset()
+                goes back to) and cards (or shoe counts)
+    players     name, score and hand of every player, turn order
+    seats       LargeDraw3Game() only, deck sizing and the
+                TurnScheduler() state (removed and skipped seats)
+
+NOTE:
+card ids are one byte when the table has at most 256 cards
+    and two bytes otherwise
+event subscribers and overridden methods are not saved
+"""
+import json
+import random
+import struct
+from itertools import chain
+
+from .card import Card
+from .cardgame_draw3 import Draw3Game
+from .cardgame_draw3_large import LargeDraw3Game
+from .compactdeckmanager import CompactDeckManager
+from .deckmanager import DeckManager
+from .extendeddeckmanager import ExtendedDeckManager
+from .player import Player
+from .rng import BatchedPermutationRNG, NumpyRNG
+from .shoedeckmanager import ShoeDeckManager
+from .draw3_batch import numpy, require_numpy
+
+
+class SnapshotError(Exception):
+    """
+    SnapshotError:  exception thrown when a game can not be saved
+        or a blob can not be restored
+    """
+
+
+MAGIC = b'D3G'
+FORMAT_VERSION = 4
+
+# deck manager types that can be saved, index is stored in the blob
+DECK_TYPES = (
+    DeckManager,
+    ExtendedDeckManager,
+    CompactDeckManager,
+    ShoeDeckManager,
+)
+
+# rng kinds
+_RNG_RANDOM = 0
+_RNG_NUMPY = 1
+_RNG_BATCHED = 2
+
+# game flags
+_RANDOM_TURN_ORDER = 1
+_AUTO_SHUFFLE = 2
+_LAZY_SHUFFLE = 4
+_SHUFFLE_PENDING = 8
+_SHARED_RNG = 16
+_LARGE_GAME = 32
+
+_MT_STATE_SIZE = 625
+
+
+class _Writer:
+    """
+    _Writer():  appends little-endian values to a bytearray
+    """
+    def __init__(self):
+        self.data = bytearray()
+
+    def pack(self, fmt, *values):
+        """
+        pack(fmt, *values):  appends struct packed values
+        """
+        self.data += struct.pack('<' + fmt, *values)
+
+    def text(self, value):
+        """
+        text(value):  appends length-prefixed utf-8 string
+        """
+        if not isinstance(value, str):
+            raise SnapshotError(f"can not save {value!r}")
+
+        encoded = value.encode('utf-8')
+        self.pack('I', len(encoded))
+        self.data += encoded
+
+    def blob(self, value):
+        """
+        blob(value):  appends length-prefixed bytes
+        """
+        self.pack('I', len(value))
+        self.data += value
+
+    def ids(self, code, ids):
+        """
+        ids(code, ids):  appends count and card ids
+        """
+        self.pack('I', len(ids))
+        self.pack(f'{len(ids)}{code}', *ids)
+
+
+class _Reader:
+    """
+    _Reader(data):  reads values written by _Writer()
+    """
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def unpack(self, fmt):
+        """
+        unpack(fmt):  returns tuple of struct unpacked values
+        """
+        fmt = '<' + fmt
+        try:
+            values = struct.unpack_from(fmt, self.data, self.pos)
+        except struct.error as err:
+            raise SnapshotError("truncated snapshot") from err
+
+        self.pos += struct.calcsize(fmt)
+        return values
+
+    def blob(self):
+        """
+        blob():  returns length-prefixed bytes
+        """
+        (size,) = self.unpack('I')
+        if self.pos + size > len(self.data):
+            raise SnapshotError("truncated snapshot")
+
+        value = bytes(self.data[self.pos:self.pos + size])
+        self.pos += size
+        return value
+
+    def text(self):
+        """
+        text():  returns length-prefixed utf-8 string
+        """
+        return self.blob().decode('utf-8')
+
+    def ids(self, code):
+        """
+        ids(code):  returns list of card ids
+        """
+        (count,) = self.unpack('I')
+        return list(self.unpack(f'{count}{code}'))
+
+
+def _json_blob(writer, value):
+    try:
+        writer.blob(json.dumps(value).encode('utf-8'))
+    except TypeError as type_err:
+        raise SnapshotError("can not save rng state") from type_err
+
+
+def _dump_rng(writer, rng):
+    if type(rng) is random.Random:  # pylint: disable=unidiomatic-typecheck
+        version, mt_state, gauss_next = rng.getstate()
+        writer.pack('BB', _RNG_RANDOM, version)
+        writer.pack(f'{_MT_STATE_SIZE}I', *mt_state)
+        writer.pack('?d', gauss_next is not None, gauss_next or 0.0)
+    elif isinstance(rng, BatchedPermutationRNG):
+        writer.pack('BI', _RNG_BATCHED, rng.batch_size)
+        _json_blob(writer, NumpyRNG.getstate(rng))
+        # unused permutations are read from the batches as arrays,
+        # getstate() would turn them into lists
+        writer.pack('I', len(rng._batches))
+        for length, (perms, pos) in rng._batches.items():
+            writer.pack('II', length, len(perms) - pos)
+            writer.blob(perms[pos:].astype(_perm_dtype(length)).tobytes())
+    elif isinstance(rng, NumpyRNG):
+        writer.pack('B', _RNG_NUMPY)
+        _json_blob(writer, rng.getstate())
+    else:
+        raise SnapshotError(f"can not save rng {type(rng).__name__}")
+
+
+def _perm_dtype(length):
+    """
+    _perm_dtype(length):  returns little-endian numpy dtype for
+        indexes of permutations of range(length)
+    """
+    if length <= 256:
+        return '<u1'
+
+    return '<u2' if length <= 65536 else '<u4'
+
+
+def _load_batches(reader):
+    """
+    _load_batches(reader):  returns {length: (permutations, 0)}
+        written by _dump_rng() for BatchedPermutationRNG.setstate()
+    """
+    (count,) = reader.unpack('I')
+    batches = {}
+    for _ in range(count):
+        length, rows = reader.unpack('II')
+        try:
+            perms = numpy.frombuffer(
+                reader.blob(), dtype=_perm_dtype(length)
+            ).reshape((rows, length))
+        except ValueError as value_err:
+            raise SnapshotError("invalid permutations") from value_err
+        batches[length] = (perms, 0)
+
+    return batches
+
+
+def _numpy_generator(state):
+    bit_generator = getattr(require_numpy().random, state['bit_generator'])
+    return numpy.random.Generator(bit_generator())
+
+
+def _load_rng(reader):
+    (kind,) = reader.unpack('B')
+    if kind == _RNG_RANDOM:
+        (version,) = reader.unpack('B')
+        mt_state = reader.unpack(f'{_MT_STATE_SIZE}I')
+        has_gauss, gauss_next = reader.unpack('?d')
+        rng = random.Random()
+        rng.setstate(
+            (version, mt_state, gauss_next if has_gauss else None)
+        )
+    elif kind == _RNG_BATCHED:
+        (batch_size,) = reader.unpack('I')
+        rng = BatchedPermutationRNG(batch_size=batch_size)
+        generator_state = json.loads(reader.blob())
+        rng.setstate((generator_state, _load_batches(reader)))
+    elif kind == _RNG_NUMPY:
+        state = json.loads(reader.blob())
+        rng = NumpyRNG(_numpy_generator(state))
+        rng.setstate(state)
+    else:
+        raise SnapshotError(f"unknown rng kind {kind}")
+
+    return rng
+
+
+def _deck_cards(deck_mgr):
+    """
+    _deck_cards(deck_mgr):  returns (cards, counts) of deck_mgr,
+        cards in natural order, counts only for shoes
+    """
+    if isinstance(deck_mgr, ShoeDeckManager):
+        # counts line up with the distinct cards of the template
+        return ([], deck_mgr._counts)
+
+    if isinstance(deck_mgr, CompactDeckManager):
+        table = deck_mgr._cards
+        cards = [table[card_id] for card_id in reversed(deck_mgr._deck)]
+        return (cards, None)
+
+    # read internal list so a pending lazy shuffle is not finished
+    return (deck_mgr._deck[::-1], None)
+
+
+def _card_table(cards):
+    """
+    _card_table(cards):  returns (table, {card key: id}) of the
+        distinct cards in cards, in order first seen
+    """
+    table = []
+    card_ids = {}
+    for card in cards:
+        key = (card.suit, card.value, card.suit_value, card.card_value)
+        if key not in card_ids:
+            card_ids[key] = len(table)
+            table.append(card)
+
+    return (table, card_ids)
+
+
+def _dump_table(writer, code, table):
+    """
+    _dump_table(writer, code, table):  writes card id code and
+        card table
+    """
+    writer.pack('c', code.encode('ascii'))
+    writer.pack('I', len(table))
+    for card in table:
+        writer.text(card.suit)
+        writer.text(card.value)
+        writer.pack('qq', card.suit_value, card.card_value)
+
+
+def _dump_deck(writer, deck_mgr, code, card_ids):
+    """
+    _dump_deck(writer, deck_mgr, code, card_ids):  writes deck
+        manager type, rankings and the template and deck card_ids
+    """
+    writer.pack('B', DECK_TYPES.index(type(deck_mgr)))
+    for ranking in (deck_mgr._suits_ranking, deck_mgr._values_ranking):
+        writer.pack('I', len(ranking))
+        for name in ranking:
+            writer.text(name)
+
+    for ids in card_ids:
+        writer.ids(code, ids)
+
+
+def _dump_players(writer, players, code, encode):
+    """
+    _dump_players(writer, players, code, encode):  writes name,
+        score and hand of every player, encode() turns cards into
+        card ids
+    """
+    writer.pack('I', len(players))
+    for player in players:
+        writer.text(player.name)
+        writer.pack('q', player.score)
+        writer.ids(code, encode(player.iter_hand()))
+
+
+def dump_game(game):
+    """
+    dump_game(game):
+        returns bytes with the state of Draw3Game() game, its deck
+        manager, players and rng
+        raises SnapshotError if something can not be saved
+    """
+    deck_mgr = game._deck_mgr
+    if deck_mgr is None:
+        raise SnapshotError("game has no deck")
+
+    if type(deck_mgr) not in DECK_TYPES:
+        raise SnapshotError(
+            f"can not save deck manager {type(deck_mgr).__name__}"
+        )
+
+    template = deck_mgr._template[::-1]
+    deck, counts = _deck_cards(deck_mgr)
+    players = game._players
+
+    hands = [card for player in players for card in player.iter_hand()]
+    table, card_ids = _card_table(chain(hands, template, deck))
+    if len(table) > 65536:
+        raise SnapshotError("too many distinct cards")
+    code = 'B' if len(table) <= 256 else 'H'
+
+    def encode(cards):
+        return [
+            card_ids[(card.suit, card.value, card.suit_value,
+                      card.card_value)]
+            for card in cards
+        ]
+
+    flags = (
+        (_RANDOM_TURN_ORDER if game.random_turn_order else 0)
+        | (_AUTO_SHUFFLE if game.auto_shuffle else 0)
+        | (_LAZY_SHUFFLE if game.lazy_shuffle else 0)
+        | (_SHUFFLE_PENDING if deck_mgr.shuffle_pending else 0)
+        | (_SHARED_RNG if deck_mgr.rng is game.rng else 0)
+        | (_LARGE_GAME if isinstance(game, LargeDraw3Game) else 0)
+    )
+
+    writer = _Writer()
+    writer.data += MAGIC
+    writer.pack('B', FORMAT_VERSION)
+    writer.pack(
+        'BHIHII',
+        flags,
+        game._min_players,
+        game._max_players,
+        game._num_rounds,
+        game._turn_num,
+        game._round_num
+    )
+
+    _dump_rng(writer, game.rng)
+    if not flags & _SHARED_RNG:
+        _dump_rng(writer, deck_mgr.rng)
+
+    _dump_table(writer, code, table)
+    _dump_deck(writer, deck_mgr, code, [encode(template), encode(deck)])
+    if counts is not None:
+        writer.pack('I', deck_mgr.num_decks)
+        writer.pack('I', len(counts))
+        writer.pack(f'{len(counts)}I', *counts)
+
+    _dump_players(writer, players, code, encode)
+    writer.ids('I', game._turn_order)
+    if flags & _LARGE_GAME:
+        _dump_seats(writer, game)
+
+    return bytes(writer.data)
+
+
+def _dump_seats(writer, game):
+    """
+    _dump_seats(writer, game):  writes deck sizing and turn
+        scheduler state of LargeDraw3Game() game
+    """
+    seats, current, skipped = game._scheduler.getstate()
+    writer.pack('?II', game._auto_deck, game._deck_size, game._num_decks)
+    writer.ids('I', seats)
+    writer.pack('q', -1 if current is None else current)
+    writer.ids('I', skipped)
+
+
+def _load_seats(reader, game):
+    """
+    _load_seats(reader, game):  restores deck sizing, turn scheduler
+        and player names of LargeDraw3Game() game
+    """
+    game._auto_deck, game._deck_size, game._num_decks = reader.unpack('?II')
+    seats = reader.ids('I')
+    (current,) = reader.unpack('q')
+    skipped = reader.ids('I')
+    try:
+        game._scheduler.setstate(
+            (seats, None if current < 0 else current, skipped)
+        )
+    except ValueError as value_err:
+        raise SnapshotError("invalid turn order") from value_err
+
+    players = game._players
+    if any(seat >= len(players) for seat in seats):
+        raise SnapshotError("invalid turn order")
+
+    # removed players keep their seat but not their name
+    game._names = {
+        players[seat].name.casefold(): seat for seat in sorted(seats)
+    }
+
+
+def _load_table(reader):
+    """
+    _load_table(reader):  returns (card id code, card table)
+    """
+    code = reader.unpack('c')[0].decode('ascii')
+    if code not in ('B', 'H'):
+        raise SnapshotError("invalid card id size")
+
+    (table_size,) = reader.unpack('I')
+    table = []
+    for _ in range(table_size):
+        suit = reader.text()
+        value = reader.text()
+        suit_value, card_value = reader.unpack('qq')
+        table.append(Card(suit, value, suit_value, card_value))
+
+    return (code, table)
+
+
+def _load_deck(reader, code, table, deck_rng):
+    """
+    _load_deck(reader, code, table, deck_rng):
+        returns deck manager restored with cards from table,
+        raises IndexError on an invalid card id
+    """
+    (deck_type,) = reader.unpack('B')
+    if deck_type >= len(DECK_TYPES):
+        raise SnapshotError(f"unknown deck manager type {deck_type}")
+
+    rankings = []
+    for _ in range(2):
+        (count,) = reader.unpack('I')
+        rankings.append([reader.text() for _ in range(count)])
+
+    template = [table[card_id] for card_id in reader.ids(code)]
+    deck = [table[card_id] for card_id in reader.ids(code)]
+    deck_cls = DECK_TYPES[deck_type]
+    if deck_cls is not ShoeDeckManager:
+        deck_mgr = deck_cls(
+            deck_rng,
+            suits_ranking=rankings[0],
+            values_ranking=rankings[1],
+            initial_deck=template
+        )
+        deck_mgr._set_deck(deck[::-1])
+        return deck_mgr
+
+    (num_decks,) = reader.unpack('I')
+    (count,) = reader.unpack('I')
+    counts = list(reader.unpack(f'{count}I'))
+    deck_mgr = ShoeDeckManager(
+        num_decks,
+        deck_rng,
+        suits_ranking=rankings[0],
+        values_ranking=rankings[1],
+        initial_deck=template
+    )
+    deck_mgr._counts = counts
+    deck_mgr._remaining = sum(counts)
+    return deck_mgr
+
+
+def _load_players(reader, game, code, table):
+    """
+    _load_players(reader, game, code, table):
+        adds saved players with their scores and hands to game,
+        raises IndexError on an invalid card id
+    """
+    large = isinstance(game, LargeDraw3Game)
+    (num_players,) = reader.unpack('I')
+    for _ in range(num_players):
+        name = reader.text()
+        if large:
+            # names of removed players can be taken again,
+            # _load_seats() rebuilds the names in the game
+            game._players.append(Player(name))
+        else:
+            game.add_player(name)
+        player = game._players[-1]
+        (player.score,) = reader.unpack('q')
+        player.hand = [table[card_id] for card_id in reader.ids(code)]
+
+
+def _new_game(game_cls, game_rng, header, deck_mgr):
+    """
+    _new_game(game_cls, game_rng, header, deck_mgr):
+        returns game_cls() with the rules and flags of header,
+        set up with deck_mgr
+    """
+    flags, min_players, max_players, num_rounds = header[:4]
+    game = game_cls(game_rng)
+    game._min_players = min_players
+    game._max_players = max_players
+    game._num_rounds = num_rounds
+    game.random_turn_order = bool(flags & _RANDOM_TURN_ORDER)
+    game.auto_shuffle = bool(flags & _AUTO_SHUFFLE)
+    game.lazy_shuffle = bool(flags & _LAZY_SHUFFLE)
+    game.setup_game(deck_mgr=deck_mgr)
+    return game
+
+
+def load_game(data, game_cls=None):
+    """
+    load_game(data, game_cls=None):
+        returns new game_cls() restored from dump_game() bytes,
+        None restores a LargeDraw3Game() or Draw3Game() as saved
+        raises SnapshotError on invalid data or if game_cls is not
+        a LargeDraw3Game() for a large game (and the other way)
+    """
+    if bytes(data[:len(MAGIC)]) != MAGIC:
+        raise SnapshotError("not a game snapshot")
+
+    reader = _Reader(data)
+    reader.pos = len(MAGIC)
+    (version,) = reader.unpack('B')
+    if version != FORMAT_VERSION:
+        raise SnapshotError(f"unsupported snapshot version {version}")
+
+    # flags, min and max players, rounds, turn and round numbers
+    header = reader.unpack('BHIHII')
+    flags = header[0]
+    large = bool(flags & _LARGE_GAME)
+    if game_cls is None:
+        game_cls = LargeDraw3Game if large else Draw3Game
+    elif issubclass(game_cls, LargeDraw3Game) != large:
+        raise SnapshotError(f"can not restore as {game_cls.__name__}")
+
+    game_rng = _load_rng(reader)
+    deck_rng = game_rng if flags & _SHARED_RNG else _load_rng(reader)
+    code, table = _load_table(reader)
+
+    try:
+        deck_mgr = _load_deck(reader, code, table, deck_rng)
+        deck_mgr._shuffle_pending = bool(flags & _SHUFFLE_PENDING)
+
+        game = _new_game(game_cls, game_rng, header, deck_mgr)
+        _load_players(reader, game, code, table)
+    except IndexError as idx_err:
+        raise SnapshotError("invalid card id") from idx_err
+
+    game._turn_order = reader.ids('I')
+    if large:
+        _load_seats(reader, game)
+    game._turn_num, game._round_num = header[4:]
+
+    return game
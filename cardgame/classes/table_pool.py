@@ -0,0 +1,94 @@
+"""
+table_pool.py:
+    contains TablePool() class that keeps finished games so they can
+    be reset and played again instead of building new ones
+"""
+from .cardgame_draw3 import Draw3Game
+
+
+class TablePool:
+    """
+    TablePool class:  pool of reusable games keyed by player names
+
+    Constructors:
+    TablePool(game_cls=Draw3Game, max_idle=64):
+        game_cls makes new games, game_cls(seed) and
+            setup_game(player_names=...) are called
+        max_idle is number of released games kept for reuse
+
+    Methods:
+    acquire(player_names, seed=None):  returns game ready to start
+    release(game):  resets game and keeps it for the next acquire()
+    hits:  number of acquire() calls that reused a game
+    misses:  number of acquire() calls that built a new game
+
+    Notes:
+        a reused game is reseeded with rng.seed(seed), so it plays
+        the same as game_cls(seed) (requires the default
+        random.Random() rng)
+
+        settings (random_turn_order, auto_shuffle...) and event
+        subscribers of a released game are kept
+    """
+    def __init__(self, game_cls=Draw3Game, max_idle=64):
+        self._game_cls = game_cls
+        self._max_idle = max_idle
+        # tuple of player names -> list of idle games
+        self._idle = {}
+        self._idle_count = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return self._idle_count
+
+    @property
+    def hits(self):
+        """
+        hits:  returns number of games reused by acquire()
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        misses:  returns number of games built by acquire()
+        """
+        return self._misses
+
+    def acquire(self, player_names, seed=None):
+        """
+        acquire(player_names, seed=None):
+            returns an idle game with the same player names or a
+            new game, ready for start_game()
+        """
+        key = tuple(player_names)
+        games = self._idle.get(key)
+        if games:
+            game = games.pop()
+            if not games:
+                # rosters that are not played again do not keep a key
+                del self._idle[key]
+            self._idle_count -= 1
+            self._hits += 1
+            if seed is not None:
+                game.rng.seed(seed)
+            return game
+
+        self._misses += 1
+        game = self._game_cls(seed)
+        game.setup_game(player_names=list(player_names))
+        return game
+
+    def release(self, game):
+        """
+        release(game):  resets game and keeps it for reuse,
+            games past max_idle are dropped
+        """
+        if self._idle_count >= self._max_idle:
+            return
+
+        game.reset()
+        names = tuple(player.name for player in game.get_current_players())
+        self._idle.setdefault(names, []).append(game)
+        self._idle_count += 1
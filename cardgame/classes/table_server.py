@@ -0,0 +1,530 @@
+"""
+table_server.py:
+    contains TableServer() asyncio server that hosts many Draw3Game()
+    tables in one process and TableClient() in-process client
+
+Protocol:
+    newline-delimited JSON over TCP or a Unix socket, every request
+    gets one response in order:
+        {"op": "create"}                    -> {"ok": true, "table": id}
+        {"op": "join", "table": id, "name": name}
+        {"op": "start", "table": id}
+        {"op": "turn", "table": id}         -> {"ok": true, "player",
+                                                "card", "score"}
+        {"op": "state", "table": id}        -> {"ok": true, "state",
+                                                "round", "players"}
+        {"op": "leave", "table": id}        -> stops events from table
+    failures are {"ok": false, "error": name of exception}
+
+    connections that joined a table also get events, which have an
+    "event" key instead of "ok":
+        {"event": "draw", "table", "player", "card", "score"}
+        {"event": "game_over", "table", "winners", "scores"}
+
+    tables that are over and have no connections left watching them
+    are closed when a new table needs room
+"""
+import asyncio
+import json
+import random
+
+from .cardgame import DuplicatePlayerName
+from .cardgame_draw3 import Draw3Game
+from .events import DRAW, GAME_OVER
+
+
+class TableNotFound(Exception):
+    """
+    TableNotFound:  exception thrown for requests to unknown tables
+    """
+
+
+class TableLimitHit(Exception):
+    """
+    TableLimitHit:  exception thrown when creating more than
+        max_tables tables
+    """
+
+
+class GameInProgress(Exception):
+    """
+    GameInProgress:  exception thrown when joining or starting a
+        table whose game is being played
+    """
+
+
+class GameNotStarted(Exception):
+    """
+    GameNotStarted:  exception thrown when playing a turn at a
+        table whose game has not started
+    """
+
+
+class GameOver(Exception):
+    """
+    GameOver:  exception thrown when playing a turn at a table
+        whose game is over
+    """
+
+
+class InvalidRequest(Exception):
+    """
+    InvalidRequest:  exception thrown for malformed requests
+    """
+
+
+# table states
+WAITING = 'waiting'
+PLAYING = 'playing'
+OVER = 'over'
+
+
+def card_json(card):
+    """
+    card_json(card):  returns JSON-ready dict of Card()
+    """
+    return {'suit': card.suit, 'value': card.value}
+
+
+class Table:
+    """
+    Table class:  one Draw3Game() and the connections watching it
+
+    Constructors:
+    Table(table_id, rng=None)
+    """
+    def __init__(self, table_id, rng=None):
+        self.table_id = table_id
+        self.game = Draw3Game(rng)
+        self.game.setup_game()
+        self.state = WAITING
+        self.watchers = set()
+        self._names = set()
+        self.game.subscribe(DRAW, self._on_draw)
+        self.game.subscribe(GAME_OVER, self._on_game_over)
+
+    def add_player(self, name):
+        """
+        add_player(name):  adds player through CardGame.add_player()
+        """
+        if self.state != WAITING:
+            raise GameInProgress
+        if isinstance(name, str) and name.casefold() in self._names:
+            raise DuplicatePlayerName
+
+        self.game.add_player(name)
+        self._names.add(name.casefold())
+
+    def broadcast(self, message):
+        """
+        broadcast(message):  queues message on every watcher
+        """
+        for conn in list(self.watchers):
+            conn.send_event(message)
+
+    def _on_draw(self, _game, player, card):
+        self.broadcast(
+            {
+                'event': 'draw',
+                'table': self.table_id,
+                'player': player.name,
+                'card': card_json(card),
+                'score': player.score,
+            }
+        )
+
+    def _on_game_over(self, game):
+        self.state = OVER
+        self.broadcast(
+            {
+                'event': 'game_over',
+                'table': self.table_id,
+                'winners': [p.name for p in game.winners()],
+                'scores': {
+                    p.name: p.score for p in game.get_current_players()
+                },
+            }
+        )
+
+
+class Connection:
+    """
+    Connection class:  one client connection with a bounded
+        write queue drained by its own task
+
+    Constructors:
+    Connection(writer, queue_size)
+
+    Notes:
+        responses wait for room in the queue, so a slow client stops
+        its own requests from being read, events that do not fit
+        close the connection instead of blocking the table
+    """
+    def __init__(self, writer, queue_size):
+        self._writer = writer
+        self._queue = asyncio.Queue(maxsize=queue_size)
+        self._task = asyncio.ensure_future(self._drain())
+        self.tables = set()
+        self.closed = False
+
+    async def _drain(self):
+        try:
+            while True:
+                line = await self._queue.get()
+                if line is None:
+                    break
+                self._writer.write(line)
+                await self._writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.closed = True
+            self._writer.close()
+
+    @staticmethod
+    def _encode(message):
+        return json.dumps(message, separators=(',', ':')).encode() + b'\n'
+
+    async def send(self, message):
+        """
+        send(message):  queues message, waits while the queue is full,
+            drops it if the connection closes while waiting
+        """
+        if self.closed:
+            return
+
+        line = self._encode(message)
+        try:
+            self._queue.put_nowait(line)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        # the drain task ends on abort(), then nothing makes room
+        put = asyncio.ensure_future(self._queue.put(line))
+        await asyncio.wait(
+            (put, self._task), return_when=asyncio.FIRST_COMPLETED
+        )
+        put.cancel()
+
+    def send_event(self, message):
+        """
+        send_event(message):  queues message, closes the connection
+            if the queue is full
+        """
+        if self.closed:
+            return
+
+        try:
+            self._queue.put_nowait(self._encode(message))
+        except asyncio.QueueFull:
+            self.abort()
+
+    def abort(self):
+        """
+        abort():  drops queued messages and closes the connection
+        """
+        self.closed = True
+        self._task.cancel()
+
+    async def close(self):
+        """
+        close():  writes queued messages and closes the connection
+        """
+        if not self.closed:
+            await self._queue.put(None)
+        await asyncio.gather(self._task, return_exceptions=True)
+
+
+class TableServer:
+    """
+    TableServer class:  hosts Draw3Game() tables for many
+        connections on one event loop
+
+    Constructors:
+    TableServer(max_tables=10000, queue_size=64, seed=None):
+        max_tables limits number of open tables, tables whose
+            watchers all left are closed to make room
+        queue_size is number of messages queued per connection
+        seed seeds the rngs of new tables
+
+    Methods:
+    handle(conn, request):  returns response for one request
+    start_tcp(host='127.0.0.1', port=0):  starts listening on TCP
+    start_unix(path):  starts listening on a Unix socket
+    close():  stops listening and closes connections
+
+    Notes:
+        every request runs to completion on the event loop, tables
+        need no locks
+    """
+    def __init__(self, max_tables=10000, queue_size=64, seed=None):
+        self._max_tables = max_tables
+        self._queue_size = queue_size
+        self._seeds = random.Random(seed)
+        self._tables = {}
+        # tables nobody watches any more, closed to make room
+        self._unwatched = {}
+        self._next_table_id = 1
+        self._connections = set()
+        self._serve_tasks = set()
+        self._server = None
+        self._ops = {
+            'create': self._create,
+            'join': self._join,
+            'start': self._start,
+            'turn': self._turn,
+            'state': self._state,
+            'leave': self._leave,
+        }
+
+    @property
+    def tables(self):
+        """
+        tables:  returns number of open tables
+        """
+        return len(self._tables)
+
+    @property
+    def address(self):
+        """
+        address:  returns address the server listens on
+        """
+        return self._server.sockets[0].getsockname()
+
+    def _table(self, request):
+        table = self._tables.get(request.get('table'))
+        if table is None:
+            raise TableNotFound
+        return table
+
+    def _watch(self, conn, table):
+        # conn is None when handle() is called without a connection
+        if conn is not None:
+            table.watchers.add(conn)
+            conn.tables.add(table)
+            self._unwatched.pop(table.table_id, None)
+
+    def _evict(self):
+        """
+        _evict():  closes tables whose last watcher left, waiting,
+            playing or over, and unwatched tables that are over
+        """
+        for table_id in self._unwatched:
+            del self._tables[table_id]
+        self._unwatched.clear()
+
+    def _create(self, conn, _request):
+        if len(self._tables) >= self._max_tables:
+            self._evict()
+        if len(self._tables) >= self._max_tables:
+            raise TableLimitHit
+
+        table_id = self._next_table_id
+        self._next_table_id += 1
+        table = Table(table_id, self._seeds.getrandbits(64))
+        self._tables[table_id] = table
+        self._watch(conn, table)
+        return {'table': table_id}
+
+    def _join(self, conn, request):
+        table = self._table(request)
+        table.add_player(request.get('name'))
+        self._watch(conn, table)
+        return {'players': table.game.get_turn_order()}
+
+    def _start(self, _conn, request):
+        table = self._table(request)
+        if table.state == PLAYING:
+            raise GameInProgress
+        if table.state == OVER:
+            raise GameOver
+
+        table.game.start_game()
+        table.state = PLAYING
+        return {'turn_order': table.game.get_turn_order()}
+
+    def _turn(self, _conn, request):
+        table = self._table(request)
+        if table.state == WAITING:
+            raise GameNotStarted
+        if table.state == OVER:
+            raise GameOver
+
+        player = table.game.next_turn()
+        if table.state == OVER and not table.watchers:
+            self._unwatched[table.table_id] = table
+        return {
+            'player': player.name,
+            'card': card_json(player.last_card),
+            'score': player.score,
+        }
+
+    def _state(self, _conn, request):
+        table = self._table(request)
+        return {
+            'state': table.state,
+            'round': min(table.game.round_num, table.game.num_rounds),
+            'players': {
+                p.name: p.score for p in table.game.get_current_players()
+            },
+        }
+
+    def _leave(self, conn, request):
+        table = self._table(request)
+        if conn is not None:
+            table.watchers.discard(conn)
+            conn.tables.discard(table)
+            if not table.watchers:
+                self._unwatched[table.table_id] = table
+        return {}
+
+    def handle(self, conn, request):
+        """
+        handle(conn, request):  runs one request dict for conn and
+            returns the response dict
+        """
+        try:
+            if not isinstance(request, dict):
+                raise InvalidRequest
+            operation = self._ops.get(request.get('op'))
+            if operation is None:
+                raise InvalidRequest
+
+            response = operation(conn, request)
+        except Exception as err:  # pylint: disable=broad-except
+            return {'ok': False, 'error': type(err).__name__}
+
+        response['ok'] = True
+        return response
+
+    async def _serve(self, reader, writer):
+        conn = Connection(writer, self._queue_size)
+        self._connections.add(conn)
+        task = asyncio.current_task()
+        self._serve_tasks.add(task)
+        try:
+            while not conn.closed:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    request = None
+                await conn.send(self.handle(conn, request))
+        except (ConnectionError, asyncio.CancelledError):
+            # close() cancels connections that are still open
+            conn.abort()
+        finally:
+            for table in conn.tables:
+                table.watchers.discard(conn)
+                if not table.watchers:
+                    # its last watcher is gone, close it now instead
+                    # of waiting for the table limit
+                    self._tables.pop(table.table_id, None)
+                    self._unwatched.pop(table.table_id, None)
+            self._connections.discard(conn)
+            self._serve_tasks.discard(task)
+
+        await conn.close()
+
+    async def start_tcp(self, host='127.0.0.1', port=0):
+        """
+        start_tcp(host='127.0.0.1', port=0):  starts listening,
+            port 0 picks a free port (see address)
+        """
+        self._server = await asyncio.start_server(self._serve, host, port)
+        return self._server
+
+    async def start_unix(self, path):
+        """
+        start_unix(path):  starts listening on Unix socket path
+        """
+        self._server = await asyncio.start_unix_server(self._serve, path)
+        return self._server
+
+    async def close(self):
+        """
+        close():  stops listening and closes every connection
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        tasks = list(self._serve_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class TableClient:
+    """
+    TableClient class:  asyncio client for TableServer()
+
+    Constructors:
+    await TableClient.connect_tcp(host, port)
+    await TableClient.connect_unix(path)
+
+    Methods:
+    await request(op, **fields):  sends request, returns response
+    await next_event():  returns next event from joined tables
+    await close()
+    """
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._events = asyncio.Queue()
+
+    @classmethod
+    async def connect_tcp(cls, host, port):
+        """
+        connect_tcp(host, port):  returns client connected over TCP
+        """
+        return cls(*await asyncio.open_connection(host, port))
+
+    @classmethod
+    async def connect_unix(cls, path):
+        """
+        connect_unix(path):  returns client connected to Unix socket
+        """
+        return cls(*await asyncio.open_unix_connection(path))
+
+    async def request(self, op, **fields):
+        """
+        request(op, **fields):  sends request and returns its
+            response, events read before it are queued
+        """
+        fields['op'] = op
+        self._writer.write(json.dumps(fields).encode() + b'\n')
+        await self._writer.drain()
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                raise ConnectionError("server closed connection")
+            message = json.loads(line)
+            if 'event' in message:
+                self._events.put_nowait(message)
+            else:
+                return message
+
+    async def next_event(self):
+        """
+        next_event():  returns next event, reads from the server
+            if none are queued
+        """
+        if not self._events.empty():
+            return self._events.get_nowait()
+
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("server closed connection")
+        return json.loads(line)
+
+    async def close(self):
+        """
+        close():  closes the connection
+        """
+        self._writer.close()
+        await self._writer.wait_closed()
@@ -0,0 +1,208 @@
+"""
+turn_scheduler.py:
+    contains TurnScheduler() class that keeps turn order for very
+    large tables as a circular linked list stored in arrays
+"""
+
+
+class TurnScheduler:
+    """
+    TurnScheduler class:  turn order of seats (player indexes) with
+        O(1) advance, skip, append and remove
+
+    Constructors:
+    TurnScheduler(seats=()):  seats in turn order, first seat's
+        turn is first
+
+    Methods:
+    reset(seats):  replaces turn order, first seat's turn is next
+    append(seat):  adds seat at the end of the turn order
+    remove(seat):  takes seat out of the turn order
+    skip(seat):  seat loses its next turn
+    advance():  passes the turn to the next seat
+    getstate():  returns (seats, current, skipped seats)
+    setstate(state):  restores state from getstate()
+    current:  seat whose turn it is, None if there are no seats
+
+    Notes:
+        advance(), remove() and skip() return the number of rounds
+        completed while passing the turn on, a round is completed
+        every time the turn passes the last seat
+
+        node 0 is the end of round marker, seat n is node n + 1
+    """
+    def __init__(self, seats=()):
+        self._next = [0]
+        self._prev = [0]
+        self._linked = bytearray(1)
+        self._skipped = bytearray(1)
+        self._current = 0
+        self._size = 0
+        self.reset(seats)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, seat):
+        node = seat + 1
+        return 0 < node < len(self._linked) and self._linked[node] == 1
+
+    def __iter__(self):
+        nxt = self._next
+        node = nxt[0]
+        while node:
+            yield node - 1
+            node = nxt[node]
+
+    @property
+    def current(self):
+        """
+        current:  returns seat whose turn it is, None if empty
+        """
+        if self._size == 0:
+            return None
+
+        return self._current - 1
+
+    def _grow(self, node):
+        """
+        _grow(node):  makes the arrays big enough to hold node
+        """
+        extra = node + 1 - len(self._linked)
+        if extra > 0:
+            self._next.extend([0] * extra)
+            self._prev.extend([0] * extra)
+            self._linked.extend(bytes(extra))
+            self._skipped.extend(bytes(extra))
+
+    def reset(self, seats):
+        """
+        reset(seats):  replaces turn order with seats,
+            first seat's turn is next
+        """
+        self._next[:] = [0]
+        self._prev[:] = [0]
+        self._linked[:] = bytes(1)
+        self._skipped[:] = bytes(1)
+        self._size = 0
+        for seat in seats:
+            self.append(seat)
+        self._current = self._next[0]
+
+    def append(self, seat):
+        """
+        append(seat):  adds seat at the end of the turn order
+        """
+        node = seat + 1
+        self._grow(node)
+        if self._linked[node]:
+            raise ValueError(f"seat {seat} is already in turn order")
+
+        last = self._prev[0]
+        self._next[last] = node
+        self._prev[node] = last
+        self._next[node] = 0
+        self._prev[0] = node
+        self._linked[node] = 1
+        self._skipped[node] = 0
+        self._size += 1
+        if self._current == 0:
+            self._current = node
+
+    def remove(self, seat):
+        """
+        remove(seat):  takes seat out of the turn order, if it is
+            seat's turn the turn passes to the next seat
+            returns number of rounds completed
+        """
+        if seat not in self:
+            raise ValueError(f"seat {seat} is not in turn order")
+
+        node = seat + 1
+        prev = self._prev[node]
+        nxt = self._next[node]
+        self._next[prev] = nxt
+        self._prev[nxt] = prev
+        self._linked[node] = 0
+        self._skipped[node] = 0
+        self._size -= 1
+
+        if node != self._current:
+            return 0
+
+        # continue from the seat before, like it just had its turn
+        self._current = prev
+        if self._size == 0:
+            self._current = 0
+            return 0
+
+        return self.advance()
+
+    def skip(self, seat):
+        """
+        skip(seat):  seat loses its next turn, if it is seat's turn
+            the turn passes to the next seat
+            returns number of rounds completed
+        """
+        if seat not in self:
+            raise ValueError(f"seat {seat} is not in turn order")
+
+        node = seat + 1
+        if node == self._current:
+            return self.advance()
+
+        self._skipped[node] = 1
+        return 0
+
+    def advance(self):
+        """
+        advance():  passes the turn to the next seat that is not
+            skipped, returns number of rounds completed
+        """
+        if self._size == 0:
+            return 0
+
+        nxt = self._next
+        skipped = self._skipped
+        node = self._current
+        rounds = 0
+        while True:
+            node = nxt[node]
+            if node == 0:
+                rounds += 1
+            elif skipped[node]:
+                # every flag is cleared when passed, so this ends
+                skipped[node] = 0
+            else:
+                break
+
+        self._current = node
+        return rounds
+
+    def getstate(self):
+        """
+        getstate():  returns (seats in turn order, current seat or
+            None, skipped seats)
+        """
+        skipped = self._skipped
+        return (
+            list(self),
+            self.current,
+            [seat for seat in self if skipped[seat + 1]]
+        )
+
+    def setstate(self, state):
+        """
+        setstate(state):  restores state from getstate()
+        """
+        seats, current, skipped = state
+        self.reset(seats)
+        if current is not None:
+            if current not in self:
+                raise ValueError(f"seat {current} is not in turn order")
+            self._current = current + 1
+
+        for seat in skipped:
+            if seat not in self:
+                raise ValueError(f"seat {seat} is not in turn order")
+            self._skipped[seat + 1] = 1
@@ -8,131 +8,239 @@ python play_draw3.py -h
 """
 
 
+import asyncio
+import json
+import random
 import sys
 from argparse import ArgumentParser
+from multiprocessing import Pool
 
-from cardgame.classes.cardgame import NeedMorePlayers, MaxPlayersHit
+from cardgame.classes.cardgame import (
+    DuplicatePlayerName,
+    MaxPlayersHit,
+    NeedMorePlayers
+)
 from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.events import ROUND_START
+from cardgame.classes.table_pool import TablePool
+from cardgame.classes.table_server import InvalidRequest
 
 
-def new_round(round_num):
+def new_round(_game, round_num):
     """
-    method to override cardgame_draw3.Draw3Game().new_round()
+    round_start event subscriber
     so we can print out the round number
 
-    (only gets set when --verbose flag is used)
+    (only gets subscribed when --verbose flag is used)
     """
     print(f"Round #{round_num}")
 
 
-parser = ArgumentParser(description="Plays the Draw3 card game")
-parser.add_argument(
-    '--players',
-    help='comma-delimited list of player names'
-)
-parser.add_argument(
-    '--verbose',
-    help='Verbose feedback of game progress',
-    action='store_true'
-)
-parser.add_argument(
-    '--random_off',
-    help='Do not randomize turn order',
-    action='store_true'
-)
-args = parser.parse_args()
+def parse_args(argv=None):
+    """
+    parse_args(argv=None):  returns parsed command line arguments
+    """
+    parser = ArgumentParser(description="Plays the Draw3 card game")
+    parser.add_argument(
+        '--players',
+        help='comma-delimited list of player names'
+    )
+    parser.add_argument(
+        '--verbose',
+        help='Verbose feedback of game progress',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--random_off',
+        help='Do not randomize turn order',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--games',
+        help='Number of games to play (default 1)',
+        type=int,
+        default=1
+    )
+    parser.add_argument(
+        '--workers',
+        help='Number of worker processes used to play games (default 1)',
+        type=int,
+        default=1
+    )
+    parser.add_argument(
+        '--seed',
+        help='Seed for reproducible games',
+        type=int,
+        default=None
+    )
+    parser.add_argument(
+        '--serve',
+        help='Play newline-delimited JSON game requests from stdin '
+             '(or --socket) until end of input',
+        action='store_true'
+    )
+    parser.add_argument(
+        '--socket',
+        help='Unix socket path to listen on with --serve',
+        default=None
+    )
+    return parser.parse_args(argv)
+
+
+def get_player_names(players):
+    """
+    get_player_names(players):
+        returns list of player names from comma-delimited string
+        exits if a name appears more than once
+    """
+    if not players:
+        return ['Buck', 'Cherry']
 
-if args.players:
-    players_raw = args.players.split(',')
     player_names = []
-    player_check = []
-    for player_name in players_raw:
+    player_check = set()
+    for player_name in players.split(','):
         new_player = player_name.strip()
         if new_player.lower() in player_check:
             print(
-                (
-                    "Please make sure each player name is unique.  ",
-                    "{new_player} appears more than once."
-                )
+                "Please make sure each player name is unique.  "
+                f"{new_player} appears more than once."
             )
             sys.exit(1)
 
         player_names.append(new_player)
-        player_check.append(new_player.lower())
-else:
-    player_names = ['Buck', 'Cherry']
+        player_check.add(new_player.lower())
 
-game = Draw3Game()
+    return player_names
 
-try:
-    game.setup_game(player_names=player_names)
-except MaxPlayersHit:
-    print(f"Too many players.  Max players is {game.max_players}")
-    sys.exit(1)
 
-try:
-    if args.verbose:
-        print("\nStarting game...\n")
-        # verbose is set, so print round numbers
-        game.new_round = new_round
+def create_game(player_names, random_off=False, rng=None):
+    """
+    create_game(player_names, random_off=False, rng=None):
+        returns Draw3Game(rng) set up with player_names
+        exits if there are too many players
+    """
+    game = Draw3Game(rng)
 
-    if args.random_off:
+    try:
+        game.setup_game(player_names=player_names)
+    except MaxPlayersHit:
+        print(f"Too many players.  Max players is {game.max_players}")
+        sys.exit(1)
+
+    if random_off:
         game.random_turn_order = False
-    elif args.verbose:
-        print("Randomizing turn order")
 
-    game.start_game()
-except NeedMorePlayers:
-    print(f"Not enough players.  Need a minimum of {game.min_players}")
-    sys.exit(1)
+    return game
 
-if args.verbose:
-    NAMES = ', '.join(
-        [
-            p.name for p in game.get_current_players()
-        ]
-    )
 
-    print(f"Players are:  {NAMES}")
+def play_games(job):
+    """
+    play_games((player_names, num_games, random_off, seed)):
+        plays num_games games and returns tally per player name
+        {name: {'wins': int, 'ties': int, 'points': int}}
 
-while game.next_turn() is not None:
-    player = game.get_current_player()
+    NOTE:
+    each game is seeded from random.Random(seed) so a worker
+        replays the same games for the same seed
+    """
+    player_names, num_games, random_off, seed = job
+    seeds = random.Random(seed)
+    tally = {
+        name: {'wins': 0, 'ties': 0, 'points': 0} for name in player_names
+    }
 
-    if args.verbose:
-        card = player.hand[-1]
-        print(f"{player.name} drew a {card.value} of {card.suit}")
+    game = create_game(player_names, random_off)
+    for _ in range(num_games):
+        # one game is reused, reseeding its rng plays the same game
+        # as a new Draw3Game(seed) without building a deck and players
+        game.rng.seed(seeds.getrandbits(64))
+        game.rematch()
 
-player_rankings = game.player_rankings()
+        rankings = game.play_to_completion()
+        top_score = rankings[0].score
+        winners = [p for p in rankings if p.score == top_score]
+        for player in rankings:
+            tally[player.name]['points'] += player.score
+        for player in winners:
+            tally[player.name][
+                'wins' if len(winners) == 1 else 'ties'
+            ] += 1
 
-if player_rankings is None:
-    print("Could not get player rankings.")
-    sys.exit(2)
+    return tally
 
-winners = []
-for player in player_rankings:
-    if len(winners):  # pylint:  disable-msg=C1801
-        if player.score < winners[-1].score:
-            break
 
-    winners.append(player)
+def merge_tallies(tallies):
+    """
+    merge_tallies(tallies):
+        merges list of play_games() tallies into one tally
+    """
+    merged = {}
+    for tally in tallies:
+        for name, counts in tally.items():
+            totals = merged.setdefault(
+                name, {'wins': 0, 'ties': 0, 'points': 0}
+            )
+            for key, value in counts.items():
+                totals[key] += value
+
+    return merged
+
+
+def run_tournament(player_names, num_games, workers=1,
+                   random_off=False, seed=None):
+    """
+    run_tournament(player_names, num_games, workers=1,
+                   random_off=False, seed=None):
+        splits num_games across worker processes and
+        returns merged tally
 
-NUM_WINNERS = len(winners)
+    NOTE:
+    worker N gets seed stream f"{seed}:{N}" so results are
+        reproducible for the same seed and number of workers
+    """
+    workers = max(1, min(workers, num_games))
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+
+    jobs = [
+        (
+            player_names,
+            num_games // workers + (1 if idx < num_games % workers else 0),
+            random_off,
+            f"{seed}:{idx}",
+        )
+        for idx in range(workers)
+    ]
+
+    if workers == 1:
+        return merge_tallies(map(play_games, jobs))
+
+    with Pool(workers) as pool:
+        return merge_tallies(pool.map(play_games, jobs))
 
-if NUM_WINNERS == 0:
-    print("\nUnable to determine winners.")
-    sys.exit(3)
 
-if NUM_WINNERS == 1:
-    player = winners[0]
-    print(f"\n{player.name} won with {player.score} points")
-else:
-    if NUM_WINNERS > 2:
-        TIE_TYPE = f"{NUM_WINNERS}-way "
+def print_winners(winners):
+    """
+    print_winners(winners):  prints the winner or tie of one game
+    """
+    num_winners = len(winners)
+
+    if num_winners == 0:
+        print("\nUnable to determine winners.")
+        sys.exit(3)
+
+    if num_winners == 1:
+        player = winners[0]
+        print(f"\n{player.name} won with {player.score} points")
+        return
+
+    if num_winners > 2:
+        tie_type = f"{num_winners}-way "
     else:
-        TIE_TYPE = ""
+        tie_type = ""
 
     player = winners.pop()
-    NAMES = " and ".join(
+    names = " and ".join(
         [
             ", ".join(
                 [
@@ -143,4 +251,250 @@ else:
         ]
     )
 
-    print(f"\nIt's a {TIE_TYPE}tie between {NAMES} at {player.score} points!")
+    print(f"\nIt's a {tie_type}tie between {names} at {player.score} points!")
+
+
+def play_one_game(args, player_names):
+    """
+    play_one_game(args, player_names):
+        plays and prints a single game
+    """
+    game = create_game(player_names, rng=args.seed)
+
+    try:
+        if args.verbose:
+            print("\nStarting game...\n")
+            # verbose is set, so print round numbers
+            game.subscribe(ROUND_START, new_round)
+
+        if args.random_off:
+            game.random_turn_order = False
+        elif args.verbose:
+            print("Randomizing turn order")
+
+        game.start_game()
+    except NeedMorePlayers:
+        print(f"Not enough players.  Need a minimum of {game.min_players}")
+        sys.exit(1)
+
+    if args.verbose:
+        names = ', '.join(
+            [
+                p.name for p in game.get_current_players()
+            ]
+        )
+
+        print(f"Players are:  {names}")
+
+    player = game.next_turn()
+    while player is not None:
+        if args.verbose:
+            card = player.last_card
+            print(f"{player.name} drew a {card.value} of {card.suit}")
+
+        player = game.next_turn()
+
+    print_winners(game.winners())
+
+
+def play_many_games(args, player_names):
+    """
+    play_many_games(args, player_names):
+        plays args.games games on args.workers processes and
+        prints the merged results
+    """
+    if args.workers < 1:
+        print("Please use at least 1 worker.")
+        sys.exit(1)
+
+    game = create_game(player_names)
+    if len(player_names) < game.min_players:
+        print(f"Not enough players.  Need a minimum of {game.min_players}")
+        sys.exit(1)
+
+    tally = run_tournament(
+        player_names,
+        args.games,
+        args.workers,
+        args.random_off,
+        args.seed
+    )
+
+    print(f"\nPlayed {args.games} games")
+    for name in player_names:
+        counts = tally[name]
+        print(
+            f"{name}:  {counts['wins']} wins, {counts['ties']} ties, "
+            f"{counts['points']} total points"
+        )
+
+
+def request_names(players):
+    """
+    request_names(players):
+        returns list of player names from a list of names or a
+        comma-delimited string, raises DuplicatePlayerName if a name
+        appears more than once (case-insensitive)
+    """
+    if isinstance(players, str):
+        players = [name.strip() for name in players.split(',')]
+    if not isinstance(players, list):
+        raise InvalidRequest
+
+    player_check = set()
+    for name in players:
+        if not isinstance(name, str):
+            raise InvalidRequest
+        if name.casefold() in player_check:
+            raise DuplicatePlayerName
+        player_check.add(name.casefold())
+
+    return players
+
+
+def serve_request(line, pool):
+    """
+    serve_request(line, pool):
+        plays the game asked for by one JSON request line
+            {"players": [names] or "a,b", "random_off": false,
+             "seed": null, "id": any}
+        with a game from TablePool() pool and returns the response
+            {"ok": true, "turn_order", "winners", "scores", "id"}
+            {"ok": false, "error": name of exception, "id"}
+
+    NOTE:
+    a request with a seed plays the same game as
+        python play_draw3.py --players ... --seed seed
+    """
+    request = None
+    try:
+        try:
+            request = json.loads(line)
+        except ValueError as err:
+            raise InvalidRequest from err
+        if not isinstance(request, dict):
+            raise InvalidRequest
+
+        names = request_names(request.get('players', ['Buck', 'Cherry']))
+        seed = request.get('seed')
+        if seed is not None and not isinstance(seed, int):
+            raise InvalidRequest
+
+        game = pool.acquire(names, seed)
+        try:
+            game.random_turn_order = not request.get('random_off', False)
+            game.start_game()
+            turn_order = game.get_turn_order()
+            rankings = game.play_to_completion()
+            top_score = rankings[0].score
+            response = {
+                'ok': True,
+                'turn_order': turn_order,
+                'winners': [
+                    p.name for p in rankings if p.score == top_score
+                ],
+                'scores': {p.name: p.score for p in rankings},
+            }
+        finally:
+            # release() resets the players, read scores first
+            pool.release(game)
+    except Exception as err:  # pylint: disable=broad-except
+        response = {'ok': False, 'error': type(err).__name__}
+
+    if isinstance(request, dict) and 'id' in request:
+        response['id'] = request['id']
+
+    return json.dumps(response, separators=(',', ':')) + '\n'
+
+
+def serve_stream(infile, outfile, pool=None):
+    """
+    serve_stream(infile, outfile, pool=None):
+        answers every request line from infile on outfile,
+        in order, until end of input
+    """
+    if pool is None:
+        pool = TablePool()
+
+    for line in infile:
+        if line.strip():
+            outfile.write(serve_request(line, pool))
+            outfile.flush()
+
+
+async def start_unix_server(path, pool=None):
+    """
+    start_unix_server(path, pool=None):
+        starts answering request lines on Unix socket path,
+        every connection gets its responses in request order,
+        returns the asyncio server
+    """
+    if pool is None:
+        pool = TablePool()
+
+    async def serve_connection(reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    writer.write(serve_request(line, pool).encode())
+                    # only waits when the client stops reading
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_unix_server(serve_connection, path)
+
+
+async def serve_unix(path):
+    """
+    serve_unix(path):  answers request lines on Unix socket path
+        until interrupted
+    """
+    server = await start_unix_server(path)
+    async with server:
+        await server.serve_forever()
+
+
+def serve(args):
+    """
+    serve(args):  keeps one process playing requested games,
+        from stdin or on args.socket
+    """
+    if args.socket is None:
+        serve_stream(sys.stdin, sys.stdout)
+        return
+
+    try:
+        asyncio.run(serve_unix(args.socket))
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv=None):
+    """
+    main(argv=None):  plays Draw3 from the command line
+    """
+    args = parse_args(argv)
+    if args.serve:
+        serve(args)
+        return
+
+    player_names = get_player_names(args.players)
+
+    if args.games < 1:
+        print("Please play at least 1 game.")
+        sys.exit(1)
+
+    if args.games == 1:
+        play_one_game(args, player_names)
+    else:
+        play_many_games(args, player_names)
+
+
+if __name__ == '__main__':
+    main()
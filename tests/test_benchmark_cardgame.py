@@ -0,0 +1,94 @@
+"""
+test_benchmark_cardgame.py:
+    tests benchmark suite in benchmark_cardgame
+"""
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import benchmark_cardgame
+
+
+class TestBenchmarkCardgame(TestCase):
+    """
+    TestBenchmarkCardgame():
+        tests run_benchmarks() and JSON output of main()
+    """
+    def test_run_benchmarks(self):
+        """
+        test_run_benchmarks():
+            every hot path is timed for every deck size and
+            player count
+        """
+        report = benchmark_cardgame.run_benchmarks(
+            [1, 4], [2, 3], number=2, repeat=2
+        )
+        self.assertEqual(2, report['repeat'])
+        names = {row['name'] for row in report['results']}
+        self.assertIn('DeckManager.shuffle', names)
+        self.assertIn('ExtendedDeckManager.peek_card', names)
+        self.assertIn('Player.hand', names)
+        self.assertIn('Draw3Game.game', names)
+        self.assertIn('Draw3Game.play_to_completion', names)
+        self.assertIn('Draw3Game.player_rankings', names)
+
+        sizes = {
+            row['params']['deck_size']
+            for row in report['results'] if 'deck_size' in row['params']
+        }
+        self.assertEqual({13, 52}, sizes)
+        for row in report['results']:
+            self.assertLessEqual(row['best_s'], row['median_s'])
+            self.assertLess(0, row['ops'])
+
+        draws = [
+            row for row in report['results']
+            if row['name'] == 'DeckManager.draw_card'
+        ]
+        self.assertEqual([13, 52], [row['ops'] for row in draws])
+
+    def test_main_writes_json(self):
+        """
+        test_main_writes_json():  --output writes JSON results
+        """
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'bench.json')
+            benchmark_cardgame.main(
+                [
+                    '--suits', '1', '--players', '2',
+                    '--number', '1', '--repeat', '1',
+                    '--output', path,
+                ]
+            )
+            with open(path, encoding='utf-8') as bench_file:
+                report = json.load(bench_file)
+
+        self.assertEqual(12, len(report['results']))
+        self.assertRaises(
+            SystemExit, benchmark_cardgame.main, ['--number', '0']
+        )
+        for players in ('1', 'two'):
+            self.assertRaises(
+                SystemExit,
+                benchmark_cardgame.main,
+                ['--suits', '1', '--players', players]
+            )
+
+    def test_large_tables(self):
+        """
+        test_large_tables():
+            player counts over Draw3Game max use LargeDraw3Game
+        """
+        report = benchmark_cardgame.run_benchmarks(
+            [], [10, 40], number=1, repeat=1
+        )
+        names = {row['name'] for row in report['results']}
+        self.assertEqual(
+            {
+                'LargeDraw3Game.game',
+                'LargeDraw3Game.play_to_completion',
+                'LargeDraw3Game.player_rankings',
+            },
+            names
+        )
@@ -1,6 +1,9 @@
+# pylint:  disable=protected-access
 """
 test_card.py:  tests for Card() class
 """
+import gc
+import pickle
 from unittest import TestCase
 
 from cardgame.classes.card import Card
@@ -65,3 +68,83 @@ class TestCard(TestCase):
         card = Card(suit, value, suit_value, card_value)
         self.assertEqual(expected_str, str(card))
         self.assertEqual(expected_str, card.__repr__())
+
+    def test_card_flyweight(self):
+        """
+        test_card_flyweight():
+            same card definition returns the same Card() object
+        """
+        card1 = Card('Suit1', 'Value1', 1, 2)
+        self.assertIs(card1, Card('Suit1', 'Value1', 1, 2))
+        self.assertIs(card1, card1.__copy__())
+        # different names make a different card, but equal in value
+        card2 = Card('Suit2', 'Value1', 1, 2)
+        self.assertIsNot(card1, card2)
+        self.assertEqual(card1, card2)
+        # slotted, no per-instance __dict__
+        self.assertFalse(hasattr(card1, '__dict__'))
+
+    def test_card_hash(self):
+        """
+        test_card_hash():
+            cards can be used in sets and as dict keys
+        """
+        card1 = Card('Suit1', 'Value1', 1, 2)
+        card2 = Card('Suit1', 'Value2', 1, 3)
+        cards = {card1: 'first', card2: 'second'}
+        self.assertEqual('first', cards[Card('Suit1', 'Value1', 1, 2)])
+        self.assertEqual(2, len({card1, card2, Card('Suit1', 'Value1', 1, 2)}))
+
+    def test_card_ordinal(self):
+        """
+        test_card_ordinal():
+            ordinal orders by suit_value then card_value
+        """
+        low = Card('Suit1', 'Value1', 1, 14)
+        high = Card('Suit2', 'Value2', 2, 2)
+        self.assertLess(low.ordinal, high.ordinal)
+        self.assertLess(low, high)
+        self.assertLessEqual(low, high)
+        self.assertGreaterEqual(high, low)
+        self.assertEqual([low, high], sorted([high, low]))
+        self.assertNotEqual(low, "Card")
+
+    def test_non_integral_values(self):
+        """
+        test_non_integral_values():
+            cards with float values compare by suit_value then
+            card_value, also against int valued cards
+        """
+        low = Card('Suit1', 'Value1', 1, 14)
+        mid = Card('Suit2', 'Value2', 1.5, 2)
+        high = Card('Suit3', 'Value3', 2, 2)
+        self.assertEqual([low, mid, high], sorted([high, mid, low]))
+        self.assertLess(low, mid)
+        self.assertGreater(mid, low)
+        self.assertLessEqual(mid, high)
+        self.assertGreaterEqual(high, mid)
+        self.assertNotEqual(low, mid)
+        self.assertEqual(mid, Card('Suit4', 'Value4', 1.5, 2.0))
+        # integral floats are the same as ints
+        self.assertEqual(high, Card('Suit3', 'Value3', 2.0, 2))
+        self.assertEqual(hash(high), hash(Card('Suit3', 'Value3', 2.0, 2)))
+
+    def test_intern_table_shrinks(self):
+        """
+        test_intern_table_shrinks():
+            cards nothing refers to leave the intern table
+        """
+        cards = [Card('Temp', f"Value{idx}", 1, idx) for idx in range(100)]
+        size = len(Card._interned)
+        self.assertIs(cards[5], Card('Temp', 'Value5', 1, 5))
+        del cards
+        gc.collect()
+        self.assertEqual(size - 100, len(Card._interned))
+
+    def test_card_pickle(self):
+        """
+        test_card_pickle():
+            unpickled card is the interned card
+        """
+        card = Card('Suit1', 'Value1', 1, 2)
+        self.assertIs(card, pickle.loads(pickle.dumps(card)))
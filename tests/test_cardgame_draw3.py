@@ -4,8 +4,16 @@ test_cardgame_draw3.py:
 """
 from cardgame.classes.card import Card
 from cardgame.classes.cardgame_draw3 import Draw3Game
-from cardgame.classes.cardgame import MaxPlayersHit, NeedMorePlayers
-from cardgame.classes.deckmanager import DeckManager
+from cardgame.classes.cardgame import (
+    DeckNotInitialized,
+    MaxPlayersHit,
+    NeedMorePlayers
+)
+from cardgame.classes.compactdeckmanager import CompactDeckManager
+from cardgame.classes.deckmanager import DeckManager, EmptyDeckError
+from cardgame.classes.events import DRAW, RANKINGS, TURN
+from cardgame.classes.extendeddeckmanager import ExtendedDeckManager
+from cardgame.classes.shoedeckmanager import ShoeDeckManager
 
 from .helper import Helper
 from .test_deckmanager_normal import TestDeckManager
@@ -165,3 +173,214 @@ class TestDraw3(TestDeckManager):
         self.assertEqual(2, len(players))
         # player2 should be ranked higher than player1
         self.assertEqual(players[0], player2)
+
+    def test_incremental_scores(self):
+        """
+        test_incremental_scores():
+            scores follow each draw and every player draws 3 cards
+        """
+        draw3, _ = TestDraw3.base_game_setup(4)
+        draw3.start_game()
+        player = draw3.next_turn()
+        while player is not None:
+            self.assertEqual(
+                draw3.calc_points(player.hand),
+                player.score
+            )
+            player = draw3.next_turn()
+
+        for player in draw3.get_current_players():
+            self.assertEqual(3, len(player.hand))
+            self.assertEqual(draw3.calc_points(player.hand), player.score)
+
+        # changing a hand directly needs update_scores()
+        player.hand = []
+        draw3.update_scores()
+        self.assertEqual(0, player.score)
+
+    def test_winners_top_k(self):
+        """
+        test_winners_top_k():
+            winners() returns tie group, top_k() best players
+        """
+        draw3, _ = TestDraw3.base_game_setup(4)
+        players = draw3.get_current_players()
+        for player, score in zip(players, [10, 30, 20, 30]):
+            player.score = score
+
+        self.assertEqual([players[1], players[3]], draw3.winners())
+        self.assertEqual(
+            [players[1], players[3], players[2]],
+            draw3.top_k(3)
+        )
+        self.assertEqual(
+            [p.name for p in draw3.player_rankings()],
+            [p.name for p in draw3.top_k(4)]
+        )
+
+        players[3].score = 25
+        self.assertEqual([players[1]], draw3.winners())
+        draw3.remove_all_players()
+        self.assertEqual([], draw3.winners())
+
+    def test_rematch(self):
+        """
+        test_rematch():
+            a reset game plays the same as a new game with the
+            same seed and keeps its player objects
+        """
+        def play(draw3):
+            player = draw3.next_turn()
+            drawn = []
+            while player is not None:
+                drawn.append((player.name, player.last_card))
+                player = draw3.next_turn()
+            return drawn
+
+        new_game = Draw3Game(rng=5)
+        new_game.setup_game(player_names=Helper.generate_player_names(4))
+        new_game.start_game()
+        expected = play(new_game)
+
+        draw3 = Draw3Game(rng=1)
+        draw3.setup_game(player_names=Helper.generate_player_names(4))
+        players = draw3.get_current_players()
+        draw3.start_game()
+        play(draw3)
+
+        draw3.rng.seed(5)
+        draw3.rematch()
+        self.assertEqual(players, draw3.get_current_players())
+        self.assertEqual(0, sum(p.score for p in players))
+        self.assertEqual(52, len(draw3.deck()))
+        self.assertEqual(expected, play(draw3))
+        self.assertEqual(
+            [p.score for p in new_game.get_current_players()],
+            [p.score for p in players]
+        )
+
+        self.assertRaises(DeckNotInitialized, Draw3Game().reset)
+
+    def test_deal_all(self):
+        """
+        test_deal_all():
+            deal_all() ends with the same hands and scores as
+            playing every turn, from the start or mid-game
+        """
+        def game(deck_cls, lazy):
+            draw3 = Draw3Game(4)
+            deck_mgr = None
+            if deck_cls is not None:
+                deck_mgr = deck_cls(rng=draw3.rng)
+            draw3.setup_game(deck_mgr, Helper.generate_player_names(5))
+            draw3.lazy_shuffle = lazy
+            draw3.start_game()
+            return draw3
+
+        def hands(draw3):
+            return [
+                (p.name, p.hand, p.score)
+                for p in draw3.get_current_players()
+            ]
+
+        for deck_cls, lazy in (
+            (None, False),
+            (None, True),
+            (CompactDeckManager, True),
+            (ShoeDeckManager, False),
+        ):
+            for turns in (0, 1, 5, 7, 14):
+                expected = game(deck_cls, lazy)
+                while expected.next_turn() is not None:
+                    pass
+
+                draw3 = game(deck_cls, lazy)
+                for _ in range(turns):
+                    draw3.next_turn()
+                self.assertEqual(15 - turns, draw3.deal_all())
+                self.assertTrue(draw3.is_game_over())
+                self.assertEqual(hands(expected), hands(draw3))
+                self.assertEqual(expected.deck(), draw3.deck())
+                self.assertEqual(0, draw3.deal_all())
+
+    def test_deal_all_rounds(self):
+        """
+        test_deal_all_rounds():
+            new_round() is called once per round, events fall
+            back to playing every turn, short decks deal nothing
+        """
+        rounds = []
+
+        class RoundGame(Draw3Game):
+            """
+            RoundGame():  records new_round() calls
+            """
+            def new_round(self, round_num):
+                rounds.append(round_num)
+
+        draw3 = RoundGame(2)
+        draw3.setup_game(player_names=Helper.generate_player_names(3))
+        draw3.start_game()
+        draw3.next_turn()
+        draw3.deal_all()
+        self.assertEqual([1, 2, 3], rounds)
+
+        # hook assigned on the instance, as play_draw3.py does
+        assigned = []
+        draw3 = Draw3Game(2)
+        draw3.new_round = assigned.append
+        draw3.setup_game(player_names=Helper.generate_player_names(3))
+        draw3.start_game()
+        draw3.play_to_completion()
+        self.assertEqual([1, 2, 3], assigned)
+
+        draw3 = RoundGame(2)
+        draw3.setup_game(player_names=Helper.generate_player_names(3))
+        draw3.start_game()
+        draws = []
+        draw3.subscribe(DRAW, lambda _game, _player, card: draws.append(card))
+        draw3.rematch()
+        self.assertEqual(9, draw3.deal_all())
+        self.assertEqual(9, len(draws))
+
+        suits, values = Helper.custom_suits_values_1()
+        deck_mgr = ExtendedDeckManager.from_suits_and_values(suits, values)
+        draw3 = Draw3Game()
+        draw3.setup_game(deck_mgr, Helper.generate_player_names(3))
+        draw3.start_game()
+        self.assertRaises(EmptyDeckError, draw3.deal_all)
+        self.assertEqual(8, len(draw3.deck()))
+        for player in draw3.get_current_players():
+            self.assertEqual([], player.hand)
+
+    def test_play_to_completion(self):
+        """
+        test_play_to_completion():
+            returns the same rankings as playing turn by turn,
+            with or without event subscribers
+        """
+        def game():
+            draw3 = Draw3Game(8)
+            draw3.setup_game(player_names=Helper.generate_player_names(6))
+            draw3.start_game()
+            return draw3
+
+        expected = game()
+        while expected.next_turn() is not None:
+            pass
+        expected = [(p.name, p.score) for p in expected.player_rankings()]
+
+        draw3 = game()
+        rankings = draw3.play_to_completion()
+        self.assertEqual(expected, [(p.name, p.score) for p in rankings])
+        self.assertTrue(draw3.is_game_over())
+
+        draw3 = game()
+        events = []
+        draw3.subscribe(TURN, lambda _game, player: events.append(TURN))
+        draw3.subscribe(
+            RANKINGS, lambda _game, players: events.append(RANKINGS)
+        )
+        rankings = draw3.play_to_completion()
+        self.assertEqual(expected, [(p.name, p.score) for p in rankings])
+        self.assertEqual([TURN] * 18 + [RANKINGS], events)
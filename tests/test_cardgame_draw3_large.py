@@ -0,0 +1,223 @@
+# pylint:  disable=protected-access
+"""
+test_cardgame_draw3_large.py:
+    tests LargeDraw3Game() registry, turn order and deck sizing
+"""
+from unittest import TestCase
+
+from cardgame.classes.cardgame import (
+    DuplicatePlayerName,
+    InvalidPlayerName,
+    MaxPlayersHit,
+    NeedMorePlayers
+)
+from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.cardgame_draw3_large import (
+    LargeDraw3Game,
+    PlayerNotFound
+)
+from cardgame.classes.deckmanager import DeckManager
+from cardgame.classes.events import GAME_OVER, ROUND_START
+from cardgame.classes.shoedeckmanager import ShoeDeckManager
+
+from .helper import Helper
+
+
+class TestLargeDraw3(TestCase):
+    """
+    TestLargeDraw3():
+        tests LargeDraw3Game() with large and small tables
+    """
+    @staticmethod
+    def play(game):
+        """
+        play():  plays game to the end, returns players in draw order
+        """
+        drawn = []
+        player = game.next_turn()
+        while player is not None:
+            drawn.append(player)
+            player = game.next_turn()
+        return drawn
+
+    def test_add_players(self):
+        """
+        test_add_players():
+            names are unique ignoring case, bulk add is all or nothing
+        """
+        game = LargeDraw3Game()
+        game.setup_game(player_names=['Ann', 'Bob'])
+        self.assertRaises(DuplicatePlayerName, game.add_player, 'ANN')
+        self.assertRaises(
+            DuplicatePlayerName, game.add_players, ['Cy', 'Dee', 'cy']
+        )
+        self.assertRaises(
+            DuplicatePlayerName, game.add_players, ['Cy', 'bob']
+        )
+        self.assertRaises(InvalidPlayerName, game.add_players, ['Cy', 7])
+        self.assertEqual(['Ann', 'Bob'], game.get_turn_order())
+
+        self.assertEqual(4, game.add_players(['Cy', 'Dee']))
+        self.assertEqual(5, game.add_player('Eve'))
+        self.assertTrue(game.has_player('eve'))
+        self.assertFalse(game.has_player('Fay'))
+        self.assertEqual(
+            ['Ann', 'Bob', 'Cy', 'Dee', 'Eve'], game.get_turn_order()
+        )
+
+        small = LargeDraw3Game(max_players=3)
+        small.setup_game(player_names=['Ann', 'Bob'])
+        self.assertRaises(MaxPlayersHit, small.add_players, ['Cy', 'Dee'])
+        self.assertEqual(2, len(small.get_current_players()))
+
+    def test_matches_draw3(self):
+        """
+        test_matches_draw3():
+            small table plays the same game as Draw3Game()
+        """
+        names = Helper.generate_player_names(5)
+        large = LargeDraw3Game(9)
+        large.setup_game(player_names=names)
+        draw3 = Draw3Game(9)
+        draw3.setup_game(player_names=names)
+
+        large.start_game()
+        draw3.start_game()
+        self.assertEqual(draw3.get_turn_order(), large.get_turn_order())
+        self.assertEqual(
+            [(p.name, p.last_card) for p in self.play(draw3)],
+            [(p.name, p.last_card) for p in self.play(large)]
+        )
+        self.assertEqual(
+            [p.score for p in draw3.player_rankings()],
+            [p.score for p in large.player_rankings()]
+        )
+        self.assertTrue(large.is_game_over())
+
+    def test_large_table(self):
+        """
+        test_large_table():
+            thousands of players get a shoe big enough for every turn
+        """
+        names = Helper.generate_player_names(5000)
+        game = LargeDraw3Game(1)
+        game.setup_game(player_names=names)
+        rounds = []
+        game.subscribe(ROUND_START, lambda _game, num: rounds.append(num))
+        game.start_game()
+        self.assertIsInstance(game._deck_mgr, ShoeDeckManager)
+        self.assertEqual(289, game._deck_mgr.num_decks)
+
+        drawn = self.play(game)
+        self.assertEqual(15000, len(drawn))
+        self.assertEqual([1, 2, 3], rounds)
+        for player in game.get_current_players():
+            self.assertEqual(3, len(player.hand))
+            self.assertEqual(Draw3Game.calc_points(player.hand), player.score)
+
+    def test_custom_deck(self):
+        """
+        test_custom_deck():
+            supplied decks are not resized
+        """
+        game = LargeDraw3Game()
+        deck_mgr = DeckManager()
+        game.setup_game(deck_mgr, Helper.generate_player_names(20))
+        game.start_game()
+        self.assertIs(deck_mgr, game._deck_mgr)
+
+    def test_skip_and_remove(self):
+        """
+        test_skip_and_remove():
+            skipped players lose one turn, removed players are out
+        """
+        game = LargeDraw3Game(3)
+        game.setup_game(player_names=['Ann', 'Bob', 'Cy', 'Dee'])
+        game.random_turn_order = False
+        game.start_game()
+
+        self.assertRaises(PlayerNotFound, game.skip_player, 'Fay')
+        self.assertRaises(PlayerNotFound, game.remove_player, None)
+
+        game.skip_player('cy')
+        self.assertEqual('Ann', game.next_turn().name)
+        self.assertEqual('Bob', game.next_turn().name)
+        self.assertEqual('Dee', game.next_turn().name)
+        self.assertEqual(2, game.round_num)
+
+        self.assertEqual('Ann', game.remove_player('ANN').name)
+        self.assertFalse(game.has_player('Ann'))
+        self.assertEqual('Bob', game.get_current_player().name)
+        self.assertEqual(['Bob', 'Cy', 'Dee'], game.get_turn_order())
+
+        drawn = [p.name for p in self.play(game)]
+        self.assertEqual(['Bob', 'Cy', 'Dee'] * 2, drawn)
+        self.assertEqual(
+            ['Bob', 'Cy', 'Dee'],
+            [p.name for p in game.get_current_players()]
+        )
+        self.assertEqual(2, len(game.get_current_players()[1].hand))
+        self.assertEqual(
+            {'Bob', 'Cy', 'Dee'},
+            {p.name for p in game.player_rankings()}
+        )
+        self.assertNotIn('Ann', [p.name for p in game.winners()])
+
+    def test_remove_ends_game(self):
+        """
+        test_remove_ends_game():
+            removing last player of the last round ends the game
+        """
+        game = LargeDraw3Game()
+        game.setup_game(player_names=['Ann', 'Bob', 'Cy'])
+        game.random_turn_order = False
+        over = []
+        game.subscribe(GAME_OVER, over.append)
+        game.start_game()
+        for _ in range(8):
+            game.next_turn()
+        self.assertEqual('Cy', game.get_current_player().name)
+        game.remove_player('Cy')
+        self.assertTrue(game.is_game_over())
+        self.assertEqual([game], over)
+        self.assertIsNone(game.next_turn())
+
+        game.remove_player('Ann')
+        game.remove_player('Bob')
+        self.assertIsNone(game.get_current_player())
+
+    def test_reset(self):
+        """
+        test_reset():
+            reset keeps removed players out, rematch plays again
+        """
+        game = LargeDraw3Game(5)
+        game.setup_game(player_names=Helper.generate_player_names(40))
+        game.start_game()
+        game.remove_player('Player7')
+        self.play(game)
+
+        game.reset()
+        self.assertEqual(39, len(game.get_turn_order()))
+        self.assertNotIn('Player7', game.get_turn_order())
+        game.start_game()
+        self.assertEqual(117, len(self.play(game)))
+
+        game.remove_all_players()
+        self.assertRaises(NeedMorePlayers, game.start_game)
+        game.add_player('Player7')
+        self.assertEqual(['Player7'], game.get_turn_order())
+
+    def test_deal_all(self):
+        """
+        test_deal_all():
+            deal_all() plays every turn, skipped players included
+        """
+        game = LargeDraw3Game(3)
+        game.setup_game(player_names=Helper.generate_player_names(100))
+        game.start_game()
+        game.skip_player('Player50')
+        game.remove_player('Player9')
+        self.assertEqual(296, game.deal_all())
+        self.assertTrue(game.is_game_over())
+        self.assertEqual(0, game.deal_all())
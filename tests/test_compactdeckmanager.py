@@ -0,0 +1,89 @@
+"""
+test_compactdeckmanager.py:
+    CompactDeckManager() should pass all DeckManager() tests
+    and keep its deck as an array of card ids
+"""
+from array import array
+
+from cardgame.classes.card import Card
+from cardgame.classes.compactdeckmanager import CompactDeckManager
+from cardgame.classes.deckmanager import DeckManager
+
+from .helper import Helper
+from .test_deckmanager_normal import TestDeckManager
+
+
+class TestCompactDeckManager(TestDeckManager):
+    """
+    TestCompactDeckManager():
+        reuses TestDeckManager() tests against CompactDeckManager()
+    """
+    @staticmethod
+    def create_deck_manager():
+        """
+        create_deck_manager():
+            override to create CompactDeckManager()
+        """
+        return CompactDeckManager()
+
+    def test_compact_storage(self):
+        """
+        test_compact_storage():
+            deck is stored as array of ids into card_table()
+        """
+        deck_mgr = CompactDeckManager()
+        self.assertIsInstance(deck_mgr.card_ids(), array)
+        self.assertEqual(52, len(deck_mgr.card_table()))
+        self.assertEqual(DeckManager().deck(), deck_mgr.deck())
+        self.assertEqual(
+            deck_mgr.deck(),
+            [deck_mgr.card_table()[idx] for idx in deck_mgr.card_ids()]
+        )
+
+    def test_multi_deck_shoe(self):
+        """
+        test_multi_deck_shoe():
+            a 6 deck shoe only needs 52 distinct cards
+        """
+        shoe = DeckManager().deck() * 6
+        deck_mgr = CompactDeckManager.from_deck(shoe)
+        self.assertEqual(52, len(deck_mgr.card_table()))
+        self.assertEqual(312, len(deck_mgr.deck()))
+        self.assertEqual(shoe, deck_mgr.deck())
+        self.assertEqual(Card('Spades', '2', 1, 2), deck_mgr.peek_card(1))
+
+        deck_mgr.shuffle()
+        self.assertEqual(sorted(shoe), sorted(deck_mgr.deck()))
+        for _ in range(312):
+            deck_mgr.draw_card()
+        self.assertEqual([], deck_mgr.deck())
+        self.assertEqual(None, deck_mgr.peek_card(1))
+
+    def test_custom_deck(self):
+        """
+        test_custom_deck():
+            custom suits and values are encoded and sorted
+        """
+        suits, values = Helper.custom_suits_values_2()
+        deck_mgr = CompactDeckManager.from_suits_and_values(suits, values)
+        natural = deck_mgr.deck()
+        self.assertEqual(10, len(natural))
+        deck_mgr.shuffle()
+        # sort() puts smallest card at [0] of internal order
+        self.assertEqual(natural, deck_mgr.sort())
+        deck_mgr.empty_deck()
+        self.assertEqual([], deck_mgr.deck())
+
+    def test_sort_shared_keys(self):
+        """
+        test_sort_shared_keys():
+            cards with the same sort key keep their order
+        """
+        deck_mgr = CompactDeckManager(rng=1)
+        deck_mgr.shuffle()
+        deck = deck_mgr.deck()
+        deck_mgr.sort_algo = lambda card: card.suit_value
+        self.assertEqual(
+            sorted(deck[::-1], key=lambda card: card.suit_value),
+            deck_mgr.sort()
+        )
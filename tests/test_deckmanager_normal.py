@@ -27,7 +27,7 @@ class TestDeckManager(TestCard):
         test_normal_deck_creation():
             test things about a normal deck that we expect
         """
-        deck_mgr = TestDeckManager.create_deck_manager()
+        deck_mgr = self.create_deck_manager()
         deck = deck_mgr.deck()
         # test to make sure we have a normal deck length
         self.assertEqual(52, len(deck))
@@ -57,7 +57,7 @@ class TestDeckManager(TestCard):
         test_normal_deck_shuffled():
             tests to make sure shuffling is random
         """
-        deck_mgr = TestDeckManager.create_deck_manager()
+        deck_mgr = self.create_deck_manager()
         original_deck = deck_mgr.deck()
         shuffled_deck = deck_mgr.shuffle()
         # make sure deck has been shuffled
@@ -83,7 +83,7 @@ class TestDeckManager(TestCard):
             draw the rest of the cards and make sure
                 last card is what we expect it to be
         """
-        deck_mgr = TestDeckManager.create_deck_manager()
+        deck_mgr = self.create_deck_manager()
         card = deck_mgr.draw_card()
         # make sure card we drew is what we expected
         self.assertEqual(Card('Spades', '2', 1, 2), card)
@@ -99,9 +99,94 @@ class TestDeckManager(TestCard):
             normal deck, draw 52 cards, should raise error
                 if you try to draw more cards
         """
-        deck_mgr = TestDeckManager.create_deck_manager()
+        deck_mgr = self.create_deck_manager()
         for _ in range(52):
             deck_mgr.draw_card()
         # check to make sure EmptyDeckError is thrown
         # if we try to draw a card from an empty deck
         self.assertRaises(EmptyDeckError, deck_mgr.draw_card)
+
+    def test_draw_cards(self):
+        """
+        test_draw_cards():
+            draw_cards() draws the same cards as draw_card() calls,
+            a short deck raises EmptyDeckError without drawing
+        """
+        deck_mgr2 = self.create_deck_manager()
+        expected = [deck_mgr2.draw_card() for _ in range(10)]
+        deck_mgr1 = self.create_deck_manager()
+        self.assertEqual(expected, deck_mgr1.draw_cards(10))
+        self.assertEqual(deck_mgr2.deck(), deck_mgr1.deck())
+        self.assertEqual([], deck_mgr1.draw_cards(0))
+
+        version = deck_mgr1.version
+        self.assertRaises(EmptyDeckError, deck_mgr1.draw_cards, 43)
+        self.assertRaises(ValueError, deck_mgr1.draw_cards, -1)
+        self.assertEqual(42, len(deck_mgr1.deck()))
+        self.assertEqual(version, deck_mgr1.version)
+        self.assertEqual(42, len(deck_mgr1.draw_cards(42)))
+        self.assertRaises(EmptyDeckError, deck_mgr1.draw_card)
+
+    def test_reset(self):
+        """
+        test_reset():
+            reset() puts back every card in the original order
+        """
+        deck_mgr = self.create_deck_manager()
+        natural = deck_mgr.deck()
+        deck_mgr.shuffle()
+        for _ in range(10):
+            deck_mgr.draw_card()
+        version = deck_mgr.version
+        deck_mgr.reset()
+        self.assertLess(version, deck_mgr.version)
+        self.assertEqual(natural, deck_mgr.deck())
+        deck_mgr.shuffle()
+        deck_mgr.draw_card()
+        self.assertEqual(natural, deck_mgr.template())
+        deck_mgr.reset()
+
+        deck_mgr.lazy_shuffle()
+        deck_mgr.draw_card()
+        deck_mgr.reset()
+        self.assertFalse(deck_mgr.shuffle_pending)
+        self.assertEqual(natural, deck_mgr.deck())
+        for _ in range(52):
+            deck_mgr.draw_card()
+        deck_mgr.reset()
+        self.assertEqual(natural, deck_mgr.deck())
+
+    def test_sort_key_cache(self):
+        """
+        test_sort_key_cache():
+            sort_algo() is called once per distinct card, replacing
+            sort_algo drops cached keys, equal keys keep their order
+        """
+        deck_mgr = self.create_deck_manager()
+        natural = deck_mgr.deck()
+        calls = []
+
+        def by_suit(card):
+            calls.append(card)
+            return card.suit_value
+
+        deck_mgr.sort_algo = by_suit
+        deck_mgr.shuffle()
+        shuffled = deck_mgr.deck()
+        sorted_deck = deck_mgr.sort()
+        # same as a stable sort of the internal (reversed) order
+        self.assertEqual(
+            sorted(shuffled[::-1], key=lambda card: card.suit_value),
+            sorted_deck
+        )
+        self.assertEqual(52, len(calls))
+        deck_mgr.shuffle()
+        deck_mgr.sort()
+        self.assertEqual(52, len(calls))
+
+        deck_mgr.sort_algo = lambda card: -card.card_value
+        deck_mgr.reset()
+        self.assertEqual(
+            sorted(natural[::-1], key=lambda card: -card.card_value),
+            deck_mgr.sort()
+        )
@@ -0,0 +1,78 @@
+"""
+test_deckview.py:
+    tests read-only DeckView() of deck managers
+"""
+from unittest import TestCase
+
+from cardgame.classes.card import Card
+from cardgame.classes.cardgame import CardGame, DeckNotInitialized
+from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.compactdeckmanager import CompactDeckManager
+from cardgame.classes.deckmanager import DeckManager
+from cardgame.classes.deckview import StaleDeckViewError
+
+
+class TestDeckView(TestCase):
+    """
+    TestDeckView():
+        tests DeckView() against DeckManager() and CompactDeckManager()
+    """
+    def check_view(self, deck_mgr):
+        """
+        check_view(deck_mgr):
+            common tests for deck managers
+        """
+        view = deck_mgr.deck_view()
+        deck = deck_mgr.deck()
+        self.assertEqual(deck, view)
+        self.assertEqual(deck, list(view))
+        self.assertEqual(len(deck), len(view))
+        self.assertEqual(Card('Spades', '2', 1, 2), view[0])
+        self.assertEqual(Card('Clubs', 'Ace', 4, 14), view[-1])
+        self.assertEqual(deck[3:10:2], view[3:10:2])
+        self.assertEqual(deck[::-1], list(reversed(view)))
+        self.assertIn(Card('Hearts', 'King', 3, 13), view)
+        self.assertEqual(5, view.index(deck[5]))
+        self.assertRaises(IndexError, view.__getitem__, len(deck))
+        self.assertRaises(IndexError, view.__getitem__, -len(deck) - 1)
+        self.assertFalse(view.stale)
+
+        # drawing a card changes the deck, the view is stale
+        deck_mgr.draw_card()
+        self.assertTrue(view.stale)
+        self.assertRaises(StaleDeckViewError, len, view)
+        self.assertRaises(StaleDeckViewError, view.__getitem__, 0)
+        self.assertRaises(StaleDeckViewError, iter, view)
+
+        view = deck_mgr.deck_view()
+        self.assertEqual(deck_mgr.version, view.version)
+        self.assertEqual(deck[1:], view)
+        deck_mgr.shuffle()
+        self.assertTrue(view.stale)
+        self.assertEqual(deck_mgr.deck(), deck_mgr.deck_view())
+        view = deck_mgr.deck_view()
+        deck_mgr.sort()
+        self.assertTrue(view.stale)
+
+    def test_deck_manager_view(self):
+        """
+        test_deck_manager_view():  view over list deck
+        """
+        self.check_view(DeckManager())
+
+    def test_compact_deck_manager_view(self):
+        """
+        test_compact_deck_manager_view():  view over card id array
+        """
+        self.check_view(CompactDeckManager())
+
+    def test_cardgame_view(self):
+        """
+        test_cardgame_view():  CardGame().deck_view()
+        """
+        self.assertRaises(DeckNotInitialized, CardGame().deck_view)
+        draw3 = Draw3Game()
+        draw3.setup_game()
+        self.assertEqual(draw3.deck(), draw3.deck_view())
+        self.assertNotEqual(draw3.deck_view(), "deck")
+        self.assertTrue(str(draw3.deck_view()).startswith("DeckView(["))
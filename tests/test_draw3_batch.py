@@ -0,0 +1,217 @@
+"""
+test_draw3_batch.py:
+    tests batch simulation of Draw3Game() using numpy
+"""
+from unittest import TestCase, skipIf
+
+from cardgame.classes import draw3_batch
+from cardgame.classes.cardgame import MaxPlayersHit, NeedMorePlayers
+from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.deckmanager import DeckManager, EmptyDeckError
+from cardgame.classes.extendeddeckmanager import ExtendedDeckManager
+
+from .helper import Helper
+
+
+@skipIf(draw3_batch.numpy is None, "numpy is not installed")
+class TestDraw3Batch(TestCase):
+    """
+    TestDraw3Batch():
+        tests Draw3Game.simulate() and draw3_batch helpers
+    """
+    def test_simulate_shapes(self):
+        """
+        test_simulate_shapes():
+            test returned arrays have one row per game
+        """
+        scores, winners, ties = Draw3Game.simulate(1000, 4, seed=1)
+        self.assertEqual((1000, 4), scores.shape)
+        self.assertEqual((1000,), winners.shape)
+        self.assertEqual((1000,), ties.shape)
+
+        # smallest possible hand is 2 + 3 + 4 of Spades
+        self.assertTrue((scores >= 9).all())
+        # winner has the top score in every game
+        self.assertTrue(
+            (scores[range(1000), winners] == scores.max(axis=1)).all()
+        )
+
+    def test_simulate_seed(self):
+        """
+        test_simulate_seed():
+            same seed gives same games, batching does not matter
+        """
+        scores1, _, _ = Draw3Game.simulate(500, 3, seed=42)
+        scores2, _, _ = Draw3Game.simulate(500, 3, seed=42, batch_size=500)
+        scores3, _, _ = Draw3Game.simulate(500, 3, seed=43)
+        self.assertTrue((scores1 == scores2).all())
+        self.assertFalse((scores1 == scores3).all())
+
+    def test_simulate_matches_calc_points(self):
+        """
+        test_simulate_matches_calc_points():
+            batch scoring agrees with Draw3Game.calc_points()
+        """
+        numpy = draw3_batch.numpy
+        deck = DeckManager().deck()
+        points = draw3_batch.points_table(deck)
+        dealt = draw3_batch.deal_batch(
+            numpy.random.default_rng(7), 50, len(deck), 6
+        )
+        scores, winners, ties = draw3_batch.score_batch(points, dealt, 2)
+
+        for game in range(50):
+            for seat in range(2):
+                hand = [deck[idx] for idx in dealt[game, seat::2]]
+                self.assertEqual(
+                    Draw3Game.calc_points(hand),
+                    scores[game, seat]
+                )
+            self.assertEqual(
+                scores[game, 0] == scores[game, 1],
+                ties[game]
+            )
+            self.assertEqual(
+                0 if scores[game, 0] >= scores[game, 1] else 1,
+                winners[game]
+            )
+
+    def test_simulate_custom_deck(self):
+        """
+        test_simulate_custom_deck():
+            simulate with a small custom deck, ties happen
+        """
+        suits, values = Helper.custom_suits_values_1()
+        deck_mgr = ExtendedDeckManager.from_suits_and_values(suits, values)
+        scores, _, ties = Draw3Game.simulate(
+            2000, 2, seed=3, deck_mgr=deck_mgr
+        )
+        # 8 card deck worth 42 points, every card is dealt except 2
+        # so at most 42 - 2 - 3 points are handed out per game
+        self.assertTrue((scores.sum(axis=1) <= 37).all())
+        self.assertTrue(ties.any())
+
+    def test_simulate_errors(self):
+        """
+        test_simulate_errors():
+            test player count and deck size checks
+        """
+        self.assertRaises(NeedMorePlayers, Draw3Game.simulate, 10, 1)
+        self.assertRaises(MaxPlayersHit, Draw3Game.simulate, 10, 9)
+
+        suits, values = Helper.custom_suits_values_1()
+        deck_mgr = ExtendedDeckManager.from_suits_and_values(suits, values)
+        self.assertRaises(
+            EmptyDeckError,
+            Draw3Game.simulate,
+            10,
+            3,
+            deck_mgr=deck_mgr
+        )
+
+        scores, winners, ties = Draw3Game.simulate(0, 2)
+        self.assertEqual((0, 2), scores.shape)
+        self.assertEqual(0, len(winners))
+        self.assertEqual(0, len(ties))
+
+    def test_dense_ranks(self):
+        """
+        test_dense_ranks():
+            equal scores share a rank, no gaps after ties
+        """
+        ranks, winners = draw3_batch.dense_ranks(
+            [[10, 30, 20, 30], [5, 5, 5, 5], [1, 2, 3, 4]]
+        )
+        self.assertEqual(
+            [[3, 1, 2, 1], [1, 1, 1, 1], [4, 3, 2, 1]],
+            ranks.tolist()
+        )
+        self.assertEqual(
+            [
+                [False, True, False, True],
+                [True, True, True, True],
+                [False, False, False, True],
+            ],
+            winners.tolist()
+        )
+
+    def test_score_games_matches_calc_points(self):
+        """
+        test_score_games_matches_calc_points():
+            Draw3Game.score_games() agrees with calc_points() and
+            ranks every game like sorting its scores
+        """
+        numpy = draw3_batch.numpy
+        deck_mgr = DeckManager()
+        deck = deck_mgr.deck()
+        dealt = draw3_batch.deal_batch(
+            numpy.random.default_rng(11), 200, len(deck), 12
+        )
+        scores, ranks, winners = Draw3Game.score_games(dealt, 4, deck_mgr)
+        self.assertEqual((200, 4), scores.shape)
+        self.assertEqual((200, 4), ranks.shape)
+        self.assertEqual((200, 4), winners.shape)
+
+        for game in range(200):
+            hand_scores = [
+                Draw3Game.calc_points(
+                    [deck[idx] for idx in dealt[game, seat::4]]
+                )
+                for seat in range(4)
+            ]
+            self.assertEqual(hand_scores, scores[game].tolist())
+            distinct = sorted(set(hand_scores), reverse=True)
+            self.assertEqual(
+                [distinct.index(score) + 1 for score in hand_scores],
+                ranks[game].tolist()
+            )
+            self.assertEqual(
+                [score == distinct[0] for score in hand_scores],
+                winners[game].tolist()
+            )
+
+    def test_score_games_stable_ids(self):
+        """
+        test_score_games_stable_ids():
+            card ids index the deck in natural order even after
+            deck_mgr is shuffled and drawn from
+        """
+        deck_mgr = DeckManager(rng=5)
+        dealt = [[0, 1, 2, 3, 4, 5], [51, 50, 49, 48, 47, 46]]
+        expected = Draw3Game.score_games(dealt, 2, deck_mgr)[0].tolist()
+        deck_mgr.shuffle()
+        deck_mgr.draw_cards(10)
+        self.assertEqual(
+            expected,
+            Draw3Game.score_games(dealt, 2, deck_mgr)[0].tolist()
+        )
+        # 2+4+6 of Spades, Ace+Queen+10 of Clubs
+        self.assertEqual([[12, 15], [4 * 36, 4 * 33]], expected)
+
+    def test_score_games_errors(self):
+        """
+        test_score_games_errors():
+            card ids must be 2-D with whole rounds per game and
+            index the deck template
+        """
+        self.assertRaises(ValueError, Draw3Game.score_games, [1, 2, 3], 3)
+        self.assertRaises(
+            ValueError, Draw3Game.score_games, [[1, 2, 3, 4]], 3
+        )
+        # numpy would score -1 as the last card of the template
+        self.assertRaises(
+            ValueError, Draw3Game.score_games, [[0, 1, -1]], 3
+        )
+        self.assertRaises(
+            ValueError, Draw3Game.score_games, [[0, 1, 52]], 3
+        )
+        self.assertEqual(
+            (1, 3), Draw3Game.score_games([[0, 1, 51]], 3)[0].shape
+        )
+        scores, ranks, winners = Draw3Game.score_games(
+            [[0, 1, 2, 3, 4, 5]], 2
+        )
+        # 2+4+6 of Spades against 3+5+7 of Spades
+        self.assertEqual([[12, 15]], scores.tolist())
+        self.assertEqual([[2, 1]], ranks.tolist())
+        self.assertEqual([[False, True]], winners.tolist())
@@ -0,0 +1,149 @@
+"""
+test_draw3_odds.py:
+    tests exact Draw3 odds against brute force enumeration
+"""
+from fractions import Fraction
+from itertools import combinations, permutations
+from unittest import TestCase
+
+from cardgame.classes.card import Card
+from cardgame.classes.cardgame import NeedMorePlayers
+from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.deckmanager import EmptyDeckError, InvalidDeckError
+from cardgame.classes.draw3_odds import Draw3Odds
+from cardgame.classes.extendeddeckmanager import ExtendedDeckManager
+
+from .helper import Helper
+
+
+class TestDraw3Odds(TestCase):
+    """
+    TestDraw3Odds():
+        tests Draw3Odds() score distribution and seat odds
+    """
+    @staticmethod
+    def brute_force(deck, num_players, hand_size=2):
+        """
+        brute_force(deck, num_players, hand_size=2):
+            returns (win, tie) probability for seat 0 by playing
+            every possible deal
+        """
+        win = 0
+        tie = 0
+        deals = 0
+        for order in permutations(range(len(deck)), num_players * hand_size):
+            scores = [
+                Draw3Game.calc_points(
+                    [deck[idx] for idx in order[seat::num_players]]
+                )
+                for seat in range(num_players)
+            ]
+            deals += 1
+            if scores[0] == max(scores):
+                if scores.count(scores[0]) == 1:
+                    win += 1
+                else:
+                    tie += 1
+
+        return (Fraction(win, deals), Fraction(tie, deals))
+
+    def test_score_distribution(self):
+        """
+        test_score_distribution():
+            matches counting every possible hand
+        """
+        suits, values = Helper.custom_suits_values_2()
+        deck_mgr = ExtendedDeckManager.from_suits_and_values(suits, values)
+        deck = deck_mgr.deck()
+        expected = {}
+        hands = list(combinations(deck, 3))
+        for hand in hands:
+            score = Draw3Game.calc_points(hand)
+            expected[score] = expected.get(score, 0) + Fraction(1, len(hands))
+
+        distribution = Draw3Odds(deck_mgr).score_distribution()
+        self.assertEqual(expected, distribution)
+        self.assertEqual(1, sum(distribution.values()))
+
+    def test_seat_odds_brute_force(self):
+        """
+        test_seat_odds_brute_force():
+            matches brute force for 2 and 3 players on small decks
+        """
+        for suits_values in (
+            Helper.custom_suits_values_1(),
+            Helper.custom_suits_values_2(),
+        ):
+            deck_mgr = ExtendedDeckManager.from_suits_and_values(
+                *suits_values
+            )
+            odds = Draw3Odds(deck_mgr, hand_size=2)
+            for num_players in (2, 3):
+                win, tie = TestDraw3Odds.brute_force(
+                    deck_mgr.deck(), num_players
+                )
+                seats = odds.seat_odds(num_players)
+                self.assertEqual(num_players, len(seats))
+                for seat in seats:
+                    self.assertEqual(win, seat['win'])
+                    self.assertEqual(tie, seat['tie'])
+                    self.assertEqual(1, seat['win'] + seat['tie'] +
+                                     seat['lose'])
+
+    def test_standard_deck(self):
+        """
+        test_standard_deck():
+            2 player odds on a 52-card deck add up
+        """
+        seats = Draw3Odds().seat_odds(2)
+        # one seat wins alone or both tie
+        self.assertEqual(1, 2 * seats[0]['win'] + seats[0]['tie'])
+        self.assertEqual(3, Draw3Odds().hand_size)
+        self.assertEqual(9, min(seats[0]['scores']))
+        # Ace, King and Queen of Clubs
+        self.assertEqual(4 * (14 + 13 + 12), max(seats[0]['scores']))
+
+    def test_many_players(self):
+        """
+        test_many_players():
+            3 and 4 players on a 30-card deck get the known odds
+        """
+        deck_mgr = ExtendedDeckManager.from_suits_and_values(
+            ['S', 'D', 'H'],
+            ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J']
+        )
+        odds = Draw3Odds(deck_mgr)
+        seats = odds.seat_odds(3)
+        self.assertEqual(Fraction(557121449, 1716858000), seats[0]['win'])
+        self.assertEqual(Fraction(1485314, 83458375), seats[0]['tie'])
+        seats = odds.seat_odds(4)
+        self.assertEqual(
+            Fraction(258093943249, 1065596532000),
+            seats[0]['win']
+        )
+        self.assertEqual(
+            Fraction(42012044447, 2663991330000),
+            seats[0]['tie']
+        )
+
+    def test_errors(self):
+        """
+        test_errors():  test invalid decks and player counts
+        """
+        suits, values = Helper.custom_suits_values_1()
+        deck_mgr = ExtendedDeckManager.from_suits_and_values(suits, values)
+        self.assertRaises(EmptyDeckError, Draw3Odds(deck_mgr).seat_odds, 3)
+        self.assertRaises(NeedMorePlayers, Draw3Odds(deck_mgr).seat_odds, 0)
+        self.assertEqual(
+            1,
+            Draw3Odds(deck_mgr).seat_odds(1)[0]['win']
+        )
+        self.assertRaises(
+            InvalidDeckError,
+            Draw3Odds,
+            ExtendedDeckManager.from_deck([Card('Suit', 'Value', -1, 2)])
+        )
+        self.assertRaises(
+            EmptyDeckError,
+            Draw3Odds(deck_mgr, hand_size=9).score_distribution
+        )
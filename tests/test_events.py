@@ -0,0 +1,132 @@
+"""
+test_events.py:
+    tests GameEvents() subscriber lists, game events and PhaseTimer()
+"""
+from itertools import count
+from unittest import TestCase
+
+from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.events import (
+    DRAW,
+    EVENTS,
+    GAME_OVER,
+    GAME_START,
+    RANKINGS,
+    ROUND_START,
+    SHUFFLE,
+    TURN,
+    GameEvents,
+    PhaseTimer,
+    UnknownEventError
+)
+
+from .helper import Helper
+
+
+class TestEvents(TestCase):
+    """
+    TestEvents():
+        tests subscribing to events and events emitted by Draw3Game()
+    """
+    @staticmethod
+    def play(game):
+        """
+        play(game):  plays game to the end
+        """
+        game.start_game()
+        while game.next_turn() is not None:
+            pass
+
+    def test_game_events(self):
+        """
+        test_game_events():
+            subscribe(), unsubscribe() and emit()
+        """
+        events = GameEvents()
+        self.assertFalse(events)
+        calls = []
+        events.subscribe(TURN, calls.append)
+        self.assertTrue(events)
+        self.assertEqual((calls.append,), events.subscribers(TURN))
+        events.emit(TURN, 'a')
+        events.emit(DRAW, 'b')
+        self.assertEqual(['a'], calls)
+
+        events.unsubscribe(TURN, calls.append)
+        events.unsubscribe(TURN, calls.append)
+        self.assertFalse(events)
+        events.emit(TURN, 'c')
+        self.assertEqual(['a'], calls)
+        self.assertRaises(
+            UnknownEventError, events.subscribe, 'bogus', calls.append
+        )
+
+    def test_draw3_events(self):
+        """
+        test_draw3_events():
+            Draw3Game() emits every event in order
+        """
+        game = Draw3Game(rng=1)
+        game.setup_game(player_names=Helper.generate_player_names(2))
+        self.assertEqual((), game.subscribers(TURN))
+
+        seen = []
+        callbacks = {
+            event: (lambda *args, event=event: seen.append((event, args)))
+            for event in EVENTS
+        }
+        for event, callback in callbacks.items():
+            game.subscribe(event, callback)
+
+        self.play(game)
+        rankings = game.player_rankings()
+
+        names = [event for event, _ in seen]
+        self.assertEqual([GAME_START, SHUFFLE, ROUND_START], names[:3])
+        self.assertEqual([GAME_OVER, RANKINGS], names[-2:])
+        self.assertEqual(6, names.count(DRAW))
+        self.assertEqual(6, names.count(TURN))
+        self.assertEqual(
+            [1, 2, 3],
+            [args[1] for event, args in seen if event == ROUND_START]
+        )
+        for event, args in seen:
+            self.assertIs(game, args[0])
+            if event == DRAW:
+                self.assertIn(args[2], args[1].hand)
+        self.assertEqual(rankings, seen[-1][1][1])
+
+        # after everyone unsubscribes the game stops emitting
+        for event, callback in callbacks.items():
+            game.unsubscribe(event, callback)
+        self.assertIsNone(game._events)  # pylint: disable=protected-access
+        seen.clear()
+        self.play(game)
+        self.assertEqual([], seen)
+
+    def test_phase_timer(self):
+        """
+        test_phase_timer():
+            counts events and charges time since the previous event
+        """
+        # every clock() call is one second later
+        timer = PhaseTimer(clock=count().__next__)
+        game = Draw3Game(rng=2)
+        game.setup_game(player_names=Helper.generate_player_names(3))
+        timer.attach(game)
+        self.play(game)
+        game.player_rankings()
+
+        stats = timer.stats()
+        self.assertEqual(1, stats[GAME_START]['count'])
+        self.assertEqual(0.0, stats[GAME_START]['total_s'])
+        self.assertEqual(3, stats[ROUND_START]['count'])
+        self.assertEqual(9, stats[DRAW]['count'])
+        self.assertEqual(9.0, stats[DRAW]['total_s'])
+        self.assertEqual(1.0, stats[TURN]['mean_s'])
+        self.assertEqual(1, stats[RANKINGS]['count'])
+
+        timer.detach(game)
+        timer.reset()
+        self.play(game)
+        self.assertEqual({}, timer.stats())
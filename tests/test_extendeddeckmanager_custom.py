@@ -121,3 +121,42 @@ class TestExtendedDeckManagerCustom(TestCase):
         )
 
         self.base_tests(deck_mgr, deck, suits_ranking, values_ranking)
+
+    def test_template_cache(self):
+        """
+        test_template_cache():
+            custom decks are copied from a cached template and
+            never build the default deck
+        """
+        suits_ranking, values_ranking = Helper.custom_suits_values_2()
+        ExtendedDeckManager.clear_template_cache()
+
+        deck_mgr1 = ExtendedDeckManager.from_suits_and_values(
+            suits_ranking,
+            values_ranking
+        )
+        # only the custom template was built
+        info = ExtendedDeckManager.template_cache_info()
+        self.assertEqual((0, 1, 1), (info.hits, info.misses, info.currsize))
+
+        deck_mgr2 = ExtendedDeckManager.from_suits_and_values(
+            suits_ranking,
+            values_ranking
+        )
+        info = ExtendedDeckManager.template_cache_info()
+        self.assertEqual((1, 1), (info.hits, info.misses))
+
+        # decks share Card() objects, not lists
+        deck1 = deck_mgr1.deck()
+        deck2 = deck_mgr2.deck()
+        self.assertEqual(deck1, deck2)
+        self.assertIs(deck1[0], deck2[0])
+        deck_mgr1.draw_card()
+        self.assertEqual(len(deck2), len(deck_mgr2.deck()))
+
+        # from_deck() does not touch the template cache
+        ExtendedDeckManager.from_deck(deck1, suits_ranking, values_ranking)
+        self.assertEqual(
+            info,
+            ExtendedDeckManager.template_cache_info()
+        )
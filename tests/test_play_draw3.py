@@ -0,0 +1,167 @@
+"""
+test_play_draw3.py:
+    tests tournament helpers in play_draw3
+"""
+import asyncio
+import io
+import json
+import os
+import socket
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase, TestCase, skipUnless
+
+import play_draw3
+from cardgame.classes.table_pool import TablePool
+
+from .helper import Helper
+
+
+class TestPlayDraw3(TestCase):
+    """
+    TestPlayDraw3():
+        tests play_games(), merge_tallies() and run_tournament()
+    """
+    def test_play_games(self):
+        """
+        test_play_games():
+            every game has a winner or a tie and seeds replay games
+        """
+        names = Helper.generate_player_names(3)
+        tally = play_draw3.play_games((names, 50, False, "seed:0"))
+        self.assertEqual(names, list(tally))
+        # ties count once per tied player, so at least one
+        # win or tie per game
+        wins = sum(counts['wins'] for counts in tally.values())
+        ties = sum(counts['ties'] for counts in tally.values())
+        self.assertLessEqual(50, wins + ties)
+        self.assertEqual(
+            tally,
+            play_draw3.play_games((names, 50, False, "seed:0"))
+        )
+
+    def test_merge_tallies(self):
+        """
+        test_merge_tallies():
+            tallies are summed per player name
+        """
+        merged = play_draw3.merge_tallies(
+            [
+                {'A': {'wins': 1, 'ties': 0, 'points': 30}},
+                {
+                    'A': {'wins': 0, 'ties': 1, 'points': 20},
+                    'B': {'wins': 2, 'ties': 1, 'points': 50},
+                },
+            ]
+        )
+        self.assertEqual({'wins': 1, 'ties': 1, 'points': 50}, merged['A'])
+        self.assertEqual({'wins': 2, 'ties': 1, 'points': 50}, merged['B'])
+
+    def test_run_tournament(self):
+        """
+        test_run_tournament():
+            same seed and workers give the same results
+        """
+        names = Helper.generate_player_names(2)
+        tally1 = play_draw3.run_tournament(names, 40, 2, seed=5)
+        tally2 = play_draw3.run_tournament(names, 40, 2, seed=5)
+        self.assertEqual(tally1, tally2)
+        games = sum(
+            counts['wins'] + counts['ties'] / 2 for counts in tally1.values()
+        )
+        self.assertEqual(40, games)
+
+    def test_serve_stream(self):
+        """
+        test_serve_stream():
+            every request line gets a response line in order,
+            seeded requests play the same game as the command line
+        """
+        requests = [
+            {'players': 'Ann,Bob,Cy', 'seed': 3, 'id': 1},
+            {'players': ['Ann', 'Bob', 'Cy'], 'seed': 3, 'random_off': True},
+            {'players': ['Ann', 'Bob', 'Cy'], 'seed': 3, 'id': 'again'},
+            {'players': ['Ann', 'ann']},
+            {'players': ['Ann']},
+            {'players': Helper.generate_player_names(9)},
+            {'players': 'Ann,Bob', 'seed': 'x'},
+            [],
+        ]
+        infile = io.StringIO(
+            '\n'.join(json.dumps(req) for req in requests) + '\n\nnot json\n'
+        )
+        outfile = io.StringIO()
+        pool = TablePool()
+        play_draw3.serve_stream(infile, outfile, pool)
+        responses = [
+            json.loads(line) for line in outfile.getvalue().splitlines()
+        ]
+
+        self.assertEqual(9, len(responses))
+        game = play_draw3.create_game(['Ann', 'Bob', 'Cy'], rng=3)
+        game.start_game()
+        rankings = game.play_to_completion()
+        self.assertEqual(
+            {
+                'ok': True,
+                'turn_order': game.get_turn_order(),
+                'winners': [p.name for p in game.winners()],
+                'scores': {p.name: p.score for p in rankings},
+                'id': 1,
+            },
+            responses[0]
+        )
+        self.assertEqual(['Ann', 'Bob', 'Cy'], responses[1]['turn_order'])
+        # the pooled game replays the first request
+        self.assertEqual('again', responses[2].pop('id'))
+        del responses[0]['id']
+        self.assertEqual(responses[0], responses[2])
+        self.assertEqual(2, pool.hits)
+
+        self.assertEqual(
+            [
+                'DuplicatePlayerName',
+                'NeedMorePlayers',
+                'MaxPlayersHit',
+                'InvalidRequest',
+                'InvalidRequest',
+                'InvalidRequest',
+            ],
+            [response['error'] for response in responses[3:]]
+        )
+
+
+class TestServeUnix(IsolatedAsyncioTestCase):
+    """
+    TestServeUnix():
+        tests play_draw3 --serve over a Unix socket
+    """
+    @skipUnless(hasattr(socket, 'AF_UNIX'), "needs Unix sockets")
+    async def test_pipelined_requests(self):
+        """
+        test_pipelined_requests():
+            requests written at once are answered in order
+        """
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'draw3.sock')
+            server = await play_draw3.start_unix_server(path)
+            reader, writer = await asyncio.open_unix_connection(path)
+            writer.write(
+                b''.join(
+                    json.dumps(
+                        {'players': 'Ann,Bob', 'seed': idx, 'id': idx}
+                    ).encode() + b'\n'
+                    for idx in range(20)
+                )
+            )
+            await writer.drain()
+
+            responses = [
+                json.loads(await reader.readline()) for _ in range(20)
+            ]
+            self.assertEqual(list(range(20)), [r['id'] for r in responses])
+            self.assertTrue(all(r['ok'] for r in responses))
+
+            writer.close()
+            await writer.wait_closed()
+            server.close()
+            await server.wait_closed()
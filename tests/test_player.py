@@ -101,3 +101,70 @@ class TestPlayer(TestCase):
         )
         self.assertEqual(expected_str, str(player))
         self.assertEqual(expected_str, player.__repr__())
+
+    def test_player_hand_access(self):
+        """
+        test_player_hand_access():
+            snapshot, iterator and last card read the hand
+            without copying it each time
+        """
+        player = Player('Mabel')
+        self.assertEqual(None, player.last_card)
+        self.assertEqual((), player.hand_snapshot())
+
+        hand = TestPlayer.generate_hand("1", 2)
+        hand.append(Card("Suit2", "Value2", 1, 1))
+        player.hand = hand
+        snapshot = player.hand_snapshot()
+        self.assertEqual(tuple(hand), snapshot)
+        # same snapshot until the hand changes
+        self.assertIs(snapshot, player.hand_snapshot())
+        self.assertEqual(hand, list(player.iter_hand()))
+        self.assertEqual(hand[-1], player.last_card)
+
+        player.hand = hand[:1]
+        self.assertEqual(tuple(hand[:1]), player.hand_snapshot())
+        self.assertEqual(hand[0], player.last_card)
+
+    def test_player_copy_hand(self):
+        """
+        test_player_copy_hand():
+            copied player has its own hand
+        """
+        player1 = Player('Fred')
+        player1.hand = TestPlayer.generate_hand("1", 3)
+        player1.score = 5
+        player2 = player1.__copy__()
+        self.assertEqual(player1.hand, player2.hand)
+        self.assertEqual(5, player2.score)
+        player2.hand = []
+        self.assertEqual(3, len(player1.hand))
+
+    def test_player_reset(self):
+        """
+        test_player_reset():
+            reset() empties the hand in place and zeroes the score
+        """
+        player = Player('Fred')
+        player.hand = TestPlayer.generate_hand("1", 3)
+        player.score = 5
+        player.hand_snapshot()
+        player.reset()
+        self.assertEqual([], player.hand)
+        self.assertEqual((), player.hand_snapshot())
+        self.assertEqual(None, player.last_card)
+        self.assertEqual(0, player.score)
+
+    def test_player_add_cards(self):
+        """
+        test_player_add_cards():
+            add_cards() appends cards in order
+        """
+        player = Player('Fred')
+        hand = TestPlayer.generate_hand("1", 3)
+        player.add_cards(hand[:1])
+        self.assertEqual((hand[0],), player.hand_snapshot())
+        player.add_cards(iter(hand[1:]))
+        self.assertEqual(hand, player.hand)
+        self.assertEqual(hand[2], player.last_card)
+        self.assertEqual(tuple(hand), player.hand_snapshot())
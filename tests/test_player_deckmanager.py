@@ -51,3 +51,15 @@ class TestPlayerDeckManager(TestPlayer, TestDeckManager):
         self.assertEqual(deck[0], self._player1.hand[0])
         self._player2.draw_card(self._deckmgr)
         self.assertEqual(deck[1], self._player2.hand[0])
+
+    def test_player_drawcard_snapshot(self):
+        """
+        test_player_drawcard_snapshot():
+            drawing a card updates last_card and the snapshot
+        """
+        deck = self._deckmgr.deck()
+        snapshot = self._player1.hand_snapshot()
+        card = self._player1.draw_card(self._deckmgr)
+        self.assertEqual(deck[0], card)
+        self.assertIs(card, self._player1.last_card)
+        self.assertEqual(snapshot + (card,), self._player1.hand_snapshot())
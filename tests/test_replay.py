@@ -0,0 +1,284 @@
+"""
+test_replay.py:
+    tests ReplayWriter() event logs and ReplayReader() replay and seek
+"""
+import io
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.cardgame_draw3_large import LargeDraw3Game
+from cardgame.classes.events import (
+    DRAW,
+    GAME_OVER,
+    GAME_START,
+    RANKINGS,
+    ROUND_START,
+    SHUFFLE
+)
+from cardgame.classes.replay import (
+    CARD_RECORD,
+    SNAPSHOT_RECORD,
+    ReplayError,
+    ReplayReader,
+    ReplayWriter,
+    iter_frames
+)
+
+from .helper import Helper
+
+
+class CountingBytesIO(io.BytesIO):
+    """
+    CountingBytesIO():  BytesIO() that counts bytes read
+    """
+    def __init__(self, data):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+class TestReplay(TestCase):
+    """
+    TestReplay():
+        logs games and replays them
+    """
+    @staticmethod
+    def play_games(writer, seeds, num_players=3):
+        """
+        play_games(writer, seeds, num_players=3):
+            plays one logged game per seed, returns
+            [(drawn cards, rankings, games after each turn)]
+        """
+        played = []
+        for seed in seeds:
+            game = Draw3Game(rng=seed)
+            game.setup_game(
+                player_names=Helper.generate_player_names(num_players)
+            )
+            writer.attach(game)
+            game.start_game()
+            draws = []
+            hands = [[p.hand for p in game.get_current_players()]]
+            player = game.next_turn()
+            while player is not None:
+                draws.append((player.name, player.last_card))
+                hands.append([p.hand for p in game.get_current_players()])
+                player = game.next_turn()
+            rankings = [(p.name, p.score) for p in game.player_rankings()]
+            writer.detach(game)
+            played.append((draws, rankings, hands))
+
+        return played
+
+    def test_events(self):
+        """
+        test_events():  events() replays every logged game in order
+        """
+        stream = io.BytesIO()
+        with ReplayWriter(stream, buffer_size=64) as writer:
+            played = self.play_games(writer, [1, 2])
+            self.assertEqual(2, writer.games)
+
+        stream.seek(0)
+        events = list(ReplayReader(stream).events())
+        starts = [data for event, data in events if event == GAME_START]
+        self.assertEqual(
+            [(0, Helper.generate_player_names(3)),
+             (1, Helper.generate_player_names(3))],
+            starts
+        )
+        self.assertEqual(
+            [draw for draws, _, _ in played for draw in draws],
+            [data for event, data in events if event == DRAW]
+        )
+        self.assertEqual(
+            [rankings for _, rankings, _ in played],
+            [data for event, data in events if event == RANKINGS]
+        )
+        self.assertEqual(
+            [1, 2, 3, 1, 2, 3],
+            [data for event, data in events if event == ROUND_START]
+        )
+        self.assertEqual(
+            2, sum(1 for event, _ in events if event == SHUFFLE)
+        )
+        self.assertEqual(
+            [GAME_OVER, RANKINGS], [event for event, _ in events[-2:]]
+        )
+
+    def test_seek(self):
+        """
+        test_seek():  seek() restores a game at any turn
+        """
+        stream = io.BytesIO()
+        with ReplayWriter(stream, snapshot_every=4) as writer:
+            played = self.play_games(writer, [3, 4, 5])
+
+        snapshots = [
+            record for record, _ in iter_frames(io.BytesIO(
+                stream.getvalue()
+            ))
+            if record == SNAPSHOT_RECORD
+        ]
+        # turn 0, 4 and 8 of each 9 turn game
+        self.assertEqual(9, len(snapshots))
+
+        reader = ReplayReader(stream)
+        for game_num, (_, _, hands) in enumerate(played):
+            for turn, turn_hands in enumerate(hands):
+                game = reader.seek(game_num, turn)
+                self.assertEqual(
+                    turn_hands,
+                    [p.hand for p in game.get_current_players()]
+                )
+
+        self.assertRaises(ReplayError, reader.seek, 3, 0)
+        self.assertRaises(ReplayError, reader.seek, 0, 10)
+
+        # frames are indexed once, a seek reads one snapshot frame
+        data = stream.getvalue()
+        counting = CountingBytesIO(data)
+        reader = ReplayReader(counting)
+        reader.seek(2, 8)
+        counting.bytes_read = 0
+        game = reader.seek(0, 5)
+        self.assertLess(counting.bytes_read, len(data) // 4)
+        self.assertEqual(
+            played[0][2][5],
+            [p.hand for p in game.get_current_players()]
+        )
+
+    def test_seek_large_game(self):
+        """
+        test_seek_large_game():
+            LargeDraw3Game() with removed and skipped players is
+            logged and restored at any turn
+        """
+        game = LargeDraw3Game(rng=12)
+        game.setup_game(player_names=Helper.generate_player_names(6))
+        game.remove_player('Player3')
+
+        stream = io.BytesIO()
+        with ReplayWriter(stream, snapshot_every=4) as writer:
+            writer.attach(game)
+            game.start_game()
+            game.skip_player('Player1')
+            hands = [[p.hand for p in game.get_current_players()]]
+            while game.next_turn() is not None:
+                hands.append([p.hand for p in game.get_current_players()])
+
+        reader = ReplayReader(stream)
+        for turn, turn_hands in enumerate(hands):
+            restored = reader.seek(0, turn)
+            self.assertIsInstance(restored, LargeDraw3Game)
+            self.assertEqual(
+                turn_hands,
+                [p.hand for p in restored.get_current_players()]
+            )
+
+    def test_append_to_file(self):
+        """
+        test_append_to_file():
+            logs opened from a path are appended to, game numbers
+            and card ids go on from the existing log
+        """
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'games.log')
+            with ReplayWriter(path) as writer:
+                self.play_games(writer, [6])
+            with ReplayWriter(path) as writer:
+                self.assertEqual(1, writer.games)
+                played = self.play_games(writer, [7])
+                self.assertEqual(2, writer.games)
+
+            with open(path, 'rb') as log:
+                events = list(ReplayReader(log).events())
+                log.seek(0)
+                cards = sum(
+                    1 for record, _ in iter_frames(log)
+                    if record == CARD_RECORD
+                )
+                game = ReplayReader(log).seek(1, 9)
+
+        self.assertEqual(
+            2, sum(1 for event, _ in events if event == GAME_OVER)
+        )
+        self.assertEqual(
+            [0, 1],
+            [data[0] for event, data in events if event == GAME_START]
+        )
+        self.assertEqual(
+            played[0][0],
+            [data for event, data in events if event == DRAW][9:]
+        )
+        # cards drawn in both games are defined once
+        self.assertEqual(
+            len({data[1] for event, data in events if event == DRAW}),
+            cards
+        )
+        self.assertEqual(
+            played[0][1],
+            [(p.name, p.score) for p in game.player_rankings()]
+        )
+
+    def test_seek_while_logging(self):
+        """
+        test_seek_while_logging():
+            games written after a seek are found by the next seek
+        """
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'games.log')
+            with ReplayWriter(path) as writer, open(path, 'rb') as log:
+                reader = ReplayReader(log)
+                played = self.play_games(writer, [8])
+                writer.flush()
+                self.assertRaises(ReplayError, reader.seek, 1, 0)
+                self.assertEqual(
+                    played[0][2][3],
+                    [p.hand for p in reader.seek(0, 3).get_current_players()]
+                )
+                played += self.play_games(writer, [9])
+                writer.flush()
+                self.assertEqual(
+                    played[1][2][5],
+                    [p.hand for p in reader.seek(1, 5).get_current_players()]
+                )
+
+    def test_events_after_seek(self):
+        """
+        test_events_after_seek():
+            events() starts from the first frame after seek() and
+            keeps its place when seek() is called in between
+        """
+        stream = io.BytesIO()
+        with ReplayWriter(stream) as writer:
+            self.play_games(writer, [8, 9])
+
+        expected = list(ReplayReader(io.BytesIO(stream.getvalue())).events())
+        reader = ReplayReader(stream)
+        reader.seek(1, 5)
+        self.assertEqual(expected, list(reader.events()))
+
+        events = reader.events()
+        mixed = [next(events) for _ in range(10)]
+        reader.seek(0, 3)
+        mixed.extend(events)
+        self.assertEqual(expected, mixed)
+
+    def test_truncated(self):
+        """
+        test_truncated():  truncated logs raise ReplayError
+        """
+        stream = io.BytesIO()
+        with ReplayWriter(stream) as writer:
+            self.play_games(writer, [8])
+
+        data = stream.getvalue()
+        reader = ReplayReader(io.BytesIO(data[:-3]))
+        self.assertRaises(ReplayError, list, reader.events())
@@ -0,0 +1,351 @@
+"""
+test_rng.py:
+    tests per-instance rngs for deck managers and games
+"""
+import random
+from array import array
+from unittest import TestCase, skipIf
+
+from cardgame.classes import draw3_batch
+from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.compactdeckmanager import CompactDeckManager
+from cardgame.classes.deckmanager import DeckManager
+from cardgame.classes.extendeddeckmanager import ExtendedDeckManager
+from cardgame.classes.rng import (
+    PERMUTATION_BATCH_BYTES,
+    PERMUTATION_CACHE_SIZE,
+    BatchedPermutationRNG,
+    NumpyRNG,
+    make_rng,
+    reorder
+)
+
+from .helper import Helper
+
+
+class DuckRNG:
+    """
+    DuckRNG():  rng that is not a random.Random(), records calls
+    """
+    def __init__(self):
+        self.calls = []
+
+    def shuffle(self, seq):
+        """
+        shuffle(seq):  reverses seq
+        """
+        self.calls.append('shuffle')
+        seq.reverse()
+
+    def randrange(self, stop):
+        """
+        randrange(stop):  returns stop - 1
+        """
+        self.calls.append('randrange')
+        return stop - 1
+
+
+class TestRNG(TestCase):
+    """
+    TestRNG():
+        tests make_rng() and seeding deck managers and games
+    """
+    def test_make_rng(self):
+        """
+        test_make_rng():
+            test supported rng inputs
+        """
+        rng = random.Random(1)
+        self.assertIs(rng, make_rng(rng))
+        self.assertIsInstance(make_rng(), random.Random)
+        self.assertEqual(
+            make_rng(5).random(),
+            random.Random(5).random()
+        )
+
+        # any object with shuffle() and randrange() is used as is
+        duck = DuckRNG()
+        self.assertIs(duck, make_rng(duck))
+        deck = DeckManager().deck()
+        self.assertEqual(deck[::-1], DeckManager(rng=duck).shuffle())
+        self.assertEqual(['shuffle'], duck.calls)
+
+    def test_reorder(self):
+        """
+        test_reorder():  reorder lists and arrays in place
+        """
+        items = ['a', 'b', 'c']
+        reorder(items, [2, 0, 1])
+        self.assertEqual(['c', 'a', 'b'], items)
+        ids = array('H', [10, 20, 30])
+        reorder(ids, [1, 2, 0])
+        self.assertEqual(array('H', [20, 30, 10]), ids)
+
+    def test_seeded_deck_manager(self):
+        """
+        test_seeded_deck_manager():
+            same seed shuffles the same way, without touching
+            the global random module
+        """
+        state = random.getstate()
+        self.assertEqual(
+            DeckManager(rng=3).shuffle(),
+            DeckManager(rng=3).shuffle()
+        )
+        self.assertNotEqual(
+            DeckManager(rng=3).shuffle(),
+            DeckManager(rng=4).shuffle()
+        )
+        self.assertEqual(
+            CompactDeckManager(rng=3).shuffle(),
+            DeckManager(rng=3).shuffle()
+        )
+        suits, values = Helper.custom_suits_values_2()
+        self.assertEqual(
+            ExtendedDeckManager.from_suits_and_values(
+                suits, values, rng=9
+            ).shuffle(),
+            ExtendedDeckManager.from_suits_and_values(
+                suits, values, rng=random.Random(9)
+            ).shuffle()
+        )
+        self.assertEqual(state, random.getstate())
+
+    def test_seeded_game(self):
+        """
+        test_seeded_game():
+            games with the same seed play the same
+        """
+        def play(seed):
+            game = Draw3Game(rng=seed)
+            game.setup_game(player_names=Helper.generate_player_names(5))
+            game.start_game()
+            while game.next_turn() is not None:
+                pass
+            return (
+                game.get_turn_order(),
+                [(p.name, p.score) for p in game.player_rankings()]
+            )
+
+        self.assertEqual(play(11), play(11))
+        self.assertNotEqual(play(11), play(12))
+
+
+class DrawOnlyRNG(random.Random):
+    """
+    DrawOnlyRNG():
+        rng that fails if the whole deck is shuffled
+    """
+    def shuffle(self, *args, **kwargs):
+        raise AssertionError("whole deck shuffled")
+
+
+class TestLazyShuffle(TestCase):
+    """
+    TestLazyShuffle():
+        tests lazy_shuffle() draw-on-demand shuffling
+    """
+    def test_draws_only_pick_cards(self):
+        """
+        test_draws_only_pick_cards():
+            drawing after lazy_shuffle() never shuffles the whole deck
+        """
+        for deck_cls in (DeckManager, CompactDeckManager):
+            deck_mgr = deck_cls(rng=DrawOnlyRNG(2))
+            full_deck = deck_mgr.deck()
+            deck_mgr.lazy_shuffle()
+            self.assertTrue(deck_mgr.shuffle_pending)
+            drawn = [deck_mgr.draw_card() for _ in range(len(full_deck))]
+            self.assertEqual(sorted(full_deck), sorted(drawn))
+            self.assertNotEqual(full_deck, drawn)
+
+    def test_seeded_lazy_shuffle(self):
+        """
+        test_seeded_lazy_shuffle():
+            same seed draws the same cards, list and compact decks agree
+        """
+        def draw(deck_cls, seed):
+            deck_mgr = deck_cls(rng=seed)
+            deck_mgr.lazy_shuffle()
+            return [deck_mgr.draw_card() for _ in range(9)]
+
+        self.assertEqual(draw(DeckManager, 5), draw(DeckManager, 5))
+        self.assertNotEqual(draw(DeckManager, 5), draw(DeckManager, 6))
+        self.assertEqual(draw(DeckManager, 5), draw(CompactDeckManager, 5))
+
+    def test_lazy_draw_cards(self):
+        """
+        test_lazy_draw_cards():
+            draw_cards() after lazy_shuffle() draws what draw_card()
+            calls would, for list and compact decks
+        """
+        for deck_cls in (DeckManager, CompactDeckManager):
+            deck_mgr1 = deck_cls(rng=3)
+            deck_mgr2 = deck_cls(rng=3)
+            deck_mgr1.lazy_shuffle()
+            deck_mgr2.lazy_shuffle()
+            self.assertEqual(
+                [deck_mgr1.draw_card() for _ in range(20)],
+                deck_mgr2.draw_cards(20)
+            )
+            self.assertEqual(
+                deck_mgr1.draw_cards(32),
+                [deck_mgr2.draw_card() for _ in range(32)]
+            )
+
+    def test_lazy_shuffle_is_uniform(self):
+        """
+        test_lazy_shuffle_is_uniform():
+            every card is about as likely to be drawn first
+        """
+        rng = random.Random(7)
+        counts = {}
+        for _ in range(6000):
+            deck_mgr = ExtendedDeckManager.from_suits_and_values(
+                ['Spades', 'Hearts'], ['2', '3', '4'], rng=rng
+            )
+            deck_mgr.lazy_shuffle()
+            card = deck_mgr.draw_card()
+            counts[card] = counts.get(card, 0) + 1
+
+        self.assertEqual(6, len(counts))
+        for count in counts.values():
+            self.assertTrue(850 < count < 1150, counts)
+
+    def test_reading_finishes_shuffle(self):
+        """
+        test_reading_finishes_shuffle():
+            deck(), deck_view() and peek_card() see a shuffled deck
+        """
+        for deck_cls in (ExtendedDeckManager, CompactDeckManager):
+            deck_mgr = deck_cls(rng=3)
+            full_deck = deck_mgr.deck()
+            deck_mgr.lazy_shuffle()
+            deck_mgr.draw_card()
+            card = deck_mgr.peek_card(1)
+            self.assertFalse(deck_mgr.shuffle_pending)
+            deck = deck_mgr.deck()
+            self.assertEqual(card, deck[0])
+            self.assertEqual(51, len(set(deck)))
+            self.assertTrue(set(deck) < set(full_deck))
+            self.assertNotEqual(full_deck[1:], deck)
+            self.assertEqual(deck, deck_mgr.deck_view())
+
+            deck_mgr.lazy_shuffle()
+            deck_mgr.sort()
+            self.assertFalse(deck_mgr.shuffle_pending)
+
+    def test_lazy_shuffle_game(self):
+        """
+        test_lazy_shuffle_game():
+            Draw3Game.lazy_shuffle deals from a lazily shuffled deck
+        """
+        game = Draw3Game(rng=DrawOnlyRNG(4))
+        self.assertFalse(game.lazy_shuffle)
+        game.lazy_shuffle = True
+        game.random_turn_order = False
+        game.setup_game(player_names=Helper.generate_player_names(4))
+        game.start_game()
+        while game.next_turn() is not None:
+            pass
+
+        hands = [p.hand for p in game.get_current_players()]
+        self.assertEqual([3] * 4, [len(hand) for hand in hands])
+        self.assertEqual(12, len({card for hand in hands for card in hand}))
+
+
+@skipIf(draw3_batch.numpy is None, "numpy is not installed")
+class TestNumpyRNG(TestCase):
+    """
+    TestNumpyRNG():
+        tests numpy backed rngs
+    """
+    def test_numpy_generator(self):
+        """
+        test_numpy_generator():
+            numpy Generator is wrapped and reproducible
+        """
+        numpy = draw3_batch.numpy
+        rng = make_rng(numpy.random.default_rng(2))
+        self.assertIsInstance(rng, NumpyRNG)
+        self.assertIs(rng, make_rng(rng))
+        deck1 = DeckManager(rng=rng).shuffle()
+        deck2 = DeckManager(rng=numpy.random.default_rng(2)).shuffle()
+        self.assertEqual(deck1, deck2)
+        self.assertEqual(sorted(DeckManager().deck()), sorted(deck1))
+
+        state = rng.getstate()
+        value = rng.randrange(1000)
+        rng.setstate(state)
+        self.assertEqual(value, rng.randrange(1000))
+
+    def test_batched_permutations(self):
+        """
+        test_batched_permutations():
+            permutations are valid and reproducible across batches
+        """
+        rng1 = BatchedPermutationRNG(seed=8, batch_size=4)
+        rng2 = BatchedPermutationRNG(seed=8, batch_size=4)
+        self.assertEqual(4, rng1.batch_size)
+        perms = [rng1.permutation(52) for _ in range(10)]
+        for perm in perms:
+            self.assertEqual(list(range(52)), sorted(perm))
+        self.assertEqual(perms, [rng2.permutation(52) for _ in range(10)])
+        self.assertNotEqual(perms[0], perms[1])
+
+        # state includes unused permutations of the current batch
+        state = rng1.getstate()
+        deck1 = CompactDeckManager(rng=rng1).shuffle()
+        rng1.setstate(state)
+        self.assertEqual(deck1, CompactDeckManager(rng=rng1).shuffle())
+
+    def test_batched_cache_is_bounded(self):
+        """
+        test_batched_cache_is_bounded():
+            only the most recently used lengths keep a batch
+        """
+        rng = BatchedPermutationRNG(seed=2, batch_size=4)
+        for length in range(1, 41):
+            rng.permutation(length)
+        rng.permutation(35)
+        lengths = list(rng.getstate()[1])
+        self.assertEqual(PERMUTATION_CACHE_SIZE, len(lengths))
+        self.assertEqual(35, lengths[-1])
+        self.assertNotIn(32, lengths)
+
+        copy = BatchedPermutationRNG(batch_size=4)
+        copy.setstate(rng.getstate())
+        self.assertEqual(rng.permutation(40), copy.permutation(40))
+
+    def test_batched_bytes_are_bounded(self):
+        """
+        test_batched_bytes_are_bounded():
+            long sequences get fewer permutations per batch
+        """
+        rng = BatchedPermutationRNG(seed=3)
+        length = 52000
+        perm = rng.permutation(length)
+        self.assertEqual(list(range(length)), sorted(perm))
+        perms, pos = rng.getstate()[1][length]
+        self.assertEqual(0, pos)
+        self.assertLess(len(perms) + 1, rng.batch_size)
+        self.assertLessEqual(
+            (len(perms) + 1) * length * 2, PERMUTATION_BATCH_BYTES
+        )
+        self.assertEqual([], rng.permutation(0))
+
+    def test_batched_game(self):
+        """
+        test_batched_game():
+            Draw3Game() can use the batched rng for turn order and deck
+        """
+        rng = BatchedPermutationRNG(seed=1)
+        game = Draw3Game(rng=rng)
+        self.assertIs(rng, game.rng)
+        game.setup_game(player_names=Helper.generate_player_names(3))
+        game.start_game()
+        self.assertEqual(
+            sorted(Helper.generate_player_names(3)),
+            sorted(game.get_turn_order())
+        )
+        self.assertNotEqual(DeckManager().deck(), game.deck())
@@ -0,0 +1,188 @@
+# pylint:  disable=protected-access
+"""
+test_score_keeper.py:
+    tests ScoreKeeper() recording and querying game results
+"""
+import os
+import sqlite3
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from cardgame.classes.cardgame import DuplicatePlayerName
+from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.player import Player
+from cardgame.classes.score_keeper import LOSS, TIE, WIN, ScoreKeeper
+
+from .helper import Helper
+
+
+class TestScoreKeeper(TestCase):
+    """
+    TestScoreKeeper():
+        tests ScoreKeeper() batching, totals and history
+    """
+    @staticmethod
+    def rankings(*scores):
+        """
+        rankings(*scores):
+            returns players named A, B, C... with scores,
+            sorted like Draw3Game.player_rankings()
+        """
+        players = []
+        for idx, score in enumerate(scores):
+            player = Player(chr(ord('A') + idx))
+            player.score = score
+            players.append(player)
+
+        return sorted(players, key=lambda p: p.score, reverse=True)
+
+    def test_record_and_query(self):
+        """
+        test_record_and_query():
+            wins, ties, places and totals are recorded
+        """
+        with ScoreKeeper() as keeper:
+            self.assertEqual(1, keeper.record_game(self.rankings(30, 20)))
+            self.assertEqual(2, keeper.record_game(self.rankings(25, 25, 10)))
+
+            self.assertEqual(
+                {'games': 2, 'wins': 1, 'ties': 1, 'points': 55},
+                keeper.player_totals('A')
+            )
+            self.assertEqual(
+                {'games': 2, 'wins': 0, 'ties': 1, 'points': 45},
+                keeper.player_totals('B')
+            )
+            self.assertEqual(
+                {'games': 0, 'wins': 0, 'ties': 0, 'points': 0},
+                keeper.player_totals('Nobody')
+            )
+            self.assertEqual(
+                [('A', 1), ('B', 0), ('C', 0)],
+                keeper.win_counts()
+            )
+            self.assertEqual([('A', 1)], keeper.win_counts(limit=1))
+
+            history = keeper.recent_history('C')
+            self.assertEqual(1, len(history))
+            self.assertEqual(3, history[0]['place'])
+            self.assertEqual(LOSS, history[0]['outcome'])
+
+            history = keeper.recent_history('A')
+            self.assertEqual([2, 1], [row['game_id'] for row in history])
+            self.assertEqual([TIE, WIN], [row['outcome'] for row in history])
+            self.assertEqual(
+                [2],
+                [row['game_id'] for row in keeper.recent_history('A', 1)]
+            )
+
+    def test_batched_writes(self):
+        """
+        test_batched_writes():
+            games are written batch_size at a time, in WAL mode,
+            and survive reopening the database
+        """
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'scores.db')
+            keeper = ScoreKeeper(path, batch_size=3)
+            self.assertEqual(3, keeper.batch_size)
+
+            def stored():
+                with sqlite3.connect(path) as conn:
+                    return conn.execute(
+                        "SELECT COUNT(DISTINCT game_id) FROM results"
+                    ).fetchone()[0]
+
+            keeper.record_game(self.rankings(10, 20))
+            keeper.record_game(self.rankings(10, 20))
+            self.assertEqual(2, keeper.pending)
+            self.assertEqual(0, stored())
+            keeper.record_game(self.rankings(10, 20))
+            self.assertEqual(0, keeper.pending)
+            self.assertEqual(3, stored())
+
+            keeper.record_game(self.rankings(10, 20))
+            keeper.close()
+            keeper.close()
+            self.assertEqual(4, stored())
+
+            with sqlite3.connect(path) as conn:
+                self.assertEqual(
+                    'wal',
+                    conn.execute("PRAGMA journal_mode").fetchone()[0]
+                )
+
+            with ScoreKeeper(path) as keeper:
+                # game ids continue after reopening
+                self.assertEqual(5, keeper.record_game(self.rankings(1, 2)))
+                self.assertEqual(5, keeper.player_totals('B')['wins'])
+
+    def test_failed_writes(self):
+        """
+        test_failed_writes():
+            a game with a duplicate name is not queued, a game that
+            cannot be written is dropped without the rest of its
+            batch, and a locked database keeps the batch queued
+        """
+        duplicate = self.rankings(10, 20) + self.rankings(5)
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'scores.db')
+            with ScoreKeeper(path) as keeper:
+                self.assertRaises(
+                    DuplicatePlayerName,
+                    keeper.record_game,
+                    duplicate
+                )
+                self.assertEqual(0, keeper.pending)
+                self.assertEqual(1, keeper.record_game(self.rankings(1, 2)))
+
+                # a second writer hands out the same game id
+                with ScoreKeeper(path) as other:
+                    other.record_game(self.rankings(3, 4))
+
+                self.assertEqual(2, keeper.record_game(self.rankings(5, 6)))
+                self.assertRaises(sqlite3.IntegrityError, keeper.flush)
+                self.assertEqual(0, keeper.pending)
+                keeper.record_game(self.rankings(7, 8))
+                self.assertEqual(
+                    {'games': 3, 'wins': 3, 'ties': 0, 'points': 18},
+                    keeper.player_totals('B')
+                )
+
+                keeper.record_game(self.rankings(9, 10))
+                keeper._conn.execute("PRAGMA busy_timeout = 0")
+                lock = sqlite3.connect(path, isolation_level=None)
+                lock.execute("BEGIN EXCLUSIVE")
+                self.assertRaises(sqlite3.OperationalError, keeper.flush)
+                self.assertEqual(1, keeper.pending)
+                lock.execute("ROLLBACK")
+                lock.close()
+                self.assertEqual(
+                    {'games': 4, 'wins': 4, 'ties': 0, 'points': 28},
+                    keeper.player_totals('B')
+                )
+
+    def test_record_draw3_game(self):
+        """
+        test_record_draw3_game():
+            records results straight from Draw3Game.player_rankings()
+        """
+        draw3 = Draw3Game(rng=1)
+        draw3.setup_game(player_names=Helper.generate_player_names(3))
+        draw3.start_game()
+        while draw3.next_turn() is not None:
+            pass
+
+        with ScoreKeeper() as keeper:
+            keeper.record_game(draw3.player_rankings())
+            totals = [
+                keeper.player_totals(name)
+                for name in Helper.generate_player_names(3)
+            ]
+            self.assertEqual(
+                sum(p.score for p in draw3.get_current_players()),
+                sum(total['points'] for total in totals)
+            )
+            for player in draw3.winners():
+                total = keeper.player_totals(player.name)
+                self.assertEqual(1, total['wins'] + total['ties'])
@@ -0,0 +1,178 @@
+"""
+test_shoedeckmanager.py:
+    tests ShoeDeckManager() multi-deck shoe kept as card counts
+"""
+import random
+from unittest import TestCase
+
+from cardgame.classes.card import Card
+from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.deckmanager import (
+    DeckManager,
+    EmptyDeckError,
+    InvalidDeckError
+)
+from cardgame.classes.player import Player
+from cardgame.classes.shoedeckmanager import ShoeDeckManager
+
+from .helper import Helper
+
+
+class TestShoeDeckManager(TestCase):
+    """
+    TestShoeDeckManager():
+        tests counts, weighted draws and game integration
+    """
+    def test_composition(self):
+        """
+        test_composition():
+            shoe starts with num_decks of every card
+        """
+        shoe = ShoeDeckManager(6)
+        self.assertEqual(6, shoe.num_decks)
+        self.assertEqual(312, shoe.remaining)
+        composition = shoe.composition()
+        self.assertEqual(DeckManager().deck(), list(shoe.card_table()))
+        self.assertEqual(list(range(52)), list(composition))
+        self.assertEqual({6}, set(composition.values()))
+        self.assertEqual(312, len(shoe.deck()))
+        self.assertEqual(sorted(DeckManager().deck() * 6), shoe.sort())
+        self.assertEqual(shoe.deck(), shoe.deck_view())
+        self.assertRaises(InvalidDeckError, ShoeDeckManager, 0)
+
+    def test_equal_cards(self):
+        """
+        test_equal_cards():
+            cards with the same values but different names are
+            counted apart
+        """
+        cards = [
+            Card('A', 'x', 1, 2),
+            Card('B', 'x', 1, 2),
+            Card('C', 'y', 2, 3),
+        ]
+        shoe = ShoeDeckManager(2, initial_deck=cards)
+        self.assertEqual(tuple(cards), shoe.card_table())
+        self.assertEqual({0: 2, 1: 2, 2: 2}, shoe.composition())
+        self.assertEqual(shoe.remaining, sum(shoe.composition().values()))
+
+    def test_large_shoe(self):
+        """
+        test_large_shoe():
+            a 1000 deck shoe only keeps 52 counts
+        """
+        shoe = ShoeDeckManager(1000, rng=1)
+        self.assertEqual(52000, shoe.remaining)
+        self.assertEqual(52, len(shoe.composition()))
+        card = shoe.draw_card()
+        self.assertEqual(51999, shoe.remaining)
+        card_id = shoe.card_table().index(card)
+        self.assertEqual(999, shoe.composition()[card_id])
+
+    def test_draw_all(self):
+        """
+        test_draw_all():
+            every card in the shoe is drawn exactly once
+        """
+        shoe = ShoeDeckManager(2, rng=random.Random(3))
+        drawn = [shoe.draw_card() for _ in range(104)]
+        self.assertEqual(sorted(DeckManager().deck() * 2), sorted(drawn))
+        self.assertEqual({}, shoe.composition())
+        self.assertEqual([], shoe.deck())
+        self.assertRaises(EmptyDeckError, shoe.draw_card)
+
+    def test_weighted_draws(self):
+        """
+        test_weighted_draws():
+            draws follow the remaining counts
+        """
+        two = Card('Spades', '2', 1, 2)
+        three = Card('Spades', '3', 1, 3)
+        rng = random.Random(5)
+        twos = 0
+        for _ in range(4000):
+            # one 2 and three 3s
+            shoe = ShoeDeckManager(
+                1, rng=rng, initial_deck=[two, three, three, three]
+            )
+            self.assertEqual({0: 1, 1: 3}, shoe.composition())
+            twos += shoe.draw_card() == two
+
+        self.assertTrue(900 < twos < 1100, twos)
+
+    def test_deck_view(self):
+        """
+        test_deck_view():
+            deck_view() reads the counts, shuffle() only bumps the
+            version and returns nothing
+        """
+        shoe = ShoeDeckManager(3, rng=4)
+        for _ in range(10):
+            shoe.draw_card()
+        view = shoe.deck_view()
+        deck = shoe.deck()
+        self.assertEqual(len(deck), len(view))
+        self.assertEqual(deck, list(view))
+        self.assertEqual(deck[::-1], list(reversed(view)))
+        self.assertEqual(deck[0], view[0])
+        self.assertEqual(deck[-1], view[-1])
+        self.assertEqual(deck[57], view[57])
+        self.assertEqual(deck[5:9], view[5:9])
+        self.assertRaises(IndexError, view.__getitem__, len(deck))
+
+        version = shoe.version
+        self.assertIsNone(shoe.shuffle())
+        self.assertEqual(version + 1, shoe.version)
+        self.assertTrue(view.stale)
+        empty = ShoeDeckManager(1, initial_deck=[])
+        self.assertEqual(0, len(empty.deck_view()))
+
+    def test_seeded_shoe(self):
+        """
+        test_seeded_shoe():  same seed draws the same cards
+        """
+        def draw(seed):
+            shoe = ShoeDeckManager(8, rng=seed)
+            shoe.shuffle()
+            return [shoe.draw_card() for _ in range(20)]
+
+        self.assertEqual(draw(2), draw(2))
+        self.assertNotEqual(draw(2), draw(3))
+
+    def test_player_and_game(self):
+        """
+        test_player_and_game():
+            shoe works with Player.draw_card() and Draw3Game()
+        """
+        shoe = ShoeDeckManager(6, rng=1)
+        player = Player('Player')
+        card = player.draw_card(shoe)
+        self.assertEqual([card], player.hand)
+        card_id = shoe.card_table().index(card)
+        self.assertEqual(5, shoe.composition()[card_id])
+
+        draw3 = Draw3Game(rng=2)
+        draw3.setup_game(
+            deck_mgr=ShoeDeckManager(6, rng=2),
+            player_names=Helper.generate_player_names(8)
+        )
+        draw3.start_game()
+        while draw3.next_turn() is not None:
+            pass
+
+        self.assertEqual(312 - 24, len(draw3.deck_view()))
+        for player in draw3.get_current_players():
+            self.assertEqual(3, len(player.hand))
+            self.assertEqual(Draw3Game.calc_points(player.hand), player.score)
+
+    def test_reset(self):
+        """
+        test_reset():  reset() refills the shoe
+        """
+        shoe = ShoeDeckManager(4, rng=1)
+        composition = shoe.composition()
+        for _ in range(100):
+            shoe.draw_card()
+        shoe.reset()
+        self.assertEqual(208, shoe.remaining)
+        self.assertEqual(composition, shoe.composition())
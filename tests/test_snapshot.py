@@ -0,0 +1,247 @@
+# pylint:  disable=protected-access
+"""
+test_snapshot.py:
+    tests dump_game() and load_game() binary game snapshots
+"""
+import pickle
+from unittest import TestCase, skipIf
+
+from cardgame.classes import draw3_batch
+from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.cardgame_draw3_large import LargeDraw3Game
+from cardgame.classes.compactdeckmanager import CompactDeckManager
+from cardgame.classes.deckmanager import DeckManager
+from cardgame.classes.extendeddeckmanager import ExtendedDeckManager
+from cardgame.classes.rng import BatchedPermutationRNG
+from cardgame.classes.shoedeckmanager import ShoeDeckManager
+from cardgame.classes.snapshot import SnapshotError, dump_game, load_game
+
+from .helper import Helper
+
+
+class TestSnapshot(TestCase):
+    """
+    TestSnapshot():
+        restored games have the same state and play the same
+    """
+    @staticmethod
+    def start(game, deck_mgr=None, num_players=4, turns=5):
+        """
+        start(game, deck_mgr=None, num_players=4, turns=5):
+            sets up game and plays some turns
+        """
+        game.setup_game(
+            deck_mgr=deck_mgr,
+            player_names=Helper.generate_player_names(num_players)
+        )
+        game.start_game()
+        for _ in range(turns):
+            game.next_turn()
+        return game
+
+    @staticmethod
+    def state(game):
+        """
+        state(game):  returns comparable game state
+        """
+        return (
+            game.deck(),
+            game.get_turn_order(),
+            game.turn_num,
+            game.round_num,
+            [(p.name, p.hand, p.score) for p in game.get_current_players()],
+        )
+
+    @staticmethod
+    def finish(game):
+        """
+        finish(game):  plays game to the end, returns cards drawn
+        """
+        cards = []
+        player = game.next_turn()
+        while player is not None:
+            cards.append((player.name, player.last_card))
+            player = game.next_turn()
+        return cards
+
+    def check_round_trip(self, game):
+        """
+        check_round_trip(game):
+            restored game matches game and plays the same
+        """
+        restored = load_game(dump_game(game))
+        self.assertEqual(self.finish(game), self.finish(restored))
+        self.assertEqual(self.state(game), self.state(restored))
+
+        # both reset to the same full deck
+        game.reset()
+        restored.reset()
+        self.assertEqual(game.deck(), restored.deck())
+        return restored
+
+    def test_round_trip(self):
+        """
+        test_round_trip():  game saved mid-round plays the same
+        """
+        game = self.start(Draw3Game(rng=3))
+        restored = load_game(dump_game(game))
+        self.assertEqual(self.state(game), self.state(restored))
+        # deck shares the game rng like the original
+        self.assertIs(restored.rng, restored._deck_mgr.rng)
+        self.check_round_trip(game)
+
+    def test_lazy_shuffle(self):
+        """
+        test_lazy_shuffle():  pending lazy shuffle and rng are restored
+        """
+        game = Draw3Game(rng=4)
+        game.lazy_shuffle = True
+        game.random_turn_order = False
+        self.start(game, turns=2)
+        restored = self.check_round_trip(game)
+        self.assertTrue(restored.lazy_shuffle)
+        self.assertFalse(restored.random_turn_order)
+
+    def test_deck_managers(self):
+        """
+        test_deck_managers():  every deck manager type round trips
+        """
+        suits, values = Helper.custom_suits_values_2()
+        for deck_mgr in (
+            ExtendedDeckManager.from_suits_and_values(suits, values, 1),
+            CompactDeckManager(rng=2),
+            ShoeDeckManager(6, rng=3),
+        ):
+            game = self.start(Draw3Game(rng=5), deck_mgr, num_players=3)
+            restored = self.check_round_trip(game)
+            self.assertIs(
+                type(deck_mgr),
+                type(restored._deck_mgr)
+            )
+
+        shoe = restored._deck_mgr
+        self.assertEqual(deck_mgr.composition(), shoe.composition())
+
+    def test_compact_blob(self):
+        """
+        test_compact_blob():
+            cards are one byte, blob is smaller than a pickle
+        """
+        game = self.start(Draw3Game(rng=6), turns=0)
+        blob = dump_game(game)
+        game.next_turn()
+        # one card moved from the deck to a hand, same card table
+        self.assertEqual(len(blob), len(dump_game(game)))
+        self.assertLess(len(blob), len(pickle.dumps(game)))
+
+    def test_many_cards(self):
+        """
+        test_many_cards():  more than 256 cards use two byte ids
+        """
+        suits = [f"Suit{idx}" for idx in range(30)]
+        deck_mgr = ExtendedDeckManager.from_suits_and_values(
+            suits, Helper.normal_deck_values(), 7
+        )
+        self.check_round_trip(self.start(Draw3Game(rng=7), deck_mgr))
+
+    def test_large_game(self):
+        """
+        test_large_game():
+            removed and skipped seats and the shoe of a
+            LargeDraw3Game() round trip
+        """
+        game = self.start(LargeDraw3Game(rng=10), num_players=6, turns=4)
+        game.remove_player('Player2')
+        game.skip_player('Player5')
+        game.add_player('player2')
+        blob = dump_game(game)
+        self.assertRaises(SnapshotError, load_game, blob, Draw3Game)
+        self.assertRaises(
+            SnapshotError,
+            load_game,
+            dump_game(self.start(Draw3Game(rng=10))),
+            LargeDraw3Game
+        )
+
+        restored = self.check_round_trip(game)
+        self.assertIsInstance(restored, LargeDraw3Game)
+        self.assertEqual(
+            game.get_turn_order(), restored.get_turn_order()
+        )
+        self.assertEqual(
+            ['player2'],
+            [p.name for p in restored.get_current_players()][-1:]
+        )
+        self.assertEqual(7, len(restored._players))
+
+    def test_large_table(self):
+        """
+        test_large_table():
+            seat numbers above two bytes round trip
+        """
+        names = [f"P{idx}" for idx in range(70000)]
+        game = LargeDraw3Game(rng=11)
+        # a short deck, only a few turns are played
+        game.setup_game(deck_mgr=DeckManager(11), player_names=names)
+        game.start_game()
+        for _ in range(3):
+            game.next_turn()
+        game.remove_player('P69999')
+        game.skip_player('P69998')
+
+        restored = load_game(dump_game(game))
+        self.assertEqual(
+            game._scheduler.getstate(), restored._scheduler.getstate()
+        )
+        self.assertEqual(game.max_players, restored.max_players)
+        for _ in range(3):
+            self.assertEqual(
+                game.next_turn().last_card,
+                restored.next_turn().last_card
+            )
+
+    def test_errors(self):
+        """
+        test_errors():  invalid games and blobs raise SnapshotError
+        """
+        self.assertRaises(SnapshotError, dump_game, Draw3Game())
+        blob = dump_game(self.start(Draw3Game(rng=8)))
+        self.assertRaises(SnapshotError, load_game, b'nope' + blob)
+        self.assertRaises(SnapshotError, load_game, blob[:-3])
+        self.assertRaises(
+            SnapshotError, load_game, blob[:3] + b'\x09' + blob[4:]
+        )
+
+    @skipIf(draw3_batch.numpy is None, "numpy is not installed")
+    def test_numpy_rng(self):
+        """
+        test_numpy_rng():  numpy rng states round trip
+        """
+        game = self.start(
+            Draw3Game(
+                rng=draw3_batch.numpy.random.default_rng(9)
+            )
+        )
+        self.check_round_trip(game)
+
+        game = self.start(Draw3Game(rng=BatchedPermutationRNG(9, 4)))
+        restored = self.check_round_trip(game)
+        self.assertEqual(
+            game.rng.permutation(52), restored.rng.permutation(52)
+        )
+
+        # unused permutations are packed, not one number per index
+        game = self.start(Draw3Game(rng=BatchedPermutationRNG(9)))
+        game.rng.permutation(300)
+        unused = sum(
+            (len(perms) - pos) * length
+            for length, (perms, pos) in game.rng._batches.items()
+        )
+        blob = dump_game(game)
+        self.assertLess(len(blob), 2 * unused)
+        restored = load_game(blob)
+        for length in (3, 52, 300):
+            self.assertEqual(
+                game.rng.permutation(length),
+                restored.rng.permutation(length)
+            )
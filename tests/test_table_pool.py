@@ -0,0 +1,79 @@
+# pylint:  disable=protected-access
+"""
+test_table_pool.py:
+    tests TablePool() reuse of games
+"""
+from unittest import TestCase
+
+from cardgame.classes.cardgame_draw3 import Draw3Game
+from cardgame.classes.table_pool import TablePool
+
+from .helper import Helper
+
+
+class TestTablePool(TestCase):
+    """
+    TestTablePool():
+        tests acquire() and release() of pooled games
+    """
+    @staticmethod
+    def play(game):
+        """
+        play(game):  plays game, returns final scores by name
+        """
+        game.start_game()
+        while game.next_turn() is not None:
+            pass
+        return {p.name: p.score for p in game.get_current_players()}
+
+    def test_reuse(self):
+        """
+        test_reuse():
+            released games are reused and play like new games
+        """
+        names = Helper.generate_player_names(3)
+        pool = TablePool()
+        game = pool.acquire(names, seed=1)
+        self.assertEqual(names, [p.name for p in game.get_current_players()])
+        self.play(game)
+        pool.release(game)
+        self.assertEqual(1, len(pool))
+
+        again = pool.acquire(names, seed=2)
+        self.assertIs(game, again)
+        self.assertEqual(0, len(pool))
+        self.assertEqual((1, 1), (pool.hits, pool.misses))
+
+        expected = Draw3Game(2)
+        expected.setup_game(player_names=names)
+        self.assertEqual(self.play(expected), self.play(again))
+
+        # different players get a different game
+        other = pool.acquire(Helper.generate_player_names(2))
+        self.assertIsNot(game, other)
+        self.assertEqual(2, pool.misses)
+
+    def test_max_idle(self):
+        """
+        test_max_idle():  only max_idle games are kept
+        """
+        names = Helper.generate_player_names(2)
+        pool = TablePool(max_idle=2)
+        games = [pool.acquire(names) for _ in range(3)]
+        for game in games:
+            pool.release(game)
+        self.assertEqual(2, len(pool))
+
+    def test_empty_rosters_dropped(self):
+        """
+        test_empty_rosters_dropped():
+            rosters whose idle games are all reused leave the pool
+        """
+        pool = TablePool()
+        for idx in range(20):
+            names = [f"A{idx}", f"B{idx}"]
+            pool.release(pool.acquire(names))
+            self.assertEqual(1, len(pool._idle))
+            pool.acquire(names)
+            self.assertEqual({}, pool._idle)
+        self.assertEqual(0, len(pool))
@@ -0,0 +1,318 @@
+"""
+test_table_server.py:
+    tests TableServer() tables over TCP with TableClient()
+"""
+import asyncio
+import json
+import os
+import socket
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase, skipUnless
+
+from cardgame.classes.table_server import (
+    Connection,
+    TableClient,
+    TableServer
+)
+
+
+class StuckWriter:
+    """
+    StuckWriter():  stream writer whose drain() never returns
+    """
+    def __init__(self):
+        self.lines = []
+
+    def write(self, line):
+        """
+        write(line):  keeps line
+        """
+        self.lines.append(line)
+
+    async def drain(self):
+        """
+        drain():  waits forever
+        """
+        await asyncio.Event().wait()
+
+    def close(self):
+        """
+        close():  does nothing
+        """
+
+
+class TestTableServer(IsolatedAsyncioTestCase):
+    """
+    TestTableServer():
+        plays games through an in-process server and client
+    """
+    async def asyncSetUp(self):
+        self.server = TableServer(max_tables=50, seed=1)
+        await self.server.start_tcp()
+        self.host, self.port = self.server.address[:2]
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def connect(self):
+        """
+        connect():  returns client connected to the test server
+        """
+        return await TableClient.connect_tcp(self.host, self.port)
+
+    async def play(self, client, table_id):
+        """
+        play(client, table_id):  plays turns until game over,
+            returns turn responses
+        """
+        turns = []
+        while True:
+            response = await client.request('turn', table=table_id)
+            if not response['ok']:
+                self.assertEqual('GameOver', response['error'])
+                return turns
+            turns.append(response)
+
+    async def test_play_game(self):
+        """
+        test_play_game():  create, join, start and play a table
+        """
+        host = await self.connect()
+        guest = await self.connect()
+
+        table_id = (await host.request('create'))['table']
+        self.assertTrue(
+            (await host.request('join', table=table_id, name='Buck'))['ok']
+        )
+        self.assertEqual(
+            {'ok': False, 'error': 'GameNotStarted'},
+            await host.request('turn', table=table_id)
+        )
+        self.assertEqual(
+            'NeedMorePlayers',
+            (await host.request('start', table=table_id))['error']
+        )
+        response = await guest.request('join', table=table_id, name='Cherry')
+        self.assertEqual(['Buck', 'Cherry'], response['players'])
+        self.assertEqual(
+            'DuplicatePlayerName',
+            (await guest.request('join', table=table_id, name='buck'))[
+                'error'
+            ]
+        )
+
+        self.assertTrue((await host.request('start', table=table_id))['ok'])
+        self.assertEqual(
+            'GameInProgress',
+            (await guest.request('join', table=table_id, name='Late'))[
+                'error'
+            ]
+        )
+        turns = await self.play(host, table_id)
+        self.assertEqual(6, len(turns))
+
+        state = await guest.request('state', table=table_id)
+        self.assertEqual('over', state['state'])
+        self.assertEqual(
+            {turn['player']: turn['score'] for turn in turns},
+            state['players']
+        )
+
+        # the guest saw every draw and the end of the game
+        events = [await guest.next_event() for _ in range(7)]
+        self.assertEqual(
+            [turn['card'] for turn in turns],
+            [event['card'] for event in events[:6]]
+        )
+        self.assertEqual('game_over', events[6]['event'])
+        self.assertEqual(state['players'], events[6]['scores'])
+
+        await host.close()
+        await guest.close()
+
+    async def test_errors(self):
+        """
+        test_errors():  bad requests get error responses
+        """
+        client = await self.connect()
+        self.assertEqual(
+            'TableNotFound',
+            (await client.request('turn', table=99))['error']
+        )
+        self.assertEqual(
+            'InvalidRequest', (await client.request('fly'))['error']
+        )
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.write(b'not json\n')
+        self.assertEqual(
+            {'ok': False, 'error': 'InvalidRequest'},
+            json.loads(await reader.readline())
+        )
+        writer.close()
+        table_id = (await client.request('create'))['table']
+        self.assertEqual(
+            'InvalidPlayerName',
+            (await client.request('join', table=table_id, name=5))['error']
+        )
+        await client.close()
+
+    async def test_many_tables(self):
+        """
+        test_many_tables():  tables play independently on one loop
+        """
+        clients = [await self.connect() for _ in range(10)]
+        table_ids = []
+        for idx, client in enumerate(clients):
+            table_id = (await client.request('create'))['table']
+            table_ids.append(table_id)
+            for name in ('A', 'B', 'C'):
+                await client.request('join', table=table_id, name=name)
+            await client.request('start', table=table_id)
+            self.assertEqual(idx + 1, self.server.tables)
+
+        results = await asyncio.gather(
+            *[
+                self.play(client, table_id)
+                for client, table_id in zip(clients, table_ids)
+            ]
+        )
+        self.assertEqual([9] * 10, [len(turns) for turns in results])
+
+        server = TableServer(max_tables=1)
+        self.assertTrue(server.handle(None, {'op': 'create'})['ok'])
+        self.assertEqual(
+            'TableLimitHit', server.handle(None, {'op': 'create'})['error']
+        )
+        for client in clients:
+            await client.close()
+
+    async def test_closed_tables(self):
+        """
+        test_closed_tables():
+            more games than max_tables are played when finished
+            tables are left
+        """
+        server = TableServer(max_tables=2, seed=2)
+        await server.start_tcp()
+        client = await TableClient.connect_tcp(*server.address[:2])
+        for _ in range(5):
+            table_id = (await client.request('create'))['table']
+            for name in ('A', 'B'):
+                await client.request('join', table=table_id, name=name)
+            await client.request('start', table=table_id)
+            self.assertEqual(6, len(await self.play(client, table_id)))
+            self.assertTrue((await client.request('leave', table=table_id))[
+                'ok'
+            ])
+            self.assertLessEqual(server.tables, 2)
+
+        # a watched table that is over stays open
+        table_id = (await client.request('create'))['table']
+        for name in ('A', 'B'):
+            await client.request('join', table=table_id, name=name)
+        await client.request('start', table=table_id)
+        await self.play(client, table_id)
+        self.assertTrue((await client.request('create'))['ok'])
+        self.assertEqual(
+            'TableLimitHit', (await client.request('create'))['error']
+        )
+        self.assertEqual(
+            'over', (await client.request('state', table=table_id))['state']
+        )
+        await client.close()
+        await server.close()
+
+    async def test_unwatched_tables(self):
+        """
+        test_unwatched_tables():
+            waiting and playing tables are closed once their last
+            watcher leaves or disconnects
+        """
+        server = TableServer(max_tables=2, seed=3)
+        await server.start_tcp()
+        client = await TableClient.connect_tcp(*server.address[:2])
+        playing = (await client.request('create'))['table']
+        for name in ('A', 'B'):
+            await client.request('join', table=playing, name=name)
+        await client.request('start', table=playing)
+        await client.request('turn', table=playing)
+        waiting = (await client.request('create'))['table']
+        self.assertEqual(
+            'TableLimitHit', (await client.request('create'))['error']
+        )
+
+        await client.request('leave', table=playing)
+        self.assertTrue((await client.request('create'))['ok'])
+        self.assertEqual(
+            'TableNotFound',
+            (await client.request('state', table=playing))['error']
+        )
+        self.assertEqual(
+            'waiting', (await client.request('state', table=waiting))['state']
+        )
+
+        # disconnecting closes every table nobody else watches
+        other = await TableClient.connect_tcp(*server.address[:2])
+        await other.request('join', table=waiting, name='C')
+        await client.close()
+        for _ in range(100):
+            if server.tables == 1:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(1, server.tables)
+        self.assertEqual(
+            'waiting', (await other.request('state', table=waiting))['state']
+        )
+        await other.close()
+        for _ in range(100):
+            if server.tables == 0:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(0, server.tables)
+        await server.close()
+
+    async def test_send_after_abort(self):
+        """
+        test_send_after_abort():
+            a response waiting for room is dropped when the
+            connection is aborted
+        """
+        conn = Connection(StuckWriter(), 1)
+        conn.send_event({'event': 0})
+        await asyncio.sleep(0)
+        # the drain task is stuck writing event 0, event 1 fills
+        # the queue
+        conn.send_event({'event': 1})
+        sender = asyncio.ensure_future(conn.send({'ok': True}))
+        await asyncio.sleep(0)
+        self.assertFalse(sender.done())
+        conn.abort()
+        await asyncio.wait_for(sender, 1)
+        await conn.close()
+        self.assertTrue(conn.closed)
+
+    async def test_backpressure(self):
+        """
+        test_backpressure():
+            events that overflow the write queue close the connection
+        """
+        _, writer = await asyncio.open_connection(self.host, self.port)
+        conn = Connection(writer, 2)
+        for idx in range(3):
+            conn.send_event({'event': idx})
+        self.assertTrue(conn.closed)
+        await conn.close()
+
+    @skipUnless(hasattr(socket, 'AF_UNIX'), "needs Unix sockets")
+    async def test_unix_socket(self):
+        """
+        test_unix_socket():  serves over a Unix socket
+        """
+        with TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'tables.sock')
+            server = TableServer()
+            await server.start_unix(path)
+            client = await TableClient.connect_unix(path)
+            self.assertTrue((await client.request('create'))['ok'])
+            await client.close()
+            await server.close()
@@ -0,0 +1,139 @@
+"""
+test_turn_scheduler.py:
+    tests TurnScheduler() linked-array turn order
+"""
+from unittest import TestCase
+
+from cardgame.classes.turn_scheduler import TurnScheduler
+
+
+class TestTurnScheduler(TestCase):
+    """
+    TestTurnScheduler():
+        tests advancing, skipping and removing seats
+    """
+    def test_advance(self):
+        """
+        test_advance():
+            turns go around in order, a round ends after last seat
+        """
+        sched = TurnScheduler([2, 0, 1])
+        self.assertEqual([2, 0, 1], list(sched))
+        self.assertEqual(3, len(sched))
+        self.assertEqual(2, sched.current)
+        self.assertEqual(0, sched.advance())
+        self.assertEqual(0, sched.current)
+        self.assertEqual(0, sched.advance())
+        self.assertEqual(1, sched.advance())
+        self.assertEqual(2, sched.current)
+
+    def test_skip(self):
+        """
+        test_skip():
+            skipped seat loses one turn, skipping current seat
+            passes the turn
+        """
+        sched = TurnScheduler(range(3))
+        sched.skip(1)
+        self.assertEqual(0, sched.advance())
+        self.assertEqual(2, sched.current)
+        self.assertEqual(1, sched.advance())
+        self.assertEqual(0, sched.advance())
+        # flag was used up, seat 1 plays this round
+        self.assertEqual(1, sched.current)
+
+        self.assertEqual(0, sched.skip(1))
+        self.assertEqual(2, sched.current)
+        self.assertEqual(1, sched.skip(2))
+        self.assertEqual(0, sched.current)
+
+        # every seat skipped, each loses one turn
+        sched.skip(1)
+        sched.skip(2)
+        self.assertEqual(1, sched.skip(0))
+        self.assertEqual(0, sched.current)
+        self.assertEqual(0, sched.advance())
+        self.assertEqual(1, sched.current)
+
+    def test_remove(self):
+        """
+        test_remove():
+            removed seat leaves turn order, removing current seat
+            passes the turn
+        """
+        sched = TurnScheduler(range(5))
+        self.assertEqual(0, sched.remove(3))
+        self.assertEqual([0, 1, 2, 4], list(sched))
+        self.assertNotIn(3, sched)
+        self.assertIn(4, sched)
+
+        # first seat's turn, next seat takes it in the same round
+        self.assertEqual(0, sched.remove(0))
+        self.assertEqual(1, sched.current)
+
+        sched.advance()
+        sched.advance()
+        self.assertEqual(4, sched.current)
+        # last seat's turn, round ends
+        self.assertEqual(1, sched.remove(4))
+        self.assertEqual(1, sched.current)
+        self.assertEqual([1, 2], list(sched))
+
+        sched.remove(1)
+        sched.remove(2)
+        self.assertEqual(0, len(sched))
+        self.assertIsNone(sched.current)
+        self.assertEqual(0, sched.advance())
+
+        sched.append(7)
+        self.assertEqual(7, sched.current)
+        self.assertEqual([7], list(sched))
+
+    def test_errors(self):
+        """
+        test_errors():
+            seats can only be in turn order once
+        """
+        sched = TurnScheduler(range(3))
+        self.assertRaises(ValueError, sched.append, 1)
+        self.assertRaises(ValueError, sched.remove, 5)
+        self.assertRaises(ValueError, sched.skip, 5)
+        sched.remove(1)
+        self.assertRaises(ValueError, sched.remove, 1)
+        self.assertNotIn(-1, sched)
+
+    def test_state(self):
+        """
+        test_state():
+            setstate() restores order, current and skipped seats
+        """
+        sched = TurnScheduler(range(6))
+        sched.remove(2)
+        sched.advance()
+        sched.skip(4)
+        state = sched.getstate()
+        self.assertEqual(([0, 1, 3, 4, 5], 1, [4]), state)
+
+        restored = TurnScheduler()
+        restored.setstate(state)
+        self.assertEqual(state, restored.getstate())
+        for _ in range(8):
+            self.assertEqual(sched.advance(), restored.advance())
+            self.assertEqual(sched.current, restored.current)
+
+        self.assertRaises(ValueError, restored.setstate, ([0, 1], 2, []))
+        self.assertRaises(ValueError, restored.setstate, ([0, 1], 0, [3]))
+        restored.setstate(([], None, []))
+        self.assertIsNone(restored.current)
+
+    def test_large(self):
+        """
+        test_large():
+            removing most of a large table keeps order
+        """
+        sched = TurnScheduler(range(100000))
+        for seat in range(0, 100000, 2):
+            sched.remove(seat)
+        self.assertEqual(50000, len(sched))
+        self.assertEqual(list(range(1, 100000, 2)), list(sched))
+        self.assertEqual(1, sched.current)